@@ -0,0 +1,756 @@
+"""
+Damage Control Policy Checks
+
+Evaluation logic shared by the damage-control hooks and the policy daemon:
+- Bash: zero-access paths, no-delete paths, dangerous command patterns
+- Edit / MultiEdit / NotebookEdit / Write: zero-access and read-only paths
+
+evaluate() is the single entry point: it takes the raw hook input (JSON
+bytes from stdin), dispatches on its tool_name and returns a Decision
+instead of printing and exiting, so the same code runs in a hook process or
+inside policy_daemon.py. Edits that touch many files are checked as one
+batch (one trie walk per protected path list).
+
+patterns.yaml is compiled into patterns.compiled.json (plain JSON, with
+home-relative paths already resolved) and recompiled automatically when the
+source changes, so evaluating a call never imports PyYAML. load_policy()
+returns it as a Policy, which also holds the matchers built from it.
+
+Exit Codes (Decision.exit_code), the same for every tool:
+  0 = ALLOW (continue with tool execution; stdout may hold an ASK prompt)
+  2 = BLOCK (prevent tool execution; also on invalid input, a missing
+      patterns.yaml or any other error)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from protected_paths import ProtectedPaths, clear_realpath_memo, realpath
+from shell_lexer import SimpleCommand, is_assignment, lex
+
+PATTERNS_FILE = Path(__file__).parent / "patterns.yaml"
+ARTIFACT_FILE = Path(__file__).parent / "patterns.compiled.json"
+
+# Bump when the artifact layout changes; older artifacts are recompiled
+ARTIFACT_FORMAT = 1
+
+# Keys of patterns.yaml that hold path lists
+PATH_KEYS = ("zeroAccessPaths", "readOnlyPaths", "noDeletePaths")
+
+# A source modified this close to compile time is re-hashed even on a key
+# match: mtime granularity can hide a same-size rewrite within that window.
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+class Decision(NamedTuple):
+    """
+    Outcome of one hook evaluation: what the hook process should emit.
+
+    cacheable marks an allow that decision_cache.py may replay for the same
+    input, policy and cwd without evaluating it again.
+    """
+
+    exit_code: int
+    stdout: str = ""
+    stderr: str = ""
+    cacheable: bool = False
+
+
+class PolicyError(Exception):
+    """patterns.yaml is missing or cannot be loaded."""
+
+
+class MissingDependencyError(PolicyError):
+    """patterns.yaml needs (re)compiling but PyYAML is not installed."""
+
+
+def load_patterns(patterns_file: Path = PATTERNS_FILE) -> dict[str, Any]:
+    """Load patterns.yaml (same directory as the hooks by default)."""
+    try:
+        import yaml
+    except ImportError:
+        raise MissingDependencyError("PyYAML not installed. Run: python3 -m pip install pyyaml (or install uv)")
+
+    if not patterns_file.exists():
+        raise PolicyError(f"patterns.yaml not found at {patterns_file}")
+
+    with open(patterns_file) as f:
+        return yaml.safe_load(f)
+
+
+def _preresolve(path: str, expand_vars: bool) -> str | None:
+    """
+    Resolve a protected path now if the result cannot depend on the caller.
+
+    Relative paths depend on the working directory of each call, and paths
+    with $VARS (bash form) on its environment, so those stay None and are
+    resolved at check time.
+    """
+    expanded = os.path.expanduser(path)
+    if expand_vars:
+        if "$" in expanded:
+            return None
+        expanded = os.path.expandvars(expanded)
+    if not os.path.isabs(expanded):
+        return None
+    return os.path.realpath(expanded)
+
+
+def compile_policy(patterns: dict[str, Any], source: dict[str, Any]) -> dict[str, Any]:
+    """
+    Turn parsed patterns.yaml into the JSON-serializable policy artifact.
+
+    Args:
+        patterns: Parsed patterns.yaml
+        source: {"mtime_ns", "size", "sha256"} of the file it came from
+
+    Returns:
+        Policy dict: bashToolPatterns as {"pattern", "reason", "ask"}, and each
+        path list as {"path", "bash", "file"} entries where "bash" is the
+        expand_path() form and "file" the resolve_path() form (None when it
+        must be resolved per call)
+    """
+    patterns = patterns or {}
+    policy: dict[str, Any] = {
+        "format": ARTIFACT_FORMAT,
+        "source": source,
+        "home": os.path.expanduser("~"),
+        "compiled_at_ns": time.time_ns(),
+        "bashToolPatterns": [
+            {
+                "pattern": rule["pattern"],
+                "reason": rule.get("reason"),
+                "ask": bool(rule.get("ask", False)),
+            }
+            for rule in patterns.get("bashToolPatterns") or []
+        ],
+    }
+    for key in PATH_KEYS:
+        policy[key] = [
+            {
+                "path": path,
+                "bash": _preresolve(path, expand_vars=True),
+                "file": _preresolve(path, expand_vars=False),
+            }
+            for path in patterns.get(key) or []
+        ]
+    return policy
+
+
+class Policy:
+    """
+    A compiled policy (see compile_policy) and the matchers built from it.
+
+    The bash pattern matcher and the protected path tries are built on first
+    use and kept for the life of the object, so a long-lived holder (the
+    policy daemon) builds them once per patterns.yaml version.
+    """
+
+    def __init__(self, compiled: dict[str, Any]):
+        self.compiled = compiled
+        self._bash_matcher: BashPatternMatcher | None = None
+        self._protected: dict[tuple[str, str], ProtectedPaths] = {}
+
+    @property
+    def source_sha256(self) -> str:
+        """sha256 of the patterns.yaml this policy was compiled from."""
+        return self.compiled["source"]["sha256"]
+
+    @property
+    def bash_patterns(self) -> list[dict[str, Any]]:
+        return self.compiled["bashToolPatterns"]
+
+    @property
+    def bash_matcher(self) -> BashPatternMatcher:
+        if self._bash_matcher is None:
+            self._bash_matcher = BashPatternMatcher([rule["pattern"] for rule in self.bash_patterns])
+        return self._bash_matcher
+
+    def protected_paths(self, key: str, form: str) -> ProtectedPaths:
+        """
+        Trie-backed matcher for one path list.
+
+        Args:
+            key: "zeroAccessPaths", "readOnlyPaths" or "noDeletePaths"
+            form: "bash" (expand_path semantics) or "file" (resolve_path semantics)
+        """
+        matcher = self._protected.get((key, form))
+        if matcher is None:
+            matcher = ProtectedPaths(self.compiled[key], form, expand_path if form == "bash" else resolve_path)
+            self._protected[(key, form)] = matcher
+        return matcher
+
+
+def load_policy(patterns_file: Path = PATTERNS_FILE, artifact_file: Path = ARTIFACT_FILE) -> Policy:
+    """
+    Load the compiled policy, recompiling it if patterns.yaml changed.
+
+    The artifact is reused while patterns.yaml's (mtime_ns, size) match the
+    recorded key. On a key mismatch the source is hashed: unchanged content
+    only refreshes the key, changed content is re-parsed and recompiled.
+    Failing to write the artifact (read-only directory) is not an error.
+
+    Raises:
+        PolicyError: patterns.yaml is missing
+        MissingDependencyError: A recompile is needed and PyYAML is missing
+    """
+    try:
+        st = os.stat(patterns_file)
+    except FileNotFoundError:
+        raise PolicyError(f"patterns.yaml not found at {patterns_file}")
+
+    try:
+        with open(artifact_file, "rb") as f:
+            artifact = json.load(f)
+        if artifact.get("format") != ARTIFACT_FORMAT or artifact.get("home") != os.path.expanduser("~"):
+            artifact = None
+    except (OSError, ValueError):
+        artifact = None
+
+    if artifact is not None:
+        source = artifact["source"]
+        key_matches = (source["mtime_ns"], source["size"]) == (st.st_mtime_ns, st.st_size)
+        if key_matches and artifact["compiled_at_ns"] - st.st_mtime_ns > _RACY_WINDOW_NS:
+            return Policy(artifact)
+
+    import hashlib
+
+    data = Path(patterns_file).read_bytes()
+    source = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": hashlib.sha256(data).hexdigest()}
+
+    if artifact is not None and artifact["source"]["sha256"] == source["sha256"]:
+        # Touched but unchanged: keep the compiled policy, refresh its key
+        artifact["source"] = source
+        artifact["compiled_at_ns"] = time.time_ns()
+    else:
+        artifact = compile_policy(load_patterns(Path(patterns_file)), source)
+
+    _write_artifact(artifact, Path(artifact_file))
+    return Policy(artifact)
+
+
+def _write_artifact(artifact: dict[str, Any], artifact_file: Path) -> None:
+    """Atomically replace the artifact; ignore an unwritable directory."""
+    tmp = artifact_file.with_name(f".{artifact_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump(artifact, f, indent=1)
+        os.replace(tmp, artifact_file)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+# ========== BASH TOOL ==========
+
+def expand_path(path: str, cwd: str | None = None) -> str:
+    """Expand ~ and environment variables in paths (relative to cwd, default: ours)."""
+    expanded = os.path.expanduser(path)
+    expanded = os.path.expandvars(expanded)
+    return realpath(expanded, cwd)
+
+
+# Tokens of here-doc bodies and here-strings (python3 - <<EOF with
+# open('~/.ssh/id_rsa')): runs between blanks, quotes, brackets and code
+# punctuation. Those with a slash or a leading ~ or . are checked as paths.
+_DATA_WORD = re.compile(r"""[^\s'"`(),;=<>|&{}\[\]]+""")
+
+# Subcommands whose -m/--message value is a message, never a path. Only
+# these: for other programs -m is often a flag, and the next word a file
+# (tar -cf x.tar -m ~/.ssh).
+_MESSAGE_COMMANDS = {
+    "git": frozenset({"commit", "tag", "merge"}),
+    "hg": frozenset({"commit", "tag"}),
+    "svn": frozenset({"commit", "ci"}),
+}
+_MESSAGE_OPTIONS = frozenset({"-m", "--message"})
+
+# Options placed before a git subcommand that consume the following word
+_GIT_VALUE_OPTIONS = frozenset({"-C", "-c", "--git-dir", "--work-tree", "--namespace"})
+
+# Programs that delete their file operands
+_DELETE_PROGRAMS = frozenset({"rm", "rmdir", "unlink", "shred"})
+
+
+def subcommand_index(program: str, args: tuple[str, ...]) -> int | None:
+    """Index into args of the subcommand (first operand, skipping git's global options)."""
+    skip_value = False
+    for i, word in enumerate(args):
+        if skip_value:
+            skip_value = False
+        elif program == "git" and word in _GIT_VALUE_OPTIONS:
+            skip_value = True
+        elif not word.startswith("-"):
+            return i
+    return None
+
+
+def _is_message_option(word: str) -> bool:
+    """-m, --message, or a short option bundle ending in m (git commit -am)."""
+    return word in _MESSAGE_OPTIONS or (
+        len(word) > 2 and word[0] == "-" and word[1] != "-" and word[1:].isalpha() and word.endswith("m")
+    )
+
+
+def path_arguments(cmd: SimpleCommand) -> list[str]:
+    """
+    Words of one simple command that may name files.
+
+    Redirection targets, path-like words of the here-docs and here-strings
+    it reads, assignment values, a program given by path, and every operand
+    except option flags and message values of commit-like subcommands (git
+    commit -m, see _MESSAGE_COMMANDS). Values of --opt=value options are
+    included. Operands of echo/printf count too: `echo ~/.ssh/id_rsa > x`
+    expands the path like any other command would.
+    """
+    paths = list(cmd.redirects)
+    for data in cmd.stdin:
+        paths.extend(
+            word for word in _DATA_WORD.findall(data) if word[:1] in ("~", ".") or "/" in word
+        )
+    program_index = cmd.program_index if cmd.program_index is not None else len(cmd.words)
+
+    for word in cmd.words[:program_index]:
+        if is_assignment(word):
+            paths.append(word.partition("=")[2])
+    if program_index == len(cmd.words):
+        return paths
+
+    program_word = cmd.words[program_index]
+    if "/" in program_word:
+        paths.append(program_word)
+
+    args = cmd.args
+    takes_message = False
+    subcommands = _MESSAGE_COMMANDS.get(cmd.program)
+    if subcommands:
+        index = subcommand_index(cmd.program, args)
+        takes_message = index is not None and args[index] in subcommands
+
+    skip_value = False
+    for word in args:
+        if skip_value:
+            skip_value = False
+        elif takes_message and _is_message_option(word):
+            skip_value = True
+        elif word.startswith("-"):
+            option, eq, value = word.partition("=")
+            if eq and value and not (takes_message and option in _MESSAGE_OPTIONS):
+                paths.append(value)
+        else:
+            paths.append(word)
+
+    return paths
+
+
+def deletion_targets(cmd: SimpleCommand) -> list[str]:
+    """
+    Operands one simple command deletes (empty if it deletes nothing).
+
+    rm/rmdir/unlink/shred, git rm, mv ... /dev/null, and the search roots of
+    find ... -delete / -exec rm. Under xargs the targets arrive on stdin, so
+    the operands of the earlier pipeline stages count too (echo src | xargs rm).
+    """
+    program = cmd.program
+    args = cmd.args
+
+    if program == "git":
+        subcommand = subcommand_index(program, args)
+        if subcommand is None or args[subcommand] != "rm":
+            return []
+        args = args[subcommand + 1:]
+    elif program == "mv":
+        if "/dev/null" not in args:
+            return []
+        args = tuple(word for word in args if word != "/dev/null")
+    elif program == "find":
+        exec_rm = any(
+            word in ("-exec", "-execdir") and args[i + 1:i + 2] == ("rm",)
+            for i, word in enumerate(args)
+        )
+        if "-delete" not in args and not exec_rm:
+            return []
+        roots = []
+        for word in args:
+            if word.startswith("-") or word in ("(", "!"):
+                break
+            roots.append(word)
+        return roots
+    elif program not in _DELETE_PROGRAMS:
+        return []
+
+    if "xargs" in cmd.wrappers:
+        args = args + cmd.upstream
+    return [word for word in args if not word.startswith("-")]
+
+
+def matches_protected_path(
+    path: str, protected: ProtectedPaths, cwd: str | None = None
+) -> tuple[bool, str | None]:
+    """
+    Check if path is (inside) any protected path, component-wise.
+    Returns: (is_protected, matched_pattern)
+    """
+    matched = protected.match(expand_path(path, cwd), cwd)
+    return matched is not None, matched
+
+
+# Pattern features that change meaning (or fail) once merged into one regex:
+# backreferences, named groups, and global inline flags such as (?i)
+_UNMERGEABLE_RE = re.compile(r'\\[1-9]|\(\?P[<=]|\(\?[aiLmsux]+\)')
+
+
+class BashPatternMatcher:
+    """
+    Finds the first rule (in policy order) whose pattern matches a command.
+
+    Consecutive mergeable rules are combined into one compiled regex that
+    is tried once per command: an unanchored alternation rejects commands
+    that match nothing in a single scan, and an alternation of lookaheads
+    anchored at the start, one named group per rule, reports which rule
+    matched. Alternatives are tried in order at that one position, so the
+    lowest-index rule wins exactly as with one re.search per rule.
+
+    Rules that cannot be merged (see _UNMERGEABLE_RE, or that break the
+    combined compile) are searched on their own, in order, between merged
+    runs; an invalid pattern raises re.error when its turn comes, as before.
+    """
+
+    def __init__(self, patterns: list[str]):
+        # Each stage: (first_index, prefilter, indexer) for a merged run,
+        # or (index, None, pattern source) for a rule searched on its own
+        self.stages: list[tuple[int, re.Pattern | None, Any]] = []
+
+        run: list[int] = []
+        for index, pattern in enumerate(patterns):
+            if _UNMERGEABLE_RE.search(pattern) is None:
+                run.append(index)
+                continue
+            self._add_run(run, patterns)
+            run = []
+            self.stages.append((index, None, pattern))
+        self._add_run(run, patterns)
+
+    def _add_run(self, run: list[int], patterns: list[str]) -> None:
+        """Merge a run of rules into one stage; split it around rules that break the merge."""
+        if not run:
+            return
+        try:
+            prefilter = re.compile("|".join(f"(?:{patterns[i]})" for i in run), re.IGNORECASE)
+            indexer = re.compile(
+                r"\A(?:" + "|".join(f"(?=[\s\S]*?(?P<r{i}>{patterns[i]}))" for i in run) + ")",
+                re.IGNORECASE,
+            )
+        except re.error:
+            if len(run) == 1:
+                self.stages.append((run[0], None, patterns[run[0]]))
+                return
+            middle = len(run) // 2
+            self._add_run(run[:middle], patterns)
+            self._add_run(run[middle:], patterns)
+            return
+        self.stages.append((run[0], prefilter, indexer))
+
+    def first_match(self, command: str) -> int | None:
+        """Index of the first rule matching command, or None."""
+        for index, prefilter, indexer in self.stages:
+            if prefilter is None:
+                if re.search(indexer, command, re.IGNORECASE):
+                    return index
+                continue
+            if prefilter.search(command) is None:
+                continue
+            match = indexer.match(command)
+            if match is not None:
+                return int(match.lastgroup[1:])
+        return None
+
+
+def check_bash_patterns(
+    command: str, policy: Policy, commands: list[SimpleCommand] = ()
+) -> tuple[str, str | None]:
+    """
+    Check command against bash tool patterns.
+
+    Patterns are matched against the whole command line and against the
+    text of each simple command in it, so an anchored pattern such as
+    'rm\\s+-rf\\s+/$' also catches 'rm -rf / && ls'. The first rule (in
+    policy order) matching any of them decides (see BashPatternMatcher).
+
+    Returns: (action, reason)
+      action: 'allow', 'block', 'ask'
+      reason: explanation (if block or ask)
+    """
+    matcher = policy.bash_matcher
+    index = matcher.first_match(command)
+    for cmd in commands:
+        if index == 0:
+            break
+        if cmd.text == command:
+            continue
+        segment_index = matcher.first_match(cmd.text)
+        if segment_index is not None and (index is None or segment_index < index):
+            index = segment_index
+    if index is None:
+        return 'allow', None
+
+    pattern_def = policy.bash_patterns[index]
+    reason = pattern_def['reason']
+    if pattern_def.get('ask', False):
+        return 'ask', reason
+    else:
+        return 'block', reason
+
+
+def _first_protected(
+    paths: list[str], protected: ProtectedPaths, cwd: str | None
+) -> tuple[str | None, str | None]:
+    """(path, matched entry) for the first of paths that is protected, else (None, None)."""
+    matches = protected.match_many([expand_path(path, cwd) for path in paths], cwd)
+    for path, matched in zip(paths, matches):
+        if matched is not None:
+            return path, matched
+    return None, None
+
+
+def check_zero_access_paths(
+    commands: list[SimpleCommand], zero_access_paths: ProtectedPaths, cwd: str | None = None
+) -> tuple[bool, str | None]:
+    """
+    Check if any command accesses zero-access paths.
+    Returns: (is_blocked, reason)
+    """
+    paths = [path for cmd in commands for path in path_arguments(cmd)]
+    _, matched = _first_protected(paths, zero_access_paths, cwd)
+    if matched is not None:
+        return True, f"Access to {matched} is forbidden (contains secrets/credentials)"
+
+    return False, None
+
+
+def check_no_delete_paths(
+    commands: list[SimpleCommand], no_delete_paths: ProtectedPaths, cwd: str | None = None
+) -> tuple[bool, str | None]:
+    """
+    Check if any command attempts to delete protected paths.
+    Returns: (is_blocked, reason)
+    """
+    paths = [path for cmd in commands for path in deletion_targets(cmd)]
+    _, matched = _first_protected(paths, no_delete_paths, cwd)
+    if matched is not None:
+        return True, f"Deletion of {matched} is forbidden (critical project path)"
+
+    return False, None
+
+
+def _evaluate_bash(tool_input: dict[str, Any], policy: Policy | None, cwd: str | None) -> Decision:
+    """Bash: zero-access paths, no-delete paths, then bash tool patterns."""
+    command = tool_input.get('command', '')
+
+    if not command:
+        # No command to check, allow
+        return Decision(0)
+
+    if policy is None:
+        policy = load_policy()
+    zero_access_paths = policy.protected_paths('zeroAccessPaths', 'bash')
+    no_delete_paths = policy.protected_paths('noDeletePaths', 'bash')
+
+    # One lexer pass shared by all three checks
+    commands = lex(command)
+
+    # Check 1: Zero-access paths (BLOCK immediately)
+    is_blocked, reason = check_zero_access_paths(commands, zero_access_paths, cwd)
+    if is_blocked:
+        return Decision(2, stderr=f"BLOCKED: {reason}\n")
+
+    # Check 2: No-delete paths (BLOCK if deletion detected)
+    is_blocked, reason = check_no_delete_paths(commands, no_delete_paths, cwd)
+    if is_blocked:
+        return Decision(2, stderr=f"BLOCKED: {reason}\n")
+
+    # Check 3: Bash tool patterns (BLOCK or ASK)
+    action, reason = check_bash_patterns(command, policy, commands)
+
+    if action == 'block':
+        return Decision(2, stderr=f"BLOCKED: {reason}\n")
+    elif action == 'ask':
+        # Return JSON ask prompt
+        ask_response = {
+            "decision": "ask",
+            "message": reason
+        }
+        return Decision(0, stdout=json.dumps(ask_response, indent=2) + "\n")
+
+    # All checks passed, allow command. Deletions are not cached: their
+    # targets may have become links into a protected path by next time.
+    return Decision(0, cacheable=not any(deletion_targets(cmd) for cmd in commands))
+
+
+# ========== EDIT / WRITE TOOLS ==========
+
+# Where deployed framework assets come from (shown when a read-only path is blocked)
+_READ_ONLY_HINT = (
+    "\n"
+    "{verb} the source instead:\n"
+    "  ~/.claude/rules/    -> Haunt/rules/\n"
+    "  ~/.claude/agents/   -> Haunt/agents/\n"
+    "  ~/.claude/skills/   -> Haunt/skills/\n"
+    "  ~/.claude/commands/ -> Haunt/commands/\n"
+    "  ~/.claude/hooks/    -> Haunt/hooks/\n"
+    "\n"
+    "Then deploy: bash Haunt/scripts/setup-haunt.sh\n"
+)
+
+# tool_input keys naming the file an edit modifies
+_EDIT_PATH_KEYS = ("file_path", "notebook_path")
+
+
+def resolve_path(path_str: str, cwd: str | None = None) -> str:
+    """Expand ~ and convert to an absolute, resolved path (relative to cwd, default: ours)."""
+    return realpath(os.path.expanduser(path_str), cwd)
+
+
+def is_protected(file_path: str, protected: ProtectedPaths, cwd: str | None = None) -> bool:
+    """
+    Check if file_path is inside (or equal to) any protected path.
+
+    Args:
+        file_path: Resolved path to check
+        protected: Protected path matcher (see Policy.protected_paths())
+        cwd: Directory relative protected entries resolve against
+
+    Returns:
+        True if file_path is under any protected path, False otherwise
+    """
+    return protected.match(file_path, cwd) is not None
+
+
+def edit_targets(tool_input: dict[str, Any]) -> list[str]:
+    """
+    Files an Edit, MultiEdit or NotebookEdit call modifies, in input order.
+
+    The call's own file_path / notebook_path, plus those of entries in
+    "edits" for batches that edit several files.
+    """
+    targets: dict[str, None] = {}
+    for item in [tool_input, *(tool_input.get("edits") or [])]:
+        if isinstance(item, dict):
+            for key in _EDIT_PATH_KEYS:
+                if item.get(key):
+                    targets[item[key]] = None
+    return list(targets)
+
+
+def _evaluate_edit(tool_input: dict[str, Any], policy: Policy | None, cwd: str | None) -> Decision:
+    """Edit / MultiEdit / NotebookEdit: every target against zeroAccessPaths and readOnlyPaths."""
+    targets = edit_targets(tool_input)
+    if not targets:
+        return Decision(2, stderr="ERROR: No file_path in tool_input\n")
+
+    if policy is None:
+        policy = load_policy()
+    resolved = [resolve_path(target, cwd) for target in targets]
+
+    # Check zeroAccessPaths (absolute no-access)
+    matches = policy.protected_paths("zeroAccessPaths", "file").match_many(resolved, cwd)
+    for file_path, matched in zip(targets, matches):
+        if matched is not None:
+            return Decision(2, stderr=(
+                f"BLOCKED: Edit to {file_path} targets zero-access path (secrets/credentials)\n"
+                "REASON: File is under protected directory containing sensitive data\n"
+            ))
+
+    # Check readOnlyPaths (deployed framework assets)
+    matches = policy.protected_paths("readOnlyPaths", "file").match_many(resolved, cwd)
+    for file_path, matched in zip(targets, matches):
+        if matched is not None:
+            return Decision(2, stderr=f"BLOCKED: {file_path} is deployed framework code\n" + _READ_ONLY_HINT.format(verb="Edit"))
+
+    # If no protection matched, allow the edit
+    return Decision(0, cacheable=True)
+
+
+def _evaluate_write(tool_input: dict[str, Any], policy: Policy | None, cwd: str | None) -> Decision:
+    """Write: the target against zeroAccessPaths and readOnlyPaths."""
+    file_path_str = tool_input.get("file_path")
+    if not file_path_str:
+        return Decision(2, stderr="ERROR: No file_path in tool_input\n")
+
+    if policy is None:
+        policy = load_policy()
+    file_path = resolve_path(file_path_str, cwd)
+
+    # Check if file_path matches any zero access path
+    if is_protected(file_path, policy.protected_paths("zeroAccessPaths", "file"), cwd):
+        return Decision(2, stderr=f"BLOCKED: Cannot write to {file_path} (zero access path)\n")
+
+    # Check if file_path matches any read-only path (deployed framework assets)
+    if is_protected(file_path, policy.protected_paths("readOnlyPaths", "file"), cwd):
+        return Decision(2, stderr=f"BLOCKED: {file_path} is deployed framework code\n" + _READ_ONLY_HINT.format(verb="Write to"))
+
+    # ALLOW: File is safe to write
+    return Decision(0, cacheable=True)
+
+
+# ========== ENTRY POINT ==========
+
+# tool_name -> evaluator of its tool_input
+TOOL_EVALUATORS: dict[str, Callable[[dict[str, Any], Policy | None, str | None], Decision]] = {
+    "Bash": _evaluate_bash,
+    "Edit": _evaluate_edit,
+    "MultiEdit": _evaluate_edit,
+    "NotebookEdit": _evaluate_edit,
+    "Write": _evaluate_write,
+}
+
+# Hook name (as sent by policy_client) -> tool assumed when the input has no tool_name
+HOOK_TOOLS = {"bash": "Bash", "edit": "Edit", "write": "Write"}
+
+
+def evaluate(
+    payload: bytes, policy: Policy | None = None, cwd: str | None = None, hook: str | None = None
+) -> Decision:
+    """
+    Evaluate one hook input, dispatching on its tool_name.
+
+    Any error BLOCKs (exit 2) to be safe: invalid JSON, a missing target,
+    a missing patterns.yaml or an exception in a check.
+
+    Args:
+        payload: Raw hook input (JSON bytes from stdin)
+        policy: Loaded policy (default: load_policy(), only once it is needed)
+        cwd: Directory relative paths resolve against (default: this process's;
+            the policy daemon passes the hook process's)
+        hook: Hook the input came to ("bash", "edit", "write"), used when the
+            input has no tool_name
+    """
+    clear_realpath_memo()
+    try:
+        input_data = json.loads(payload)
+        if not isinstance(input_data, dict):
+            raise ValueError("expected a JSON object")
+    except ValueError as e:
+        return Decision(2, stderr=f"ERROR: Invalid JSON input: {e}\n")
+
+    tool = input_data.get("tool_name") or HOOK_TOOLS.get(hook)
+    evaluator = TOOL_EVALUATORS.get(tool)
+    if evaluator is None:
+        # No checks apply to this tool
+        return Decision(0)
+
+    try:
+        return evaluator(input_data.get("tool_input") or {}, policy, cwd)
+    except PolicyError as e:
+        return Decision(2, stderr=f"ERROR: {e}\n")
+    except Exception as e:
+        # On error, BLOCK to be safe
+        return Decision(2, stderr=f"ERROR in damage control hook: {e}\n")
@@ -0,0 +1,288 @@
+"""
+Damage Control Decision Cache
+
+On-disk cache of allow decisions, so a tool call the hooks already allowed
+(`pytest`, `git status`, the same Edit target) is answered without loading
+the policy, compiling patterns or resolving paths when the policy daemon
+is not available.
+
+Entries are keyed by (tool name, normalized input hash, policy version,
+cwd) in a SQLite file next to the hooks:
+- The normalized input is the tool name and only the tool_input fields its
+  evaluator reads: Bash's command; the file_path / notebook_path of Edit,
+  MultiEdit, NotebookEdit and Write (and of each "edits" entry). Fields
+  that do not change the decision (Bash description, timeout,
+  run_in_background, edit contents) and per-call fields (session_id,
+  transcript_path, ...) are ignored
+- The policy version is the sha256 of the patterns.yaml the policy was
+  compiled from, combined with the hook code's (mtime, size) and $HOME, so
+  editing patterns.yaml or redeploying the hooks invalidates every entry
+  (they are dropped on the next write)
+
+Only decisions the evaluators mark cacheable are stored: plain allows, not
+asks, blocks or errors, and never a Bash command that deletes something.
+A cached allow is not re-checked against the filesystem: if a path it
+named later becomes a symlink into a protected directory, the cached
+answer stands until the policy or hooks change (creating such a link
+through Bash is itself blocked).
+
+Like policy_client.py this module must stay cheap to import: it uses the
+_sqlite3, _json, _sha256 and _thread builtins instead of sqlite3, json,
+hashlib and threading, and nothing from typing.
+Any cache error is a miss; the cache never blocks a tool call.
+
+Environment:
+  HAUNT_DAMAGE_CONTROL_CACHE       Set to 0 to disable the cache
+  HAUNT_DAMAGE_CONTROL_CACHE_FILE  Cache path (default: decisions.sqlite next to this file)
+"""
+
+from __future__ import annotations
+
+import os
+
+import _json
+import _sha256
+import _sqlite3
+import _thread
+
+CACHE_ENV = "HAUNT_DAMAGE_CONTROL_CACHE"
+CACHE_FILE_ENV = "HAUNT_DAMAGE_CONTROL_CACHE_FILE"
+
+HOOK_DIR = os.path.dirname(os.path.abspath(__file__))
+PATTERNS_FILE = os.path.join(HOOK_DIR, "patterns.yaml")
+
+# Modules whose code decides what is allowed
+CODE_FILES = tuple(
+    os.path.join(HOOK_DIR, name) for name in ("damage_control.py", "shell_lexer.py", "protected_paths.py")
+)
+
+# Most entries kept; the oldest are pruned beyond this
+MAX_ENTRIES = 10_000
+
+# Seconds to wait on another process's write lock before giving up
+BUSY_TIMEOUT_SECONDS = 0.1
+
+# Tool of an input without tool_name, by hook (damage_control.HOOK_TOOLS,
+# repeated here so a cache lookup does not import damage_control)
+HOOK_TOOLS = {"bash": "Bash", "edit": "Edit", "write": "Write"}
+
+# tool_input fields that name the files an Edit-like call modifies
+_EDIT_PATH_KEYS = ("file_path", "notebook_path")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decisions (
+    tool TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    policy_version TEXT NOT NULL,
+    cwd TEXT NOT NULL,
+    UNIQUE (tool, input_hash, policy_version, cwd)
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+class _JSONContext:
+    """Settings for the C JSON scanner (what json.JSONDecoder passes it)."""
+
+    strict = True
+    object_hook = None
+    object_pairs_hook = None
+    parse_float = float
+    parse_int = int
+    parse_constant = float
+
+
+def cache_enabled() -> bool:
+    """False if HAUNT_DAMAGE_CONTROL_CACHE=0."""
+    return os.environ.get(CACHE_ENV, "1") != "0"
+
+
+def cache_path() -> str:
+    """Return the cache file path (env override, else next to the hooks)."""
+    return os.environ.get(CACHE_FILE_ENV) or os.path.join(HOOK_DIR, "decisions.sqlite")
+
+
+def _sha256_hex(data: bytes) -> str:
+    return _sha256.sha256(data).hexdigest()
+
+
+def _canonical(value: object) -> object:
+    """value with dict keys sorted at every level, for a stable repr()."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _canonical(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_canonical(item) for item in value)
+    return value
+
+
+def _decision_input(tool: object, tool_input: object) -> object:
+    """
+    The part of tool_input the tool's evaluator reads, mirroring
+    damage_control's _evaluate_bash, edit_targets and _evaluate_write.
+    Unknown tools and malformed inputs keep the whole (canonical) tool_input.
+    """
+    if not isinstance(tool_input, dict):
+        return _canonical(tool_input)
+    if tool == "Bash":
+        return tool_input.get("command", "")
+    if tool == "Write":
+        return tool_input.get("file_path")
+    if tool in ("Edit", "MultiEdit", "NotebookEdit"):
+        edits = tool_input.get("edits") or []
+        if not isinstance(edits, list):
+            return _canonical(tool_input)
+        targets = []
+        for item in [tool_input, *edits]:
+            if isinstance(item, dict):
+                for key in _EDIT_PATH_KEYS:
+                    if item.get(key) and item[key] not in targets:
+                        targets.append(item[key])
+        return tuple(targets)
+    return _canonical(tool_input)
+
+
+def policy_version(source_sha256: str) -> str:
+    """Version of a compiled policy (its patterns.yaml sha256) as run by this hook code."""
+    parts = [source_sha256, os.path.expanduser("~")]
+    for path in CODE_FILES:
+        try:
+            st = os.stat(path)
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    return _sha256_hex("\0".join(parts).encode())
+
+
+def current_policy_version(patterns_file: str = PATTERNS_FILE) -> str | None:
+    """policy_version() of patterns.yaml as it is on disk now; None if unreadable."""
+    try:
+        with open(patterns_file, "rb") as f:
+            return policy_version(_sha256_hex(f.read()))
+    except OSError:
+        return None
+
+
+def make_key(hook: str, payload: bytes, version: str, cwd: str) -> tuple[str, str, str, str] | None:
+    """
+    Cache key for a hook input: (tool, input_hash, policy_version, cwd).
+    None if the input is not a JSON object.
+    """
+    try:
+        data, _ = _json.make_scanner(_JSONContext())(payload.decode(), 0)
+    except (ValueError, StopIteration, UnicodeDecodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    tool = data.get("tool_name") or HOOK_TOOLS.get(hook)
+    normalized = repr((tool, _decision_input(tool, data.get("tool_input"))))
+    return str(tool or hook), _sha256_hex(normalized.encode()), version, cwd
+
+
+class DecisionCache:
+    """
+    Connection to the cache file. Safe to share between threads; every
+    method swallows cache errors (a failed lookup is a miss).
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or cache_path()
+        self._conn = None
+        self._writable = False
+        self._lock = _thread.allocate_lock()
+
+    def _connect(self, create: bool):
+        """Open the cache (creating it and its tables if create); None if missing or untrusted."""
+        if self._conn is None:
+            self._conn = self._open(create)
+        if create and self._conn is not None and not self._writable:
+            try:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.executescript(_SCHEMA)
+            except _sqlite3.OperationalError:
+                # Locked by another writer: skip this write
+                raise
+            except _sqlite3.DatabaseError:
+                self._close_connection()
+                self._discard()
+                raise
+            self._writable = True
+        return self._conn
+
+    def _open(self, create: bool):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            if not create:
+                return None
+            os.close(os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o600))
+            st = os.stat(self.path)
+        # Only trust a cache that no one else can write allow decisions into
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            return None
+
+        return _sqlite3.connect(
+            self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None, check_same_thread=False,
+        )
+
+    def _discard(self) -> None:
+        """Delete a corrupt cache file; the next write starts a fresh one."""
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.unlink(self.path + suffix)
+            except OSError:
+                pass
+
+    def contains(self, key: tuple[str, str, str, str]) -> bool:
+        """True if key was stored as allowed."""
+        with self._lock:
+            try:
+                conn = self._connect(create=False)
+                if conn is None:
+                    return False
+                row = conn.execute(
+                    "SELECT 1 FROM decisions WHERE tool = ? AND input_hash = ? AND policy_version = ? AND cwd = ?",
+                    key,
+                ).fetchone()
+            except (OSError, _sqlite3.Error):
+                return False
+            return row is not None
+
+    def add(self, key: tuple[str, str, str, str]) -> None:
+        """Record key as allowed, dropping entries of every other policy version."""
+        with self._lock:
+            try:
+                conn = self._connect(create=True)
+                if conn is None:
+                    return
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute("SELECT value FROM meta WHERE key = 'policy_version'").fetchone()
+                    version = key[2]
+                    if row is None or row[0] != version:
+                        conn.execute("DELETE FROM decisions")
+                        conn.execute(
+                            "INSERT OR REPLACE INTO meta (key, value) VALUES ('policy_version', ?)",
+                            (version,),
+                        )
+                    cursor = conn.execute("INSERT OR IGNORE INTO decisions VALUES (?, ?, ?, ?)", key)
+                    if cursor.rowcount and cursor.lastrowid % 256 == 0:
+                        conn.execute(
+                            "DELETE FROM decisions WHERE rowid <= ?", (cursor.lastrowid - MAX_ENTRIES,),
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            except (OSError, _sqlite3.Error):
+                pass
+
+    def _close_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._writable = False
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_connection()
@@ -0,0 +1,241 @@
+"""
+Damage Control Policy Client
+
+Fast path shared by the three damage-control hooks. A hook forwards its raw
+stdin to the long-lived policy daemon (policy_daemon.py) over a Unix socket
+and replays the daemon's answer, so the per-call cost is interpreter start-up
+plus one round trip instead of importing yaml/re/pathlib and re-reading
+patterns.yaml on every tool call.
+
+If the daemon is not running the hook starts it in the background (at most
+once per SPAWN_THROTTLE_SECONDS) and answers this call from the decision
+cache (decision_cache.py) if the same call was allowed before, else
+evaluates it in-process with damage_control.py, from the compiled policy
+artifact (no PyYAML needed unless patterns.yaml changed since it was last
+compiled).
+
+This module must stay cheap to import: stdlib builtins only, and nothing that
+pulls in re, json, enum or selectors (`socket` does; `_socket` does not).
+
+Wire format:
+  request:  b"<hook>\\n<cwd>\\n" + raw hook input (client then shuts down writing)
+  response: b"<exit code>\\0<stdout>\\0<stderr>" (UTF-8)
+  A connection closed without a response means "evaluate it yourself".
+
+Environment:
+  HAUNT_DAMAGE_CONTROL_SOCKET  Socket path (default: policy.sock next to this file)
+  HAUNT_DAMAGE_CONTROL_DAEMON  Set to 0 to skip the daemon and always evaluate in-process
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import _socket
+
+SOCKET_ENV = "HAUNT_DAMAGE_CONTROL_SOCKET"
+DAEMON_ENV = "HAUNT_DAMAGE_CONTROL_DAEMON"
+
+HOOK_DIR = os.path.dirname(os.path.abspath(__file__))
+DAEMON_SCRIPT = os.path.join(HOOK_DIR, "policy_daemon.py")
+
+# Seconds to wait on the daemon before evaluating in-process instead
+QUERY_TIMEOUT_SECONDS = 1.0
+
+# Minimum seconds between two background start attempts
+SPAWN_THROTTLE_SECONDS = 10
+
+# sun_path is 108 bytes on Linux, 104 on macOS
+_MAX_SOCKET_PATH = 100
+
+
+def socket_path() -> str:
+    """Return the daemon socket path (env override, else next to the hooks)."""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    path = os.path.join(HOOK_DIR, "policy.sock")
+    if len(path) > _MAX_SOCKET_PATH:
+        path = f"/tmp/haunt-damage-control-{os.getuid()}.sock"
+    return path
+
+
+def encode_response(exit_code: int, stdout: str, stderr: str) -> bytes:
+    """Frame a decision for the wire (stdout never contains NUL: it is JSON)."""
+    return f"{exit_code}\0{stdout}\0{stderr}".encode()
+
+
+def decode_response(data: bytes) -> tuple[int, str, str] | None:
+    """Parse a framed decision; None if the daemon declined to answer."""
+    parts = data.decode(errors="replace").split("\0", 2)
+    if len(parts) != 3 or not parts[0].isdigit():
+        return None
+    return int(parts[0]), parts[1], parts[2]
+
+
+def query(hook: str, payload: bytes, path: str | None = None) -> tuple[int, str, str] | None:
+    """
+    Ask the daemon for a decision.
+
+    Returns:
+        (exit_code, stdout, stderr), or None if the daemon is unavailable,
+        not owned by this user, or declined to answer
+    """
+    path = path or socket_path()
+    try:
+        # Only trust a socket created by this user
+        if os.stat(path).st_uid != os.getuid():
+            return None
+        sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    except OSError:
+        return None
+
+    try:
+        sock.settimeout(QUERY_TIMEOUT_SECONDS)
+        sock.connect(path)
+        sock.sendall(hook.encode() + b"\n" + os.fsencode(os.getcwd()) + b"\n" + payload)
+        sock.shutdown(_socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError:
+        return None
+    finally:
+        sock.close()
+
+    return decode_response(b"".join(chunks))
+
+
+def start_daemon(path: str | None = None) -> bool:
+    """
+    Start policy_daemon.py detached, unless an attempt was made recently.
+
+    Uses this interpreter when it has PyYAML (to recompile patterns.yaml),
+    otherwise `uv run --script` (the daemon declares its own dependencies).
+
+    Returns:
+        True if a daemon process was launched
+    """
+    path = path or socket_path()
+    marker = path + ".spawn"
+    try:
+        import time
+        if time.time() - os.stat(marker).st_mtime < SPAWN_THROTTLE_SECONDS:
+            return False
+    except OSError:
+        pass
+
+    import importlib.util
+    import shutil
+    import subprocess
+
+    if importlib.util.find_spec("yaml") is not None or not shutil.which("uv"):
+        command = [sys.executable, DAEMON_SCRIPT]
+    else:
+        command = ["uv", "run", "--quiet", "--script", DAEMON_SCRIPT]
+
+    try:
+        with open(marker, "w"):
+            pass
+        subprocess.Popen(
+            command + ["--socket", path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        return False
+    return True
+
+
+def cached_allow(hook: str, payload: bytes) -> bool:
+    """True if the decision cache holds an allow for this call under the current policy."""
+    import decision_cache
+
+    if not decision_cache.cache_enabled():
+        return False
+    version = decision_cache.current_policy_version()
+    if version is None:
+        return False
+    key = decision_cache.make_key(hook, payload, version, os.getcwd())
+    return key is not None and decision_cache.DecisionCache().contains(key)
+
+
+def evaluate_locally(hook: str, payload: bytes) -> tuple[int, str, str]:
+    """
+    Evaluate in this process (or via uv if recompiling needs PyYAML and it
+    is missing), recording a cacheable allow in the decision cache.
+    """
+    import damage_control
+
+    try:
+        policy = damage_control.load_policy()
+    except damage_control.MissingDependencyError:
+        decision = _evaluate_with_uv(hook, payload)
+        if decision is not None:
+            return decision
+        policy = None
+    except damage_control.PolicyError:
+        # The evaluator reports it, in its own order and with its own exit code
+        policy = None
+
+    decision = damage_control.evaluate(payload, policy, hook=hook)
+    if decision.cacheable and policy is not None:
+        import decision_cache
+
+        if decision_cache.cache_enabled():
+            version = decision_cache.policy_version(policy.source_sha256)
+            key = decision_cache.make_key(hook, payload, version, os.getcwd())
+            if key is not None:
+                decision_cache.DecisionCache().add(key)
+    return decision.exit_code, decision.stdout, decision.stderr
+
+
+def _evaluate_with_uv(hook: str, payload: bytes) -> tuple[int, str, str] | None:
+    """Re-run the hook under `uv run --with pyyaml` so PyYAML is available to recompile."""
+    import shutil
+    import subprocess
+
+    if not shutil.which("uv"):
+        return None
+
+    script = os.path.join(HOOK_DIR, f"{hook}-tool-damage-control.py")
+    env = dict(os.environ, **{DAEMON_ENV: "0"})
+    try:
+        result = subprocess.run(
+            ["uv", "run", "--quiet", "--no-project", "--with", "pyyaml", "python", script],
+            input=payload, capture_output=True, env=env,
+        )
+    except OSError:
+        return None
+    return result.returncode, result.stdout.decode(errors="replace"), result.stderr.decode(errors="replace")
+
+
+def run_hook(hook: str) -> None:
+    """Entry point for a hook script: decide, replay stdout/stderr, exit."""
+    payload = sys.stdin.buffer.read()
+
+    decision = None
+    use_daemon = os.environ.get(DAEMON_ENV, "1") != "0"
+    if use_daemon:
+        decision = query(hook, payload)
+
+    if decision is None:
+        if use_daemon:
+            start_daemon()
+        if cached_allow(hook, payload):
+            decision = (0, "", "")
+        else:
+            decision = evaluate_locally(hook, payload)
+
+    exit_code, stdout, stderr = decision
+    if stdout:
+        sys.stdout.write(stdout)
+    if stderr:
+        sys.stderr.write(stderr)
+    sys.exit(exit_code)
@@ -0,0 +1,225 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["pyyaml"]
+# ///
+
+"""
+Damage Control Policy Daemon
+
+Long-lived process that answers damage-control hook queries over a Unix
+socket (see policy_client.py for the wire format). The compiled policy is
+loaded once and reloaded only when patterns.yaml's (mtime, size, inode)
+changes, checked with one stat() per request, so edits take effect on the
+next tool call.
+
+Started on demand by the hooks; exits after IDLE_TIMEOUT_SECONDS without a
+request, or as soon as any of the hook modules change on disk (a redeploy)
+so the next hook call starts a fresh daemon with the new code.
+
+Cacheable allow decisions are also recorded in the decision cache
+(decision_cache.py), after the answer has been sent, so hooks that find no
+daemon can still answer repeated tool calls without evaluating them.
+
+Usage:
+  policy_daemon.py [--socket PATH] [--idle-timeout SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+import damage_control
+import decision_cache
+import policy_client
+
+# Exit after this long without a request
+IDLE_TIMEOUT_SECONDS = 30 * 60
+
+# How often the serve loop wakes to check for idleness or a stop request
+POLL_SECONDS = 0.5
+
+# Files whose change means this process is running stale code
+CODE_FILES = sorted(Path(__file__).parent.glob("*.py"))
+
+
+def _signature(path: Path) -> tuple[int, int, int] | None:
+    """(mtime_ns, size, inode) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class PolicyCache:
+    """The compiled policy, reloaded whenever patterns.yaml changes."""
+
+    def __init__(self, patterns_file: Path = damage_control.PATTERNS_FILE):
+        self.patterns_file = patterns_file
+        self._lock = threading.Lock()
+        self._signature: tuple[int, int, int] | None = None
+        self._policy: damage_control.Policy | None = None
+
+    def get(self) -> damage_control.Policy | None:
+        """
+        Current policy, or None if patterns.yaml cannot be loaded.
+
+        None makes the evaluators load the file themselves, so a missing or
+        broken patterns.yaml fails exactly as it does without the daemon.
+        """
+        signature = _signature(self.patterns_file)
+        with self._lock:
+            if signature != self._signature:
+                self._signature = signature
+                try:
+                    self._policy = damage_control.load_policy(self.patterns_file)
+                except Exception:
+                    self._policy = None
+            return self._policy
+
+
+class PolicyRequestHandler(socketserver.StreamRequestHandler):
+    """Answer one hook query; close without a response to make the client evaluate."""
+
+    def handle(self):
+        server: PolicyServer = self.server
+        hook, _, request = self.rfile.read().partition(b"\n")
+        cwd, _, payload = request.partition(b"\n")
+
+        hook_name = hook.decode(errors="replace")
+        if hook_name not in damage_control.HOOK_TOOLS or not cwd or server.code_changed():
+            return
+
+        policy = server.policy.get()
+        if policy is None:
+            return
+
+        try:
+            decision = damage_control.evaluate(payload, policy, os.fsdecode(cwd), hook=hook_name)
+        except Exception:
+            return
+        self.wfile.write(policy_client.encode_response(decision.exit_code, decision.stdout, decision.stderr))
+
+        if decision.cacheable and server.decisions is not None:
+            # Let the client go before touching the cache file
+            try:
+                self.request.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+            version = decision_cache.policy_version(policy.source_sha256)
+            key = decision_cache.make_key(hook_name, payload, version, os.fsdecode(cwd))
+            if key is not None:
+                server.decisions.add(key)
+
+
+class PolicyServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server that stops when idle or when its code changes."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, idle_timeout: float):
+        self.path = path
+        self.policy = PolicyCache()
+        self.decisions = decision_cache.DecisionCache() if decision_cache.cache_enabled() else None
+        self.stopping = False
+        self.idle_timeout = idle_timeout
+        self.timeout = POLL_SECONDS
+        self.last_request = time.monotonic()
+        self._code_signatures = [_signature(p) for p in CODE_FILES]
+
+        # Socket readable and writable by this user only
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(path, PolicyRequestHandler)
+        finally:
+            os.umask(old_umask)
+        self._inode = os.stat(path).st_ino
+
+        # Warm the cache before the first request
+        self.policy.get()
+
+    def code_changed(self) -> bool:
+        """True (and begin shutting down) once a deployed code file changes."""
+        if [_signature(p) for p in CODE_FILES] != self._code_signatures:
+            self.stopping = True
+            self.remove_socket()
+            return True
+        return False
+
+    def process_request(self, request, client_address):
+        self.last_request = time.monotonic()
+        super().process_request(request, client_address)
+
+    def handle_timeout(self):
+        if time.monotonic() - self.last_request > self.idle_timeout:
+            self.stopping = True
+
+    def remove_socket(self):
+        """Unlink the socket path if it still belongs to this server."""
+        try:
+            if os.stat(self.path).st_ino == self._inode:
+                os.unlink(self.path)
+        except OSError:
+            pass
+
+    def serve_until_idle(self):
+        while not self.stopping:
+            self.handle_request()
+
+
+def _connectable(path: str) -> bool:
+    """True if something is accepting connections on path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve damage-control decisions over a Unix socket")
+    parser.add_argument("--socket", default=policy_client.socket_path(), help="Socket path")
+    parser.add_argument(
+        "--idle-timeout", type=float, default=IDLE_TIMEOUT_SECONDS,
+        help=f"Exit after this many seconds without a request (default: {IDLE_TIMEOUT_SECONDS})",
+    )
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.socket):
+        if _connectable(args.socket):
+            # Another daemon already owns the socket
+            return 0
+        os.unlink(args.socket)
+
+    try:
+        server = PolicyServer(args.socket, args.idle_timeout)
+    except OSError as e:
+        # Lost a start-up race to another daemon
+        print(f"policy_daemon: cannot bind {args.socket}: {e}", file=sys.stderr)
+        return 0
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_until_idle()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.remove_socket()
+        server.server_close()
+        if server.decisions is not None:
+            server.decisions.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
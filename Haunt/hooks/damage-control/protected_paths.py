@@ -0,0 +1,180 @@
+"""
+Protected Path Matching
+
+Protected paths from the compiled policy are resolved once per policy load
+and stored in a component-wise prefix trie, so checking a candidate path is
+one walk over its components:
+- Matches only at component boundaries (~/.ssh covers ~/.ssh/id_rsa, not ~/.sshkeys)
+- When several entries cover a path, the earliest in patterns.yaml is reported
+- A batch of paths (a multi-file edit) is checked in one walk: paths are
+  sorted and each one resumes from the node its shared prefix reached
+
+Entries that cannot be resolved ahead of time (relative paths, $VARS) are
+resolved on first use per working directory and kept in a second trie.
+
+Candidate paths go through realpath(), which memoizes each directory's
+resolved form: a batch of paths sharing parents costs one lstat() per new
+component instead of a full resolution per path. The memo lives for one
+evaluation (call clear_realpath_memo() before each), because a symlink
+created between two tool calls must not be hidden by a stale entry.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Callable
+
+# Most memoized paths before the memo is cleared
+_MAX_MEMO = 4096
+
+# Most working directories with a cached trie of deferred entries
+_MAX_CWD_TRIES = 32
+
+# absolute path -> realpath
+_REALPATH_MEMO: dict[str, str] = {}
+
+# Trie node key marking "a protected entry ends here" (not a valid component)
+_END = ""
+
+
+def clear_realpath_memo() -> None:
+    """Forget memoized resolutions (call at the start of each evaluation)."""
+    _REALPATH_MEMO.clear()
+
+
+def realpath(path: str, cwd: str | None = None) -> str:
+    """os.path.realpath(path) relative to cwd, memoizing every directory on the way."""
+    if not os.path.isabs(path):
+        path = os.path.join(cwd or os.getcwd(), path)
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+    if len(_REALPATH_MEMO) > _MAX_MEMO:
+        _REALPATH_MEMO.clear()
+    return _realpath_abs(path)
+
+
+def _realpath_abs(path: str) -> str:
+    resolved = _REALPATH_MEMO.get(path)
+    if resolved is not None:
+        return resolved
+
+    head, tail = os.path.split(path)
+    if not tail or tail in (".", "..") or head == path:
+        # '..' must be applied after resolving symlinks; let realpath handle
+        # it (and doubled slashes) in one go
+        resolved = os.path.realpath(path)
+    else:
+        candidate = os.path.join(_realpath_abs(head), tail)
+        resolved = os.path.realpath(candidate) if os.path.islink(candidate) else candidate
+
+    _REALPATH_MEMO[path] = resolved
+    return resolved
+
+
+def _components(resolved: str) -> list[str]:
+    return [part for part in resolved.split("/") if part]
+
+
+class PathTrie:
+    """Prefix trie over absolute path components; values are entry indexes."""
+
+    def __init__(self):
+        self.root: dict[str, Any] = {}
+
+    def add(self, resolved: str, index: int) -> None:
+        node = self.root
+        for part in _components(resolved):
+            node = node.setdefault(part, {})
+        if index < node.get(_END, index + 1):
+            node[_END] = index
+
+    def match(self, resolved: str) -> int | None:
+        """Lowest index among entries equal to or containing resolved."""
+        node = self.root
+        best = node.get(_END)
+        for part in _components(resolved):
+            node = node.get(part)
+            if node is None:
+                break
+            index = node.get(_END)
+            if index is not None and (best is None or index < best):
+                best = index
+        return best
+
+    def match_many(self, paths: list[str]) -> list[int | None]:
+        """match() for every path, walking each shared leading component once."""
+        results: list[int | None] = [None] * len(paths)
+        # stack[depth] = (node, best index so far) after depth components of previous
+        stack: list[tuple[dict[str, Any], int | None]] = [(self.root, self.root.get(_END))]
+        previous: list[str] = []
+        for position in sorted(range(len(paths)), key=paths.__getitem__):
+            parts = _components(paths[position])
+            common = 0
+            limit = min(len(parts), len(previous), len(stack) - 1)
+            while common < limit and parts[common] == previous[common]:
+                common += 1
+            del stack[common + 1:]
+
+            node, best = stack[-1]
+            for part in parts[common:]:
+                node = node.get(part)
+                if node is None:
+                    break
+                index = node.get(_END)
+                if index is not None and (best is None or index < best):
+                    best = index
+                stack.append((node, best))
+            results[position] = stack[-1][1]
+            previous = parts
+        return results
+
+
+class ProtectedPaths:
+    """
+    One path list of the compiled policy (e.g. zeroAccessPaths) in one
+    resolution form ("bash" or "file", see damage_control.compile_policy).
+    """
+
+    def __init__(self, entries: list[dict[str, Any]], form: str, resolve: Callable[[str, str | None], str]):
+        """
+        Args:
+            entries: Compiled policy entries ({"path", "bash", "file"})
+            form: Which pre-resolved form to use
+            resolve: Resolves a deferred entry for a working directory
+        """
+        self.entries = entries
+        self.resolve = resolve
+        self.static = PathTrie()
+        self.deferred: list[tuple[int, str]] = []
+        for index, entry in enumerate(entries):
+            if entry[form] is not None:
+                self.static.add(entry[form], index)
+            else:
+                self.deferred.append((index, entry["path"]))
+        self._by_cwd: dict[str, PathTrie] = {}
+
+    def _deferred_trie(self, cwd: str) -> PathTrie:
+        trie = self._by_cwd.get(cwd)
+        if trie is None:
+            trie = PathTrie()
+            for index, path in self.deferred:
+                trie.add(self.resolve(path, cwd), index)
+            if len(self._by_cwd) >= _MAX_CWD_TRIES:
+                self._by_cwd.clear()
+            self._by_cwd[cwd] = trie
+        return trie
+
+    def match(self, resolved: str, cwd: str | None = None) -> str | None:
+        """The patterns.yaml entry covering resolved (earliest listed), or None."""
+        return self.match_many([resolved], cwd)[0]
+
+    def match_many(self, resolved: list[str], cwd: str | None = None) -> list[str | None]:
+        """match() for a batch of resolved paths, in one walk per trie."""
+        indexes = self.static.match_many(resolved)
+        if self.deferred:
+            deferred = self._deferred_trie(cwd or os.getcwd()).match_many(resolved)
+            indexes = [
+                other if other is not None and (index is None or other < index) else index
+                for index, other in zip(indexes, deferred)
+            ]
+        return [None if index is None else self.entries[index]["path"] for index in indexes]
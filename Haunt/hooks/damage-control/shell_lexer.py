@@ -0,0 +1,452 @@
+"""
+Shell Command Lexer
+
+One pass over a bash command line that splits it into simple commands the
+damage-control checks can reason about:
+- Pipelines and lists: |, |&, &&, ||, ;, &, newlines
+- Subshells and groups: ( ... ), { ...; }
+- Command and process substitution: $( ... ), `...`, <( ... ), >( ... )
+  (the inner commands are lexed recursively and listed as commands too)
+- Quoting: '...', "...", backslash escapes
+- Redirections: >, >>, <, &>, 2>, >&, here-docs and here-strings
+- Shell code run by a shell: `bash -c '...'`, `eval ...`, and here-docs or
+  here-strings fed to bash/sh/zsh/dash/ksh (directly or through a pipe, as
+  in `cat <<EOF | bash`) are lexed recursively like substitutions
+
+Each SimpleCommand records its words (quotes removed, nothing expanded),
+which word is the program (after skipping assignments and wrappers such as
+sudo, env, xargs or timeout), its redirection targets, the operands of the
+pipeline stages before it (what `... | xargs rm` may receive on stdin), and
+the here-doc bodies and here-strings it reads.
+
+The lexer never raises: unterminated quotes or substitutions run to the end
+of the input, so a malformed command is still checked as far as it goes.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+# Longest first: the first prefix that matches at a position wins
+_SEPARATORS = ("&&", "||", ";;", "|&", "|", ";", "&", "\n")
+_REDIRECTS = ("&>>", "&>", "<<<", ">>", ">|", ">&", "<&", "<>", ">", "<")
+_HEREDOCS = ("<<-", "<<")
+
+# Characters that end an unquoted word
+_METACHARS = frozenset(" \t\n|&;()<>")
+
+# Runs of characters with no special meaning, consumed in one step
+_PLAIN_RUN = re.compile(r"[^\s|&;()<>\\'\"$`]+")
+_PLAIN_DQ_RUN = re.compile(r'[^"\\$`]+')
+
+# Reserved words that may precede the program of a simple command
+_KEYWORDS = frozenset({
+    "!", "{", "}", "[[", "]]", "if", "then", "else", "elif", "fi", "while",
+    "until", "do", "done", "case", "esac", "for", "select", "in", "function", "time",
+})
+
+# Programs that run another program given as their first operand, mapped to
+# their options that consume the following word
+_WRAPPERS: dict[str, frozenset[str]] = {
+    "sudo": frozenset({"-u", "-g", "-C", "-D", "-h", "-p", "-r", "-t", "-U"}),
+    "doas": frozenset({"-u", "-C"}),
+    "env": frozenset({"-u", "-C", "-S"}),
+    "command": frozenset(),
+    "builtin": frozenset(),
+    "exec": frozenset({"-a"}),
+    "nohup": frozenset(),
+    "nice": frozenset({"-n"}),
+    "ionice": frozenset({"-c", "-n", "-p"}),
+    "stdbuf": frozenset({"-i", "-o", "-e"}),
+    "timeout": frozenset({"-k", "-s"}),
+    "xargs": frozenset({"-I", "-n", "-P", "-L", "-d", "-E", "-s", "-a"}),
+}
+
+# Programs that run shell code from stdin or a -c operand
+_SHELLS = frozenset({"bash", "sh", "zsh", "dash", "ksh"})
+
+# Shell options that consume the following word (bash -o pipefail -c ...)
+_SHELL_VALUE_OPTIONS = frozenset({"-o", "+o", "-O", "+O", "--rcfile", "--init-file"})
+
+
+class SimpleCommand(NamedTuple):
+    """
+    One simple command from a command line.
+
+    Attributes:
+        words: Every word, quotes removed, in order (including assignments and wrappers)
+        program_index: Index into words of the program run, or None (assignments only)
+        redirects: Targets of file redirections (not fd duplications or here-docs)
+        text: Source text of the command, for regex checks
+        upstream: Operands of the earlier stages of its pipeline (a | b | c:
+            a's for b, a's and b's for c)
+        stdin: Here-doc bodies and here-strings it reads, unexpanded
+    """
+
+    words: tuple[str, ...]
+    program_index: int | None
+    redirects: tuple[str, ...]
+    text: str
+    upstream: tuple[str, ...] = ()
+    stdin: tuple[str, ...] = ()
+
+    @property
+    def program(self) -> str:
+        """Basename of the program ('' if none), e.g. 'rm' for /bin/rm."""
+        if self.program_index is None:
+            return ""
+        return self.words[self.program_index].rsplit("/", 1)[-1]
+
+    @property
+    def args(self) -> tuple[str, ...]:
+        """Words after the program."""
+        if self.program_index is None:
+            return ()
+        return self.words[self.program_index + 1:]
+
+    @property
+    def wrappers(self) -> tuple[str, ...]:
+        """Basenames of the wrapper programs before the program (e.g. ('sudo', 'xargs'))."""
+        end = len(self.words) if self.program_index is None else self.program_index
+        names = (word.rsplit("/", 1)[-1] for word in self.words[:end])
+        return tuple(name for name in names if name in _WRAPPERS)
+
+
+def is_assignment(word: str) -> bool:
+    """True for NAME=value words."""
+    name, eq, _ = word.partition("=")
+    return bool(eq) and name.isidentifier()
+
+
+def find_program(words: tuple[str, ...] | list[str]) -> int | None:
+    """Index of the program word, skipping keywords, assignments and wrapper prefixes."""
+    i = 0
+    while i < len(words):
+        word = words[i]
+        if word in _KEYWORDS or is_assignment(word):
+            i += 1
+            continue
+
+        name = word.rsplit("/", 1)[-1]
+        value_options = _WRAPPERS.get(name)
+        if value_options is None:
+            return i
+
+        i += 1
+        while i < len(words) and (words[i].startswith("-") or (name == "env" and is_assignment(words[i]))):
+            option = words[i]
+            i += 1
+            if option == "--":
+                break
+            if option in value_options:
+                i += 1
+        if name == "timeout":
+            # Skip the DURATION operand
+            i += 1
+    return None
+
+
+def shell_code(cmd: SimpleCommand) -> list[str]:
+    """Code a shell command runs from its words: the -c operand of bash/sh/..., or eval's operands."""
+    if cmd.program == "eval":
+        return [" ".join(cmd.args)] if cmd.args else []
+    if cmd.program not in _SHELLS:
+        return []
+    args = cmd.args
+    i = 0
+    while i < len(args) and args[i][:1] in ("-", "+") and args[i] != "--":
+        option = args[i]
+        i += 1
+        if option in _SHELL_VALUE_OPTIONS:
+            i += 1
+        elif not option.startswith("--") and "c" in option[1:]:
+            return args[i:i + 1]
+    return []
+
+
+def lex(command: str) -> list[SimpleCommand]:
+    """Split a command line into simple commands (substitutions' commands included)."""
+    return _Lexer(command).run()
+
+
+class _Lexer:
+    """Single-pass scanner over one command string."""
+
+    def __init__(self, src: str):
+        self.src = src
+        self.pos = 0
+        self.commands: list[SimpleCommand] = []
+        self.nested: list[SimpleCommand] = []
+
+        self.words: list[str] = []
+        self.redirects: list[str] = []
+        self.start: int | None = None
+        self.end = 0
+        self.stdin: list[str] = []
+        self.has_heredoc = False
+        # (delimiter, strip_tabs, index of the command reading it)
+        self.heredocs: list[tuple[str, bool, int]] = []
+        self.upstream: tuple[str, ...] = ()
+        # Pipeline number of each command in self.commands
+        self.pipeline = 0
+        self.pipelines: list[int] = []
+
+    def run(self) -> list[SimpleCommand]:
+        src = self.src
+        while self.pos < len(src):
+            ch = src[self.pos]
+
+            if ch in " \t":
+                self.pos += 1
+            elif ch == "\\" and src.startswith("\\\n", self.pos):
+                self.pos += 2
+            elif ch == "#":
+                newline = src.find("\n", self.pos)
+                self.pos = len(src) if newline < 0 else newline
+            elif src.startswith(("<(", ">("), self.pos):
+                start = self.pos
+                self._begin(start)
+                self.pos = self._substitution(start + 2)
+                self.words.append(src[start:self.pos])
+                self.end = self.pos
+            elif ch in "()":
+                self._flush()
+                self.pos += 1
+            elif src.startswith(_HEREDOCS, self.pos):
+                strip_tabs = src.startswith("<<-", self.pos)
+                self._begin(self.pos)
+                self.pos += 3 if strip_tabs else 2
+                if not src.startswith("<", self.pos):
+                    delimiter, _ = self._read_word()
+                    if delimiter:
+                        # The body follows the next newline; this command is flushed first
+                        self.heredocs.append((delimiter, strip_tabs, len(self.commands)))
+                        self.has_heredoc = True
+                else:
+                    # <<< here-string: the next word is data, not a file
+                    self.pos += 1
+                    data, _ = self._read_word()
+                    self.stdin.append(data)
+                self.end = self.pos
+            elif (op := self._match(_REDIRECTS)) is not None:
+                self._begin(self.pos)
+                self.pos += len(op)
+                target, _ = self._read_word()
+                if target and not (op in (">&", "<&") and (target.isdigit() or target == "-")):
+                    self.redirects.append(target)
+                self.end = self.pos
+            elif (op := self._match(_SEPARATORS)) is not None:
+                self._flush()
+                self.pos += len(op)
+                if op in ("|", "|&"):
+                    if self.commands:
+                        previous = self.commands[-1]
+                        self.upstream = previous.upstream + previous.args
+                else:
+                    self.upstream = ()
+                    self.pipeline += 1
+                if op == "\n":
+                    self._skip_heredoc_bodies()
+            else:
+                start = self.pos
+                word, quoted = self._read_word()
+                if (
+                    not quoted and word.isdigit()
+                    and self.pos < len(src) and src[self.pos] in "<>"
+                ):
+                    # "2>file": the digits are a file descriptor
+                    continue
+                self._begin(start)
+                self.words.append(word)
+                self.end = self.pos
+
+        self._flush()
+        return self.commands + self.nested
+
+    def _match(self, ops: tuple[str, ...]) -> str | None:
+        for op in ops:
+            if self.src.startswith(op, self.pos):
+                return op
+        return None
+
+    def _begin(self, pos: int) -> None:
+        if self.start is None:
+            self.start = pos
+
+    def _flush(self) -> None:
+        if self.words or self.redirects or self.stdin or self.has_heredoc:
+            words = tuple(self.words)
+            cmd = SimpleCommand(
+                words, find_program(words), tuple(self.redirects), self.src[self.start:self.end],
+                self.upstream, tuple(self.stdin),
+            )
+            self.commands.append(cmd)
+            self.pipelines.append(self.pipeline)
+            code = shell_code(cmd)
+            if cmd.program in _SHELLS:
+                code += cmd.stdin
+            for text in code:
+                self.nested.extend(lex(text))
+        self.words = []
+        self.redirects = []
+        self.stdin = []
+        self.has_heredoc = False
+        self.start = None
+
+    def _skip_heredoc_bodies(self) -> None:
+        """
+        After a newline, read the bodies of pending here-docs into the commands
+        that read them; a body that reaches a shell (bash <<EOF, cat <<EOF | sh)
+        is lexed as commands too.
+        """
+        src = self.src
+        for delimiter, strip_tabs, owner in self.heredocs:
+            lines = []
+            while self.pos < len(src):
+                newline = src.find("\n", self.pos)
+                line_end = len(src) if newline < 0 else newline
+                line = src[self.pos:line_end]
+                self.pos = line_end + 1
+                if strip_tabs:
+                    line = line.lstrip("\t")
+                if line == delimiter:
+                    break
+                lines.append(line)
+            if owner >= len(self.commands):
+                continue
+            body = "\n".join(lines)
+            cmd = self.commands[owner]
+            self.commands[owner] = cmd._replace(stdin=cmd.stdin + (body,))
+            pipeline = self.pipelines[owner]
+            if any(
+                later.program in _SHELLS
+                for later, number in zip(self.commands[owner:], self.pipelines[owner:])
+                if number == pipeline
+            ):
+                self.nested.extend(lex(body))
+        self.heredocs = []
+
+    def _read_word(self) -> tuple[str, bool]:
+        """Read one word at pos (after blanks). Returns (value, had_quotes)."""
+        src = self.src
+        while self.pos < len(src) and src[self.pos] in " \t":
+            self.pos += 1
+
+        parts: list[str] = []
+        quoted = False
+        while self.pos < len(src):
+            plain = _PLAIN_RUN.match(src, self.pos)
+            if plain is not None:
+                parts.append(plain.group())
+                self.pos = plain.end()
+                continue
+            ch = src[self.pos]
+            if ch in _METACHARS:
+                break
+            if ch == "\\":
+                if self.pos + 1 < len(src) and src[self.pos + 1] != "\n":
+                    parts.append(src[self.pos + 1])
+                self.pos += 2
+            elif ch == "'":
+                quoted = True
+                close = src.find("'", self.pos + 1)
+                close = len(src) if close < 0 else close
+                parts.append(src[self.pos + 1:close])
+                self.pos = close + 1
+            elif ch == '"':
+                quoted = True
+                self.pos += 1
+                parts.append(self._read_double_quoted())
+            elif ch == "$" and src.startswith(("$(", "${"), self.pos):
+                start = self.pos
+                if src.startswith("$((", self.pos):
+                    self.pos = self._balanced(self.pos + 3, "(", ")", depth=2)
+                elif src.startswith("${", self.pos):
+                    self.pos = self._balanced(self.pos + 2, "{", "}")
+                else:
+                    self.pos = self._substitution(self.pos + 2)
+                parts.append(src[start:self.pos])
+            elif ch == "`":
+                start = self.pos
+                self.pos = self._backticks(self.pos + 1)
+                parts.append(src[start:self.pos])
+            else:
+                parts.append(ch)
+                self.pos += 1
+        self.pos = min(self.pos, len(src))
+        return "".join(parts), quoted
+
+    def _read_double_quoted(self) -> str:
+        """Read up to the closing double quote (pos is just past the opening one)."""
+        src = self.src
+        parts: list[str] = []
+        while self.pos < len(src):
+            plain = _PLAIN_DQ_RUN.match(src, self.pos)
+            if plain is not None:
+                parts.append(plain.group())
+                self.pos = plain.end()
+                continue
+            ch = src[self.pos]
+            if ch == '"':
+                self.pos += 1
+                break
+            if ch == "\\" and self.pos + 1 < len(src) and src[self.pos + 1] in '$`"\\\n':
+                if src[self.pos + 1] != "\n":
+                    parts.append(src[self.pos + 1])
+                self.pos += 2
+            elif src.startswith("$(", self.pos) and not src.startswith("$((", self.pos):
+                start = self.pos
+                self.pos = self._substitution(self.pos + 2)
+                parts.append(src[start:self.pos])
+            elif ch == "`":
+                start = self.pos
+                self.pos = self._backticks(self.pos + 1)
+                parts.append(src[start:self.pos])
+            else:
+                parts.append(ch)
+                self.pos += 1
+        return "".join(parts)
+
+    def _substitution(self, inner_start: int) -> int:
+        """Lex the commands of $( ... ) / <( ... ); return the position after ')'."""
+        close = self._balanced(inner_start, "(", ")")
+        inner_end = close - 1 if self.src[close - 1:close] == ")" else close
+        self.nested.extend(lex(self.src[inner_start:inner_end]))
+        return close
+
+    def _backticks(self, inner_start: int) -> int:
+        """Lex the commands of `...`; return the position after the closing backtick."""
+        src = self.src
+        i = inner_start
+        while i < len(src) and src[i] != "`":
+            i += 2 if src[i] == "\\" else 1
+        self.nested.extend(lex(src[inner_start:min(i, len(src))].replace("\\`", "`")))
+        return min(i + 1, len(src))
+
+    def _balanced(self, i: int, opener: str, closer: str, depth: int = 1) -> int:
+        """Position just past the closer that balances depth, skipping quoted text."""
+        src = self.src
+        while i < len(src):
+            ch = src[i]
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == "'":
+                close = src.find("'", i + 1)
+                i = len(src) if close < 0 else close + 1
+                continue
+            if ch == '"':
+                i += 1
+                while i < len(src) and src[i] != '"':
+                    i += 2 if src[i] == "\\" else 1
+                i += 1
+                continue
+            if ch == opener:
+                depth += 1
+            elif ch == closer:
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            i += 1
+        return len(src)
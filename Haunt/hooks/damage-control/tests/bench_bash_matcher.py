@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: bash pattern matching at 10 / 100 / 1000 rules.
+
+Compares the original one-re.search-per-rule loop with BashPatternMatcher
+(merged alternation, lowest-index rule wins) on a mix of commands, and
+checks that both pick the same rule for every command.
+
+Usage:
+  python3 Haunt/hooks/damage-control/tests/bench_bash_matcher.py [--iterations N]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import damage_control  # noqa: E402
+
+COMMANDS = [
+    "ls -la",
+    "git status && git diff --stat",
+    "npm test -- --watch=false",
+    "rm -rf /",
+    "rm -rf node_modules",
+    "chmod 777 deploy.sh",
+    "psql -c 'DELETE FROM users;'",
+    "python3 -m pytest -q tests/ 2>&1 | tail -20",
+    "tool42 --danger42 now",
+    "echo tool999 --danger999",
+]
+
+
+def policy_rules(count: int) -> list[str]:
+    """The shipped patterns, padded with synthetic rules (plus one unmergeable) up to count."""
+    base = [rule["pattern"] for rule in damage_control.load_policy().bash_patterns]
+    rules = base + [r"(\w+)\s+\1\s+--twice"]
+    index = 0
+    while len(rules) < count:
+        rules.append(rf"\btool{index}\s+--danger{index}\b")
+        index += 1
+    return rules[:count]
+
+
+def loop_first_match(rules: list[str], command: str) -> int | None:
+    """Original behavior: re.search each rule in order."""
+    for index, pattern in enumerate(rules):
+        if re.search(pattern, command, re.IGNORECASE):
+            return index
+    return None
+
+
+def bench(func, iterations: int) -> float:
+    """Microseconds per command."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for command in COMMANDS:
+            func(command)
+    return (time.perf_counter() - start) / (iterations * len(COMMANDS)) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'rules':>6} {'loop us/cmd':>12} {'merged us/cmd':>14} {'build ms':>9} {'speedup':>8}")
+    for count in (10, 100, 1000):
+        rules = policy_rules(count)
+
+        start = time.perf_counter()
+        matcher = damage_control.BashPatternMatcher(rules)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        for command in COMMANDS:
+            expected = loop_first_match(rules, command)
+            actual = matcher.first_match(command)
+            if expected != actual:
+                print(f"MISMATCH at {count} rules for {command!r}: loop={expected} merged={actual}")
+                return 1
+
+        loop_us = bench(lambda command: loop_first_match(rules, command), args.iterations)
+        merged_us = bench(matcher.first_match, args.iterations)
+        print(f"{count:>6} {loop_us:>12.1f} {merged_us:>14.1f} {build_ms:>9.1f} {loop_us / merged_us:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
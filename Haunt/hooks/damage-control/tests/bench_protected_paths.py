@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: protected path checks for commands with many path arguments.
+
+Compares the original check (Path.resolve() per argument, then a startswith
+scan over every protected entry) with the trie-backed ProtectedPaths and
+memoized realpath(), for rm commands with 1 / 10 / 50 paths, and checks that
+both flag the same commands (the original also flags sibling names such as
+~/.sshkeys, which the benchmark avoids).
+
+Then times a MultiEdit batch touching 200 files: one evaluate() call (one
+trie walk per path list) against 200 single-file Edit evaluations.
+
+Usage:
+  python3 Haunt/hooks/damage-control/tests/bench_protected_paths.py [--iterations N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import damage_control  # noqa: E402
+from protected_paths import clear_realpath_memo  # noqa: E402
+
+
+def command_for(count: int, protected: bool) -> str:
+    """rm over count build outputs, optionally ending in a protected path."""
+    paths = [f"build/pkg{i % 5}/module_{i}.o" for i in range(count)]
+    if protected:
+        paths[-1] = ".git/config"
+    return "rm -f " + " ".join(paths)
+
+
+def original_check(commands, entries) -> bool:
+    """Original behavior: resolve each path, scan every entry with startswith."""
+    resolved_entries = [str(Path(os.path.expandvars(os.path.expanduser(e["path"]))).resolve()) for e in entries]
+    for cmd in commands:
+        for path in damage_control.deletion_targets(cmd):
+            expanded = str(Path(os.path.expandvars(os.path.expanduser(path))).resolve())
+            if any(expanded.startswith(entry) for entry in resolved_entries):
+                return True
+    return False
+
+
+def trie_check(commands, protected) -> bool:
+    clear_realpath_memo()
+    return damage_control.check_no_delete_paths(commands, protected)[0]
+
+
+def bench(func, iterations: int) -> float:
+    """Microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    policy = damage_control.load_policy()
+    entries = policy.compiled["noDeletePaths"]
+    protected = policy.protected_paths("noDeletePaths", "bash")
+
+    print(f"{'paths':>6} {'original us':>12} {'trie us':>8} {'speedup':>8}")
+    for count in (1, 10, 50):
+        for flagged in (False, True):
+            commands = damage_control.lex(command_for(count, flagged))
+            expected = original_check(commands, entries)
+            actual = trie_check(commands, protected)
+            if expected != actual:
+                print(f"MISMATCH for {count} paths (protected={flagged}): original={expected} trie={actual}")
+                return 1
+
+        commands = damage_control.lex(command_for(count, False))
+        original_us = bench(lambda: original_check(commands, entries), args.iterations)
+        trie_us = bench(lambda: trie_check(commands, protected), args.iterations)
+        print(f"{count:>6} {original_us:>12.1f} {trie_us:>8.1f} {original_us / trie_us:>7.1f}x")
+
+    files = [f"src/pkg{i % 5}/module_{i}.py" for i in range(200)]
+    batch = json.dumps({
+        "tool_name": "MultiEdit",
+        "tool_input": {"edits": [{"file_path": path, "old_string": "a", "new_string": "b"} for path in files]},
+    }).encode()
+    singles = [
+        json.dumps({"tool_name": "Edit", "tool_input": {"file_path": path}}).encode() for path in files
+    ]
+    if damage_control.evaluate(batch, policy).exit_code != 0:
+        print("MISMATCH: 200-file batch edit blocked")
+        return 1
+    iterations = max(1, args.iterations // 50)
+    batch_us = bench(lambda: damage_control.evaluate(batch, policy), iterations)
+    singles_us = bench(lambda: [damage_control.evaluate(payload, policy) for payload in singles], iterations)
+    print(f"\n200-file edit: {singles_us:.0f} us as 200 Edit calls, {batch_us:.0f} us as one MultiEdit batch "
+          f"({singles_us / batch_us:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
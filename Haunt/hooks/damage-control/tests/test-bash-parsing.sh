@@ -0,0 +1,177 @@
+#!/bin/bash
+# Damage Control Bash Parsing Test Suite
+# Runs the Bash hook in-process from the source tree and checks how commands
+# are lexed: quoting, $(...), wrappers, redirects, here-docs, shell code
+# (bash -c, eval, here-docs fed to a shell), the deleting commands (rm,
+# find -delete, git rm, mv ... /dev/null, xargs rm), and message options
+# that must not hide the paths after them.
+
+set -e
+
+SOURCE_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+WORK_DIR="$(mktemp -d)"
+PYTHON="${PYTHON:-python3}"
+
+export HAUNT_DAMAGE_CONTROL_DAEMON=0
+export HAUNT_DAMAGE_CONTROL_CACHE=0
+
+# Color codes
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+PASS_COUNT=0
+FAIL_COUNT=0
+
+cleanup() {
+    rm -rf "$WORK_DIR"
+}
+trap cleanup EXIT
+
+pass() { echo -e "${GREEN}✓ PASS${NC}: $1"; PASS_COUNT=$((PASS_COUNT + 1)); }
+fail() { echo -e "${RED}✗ FAIL${NC}: $1"; FAIL_COUNT=$((FAIL_COUNT + 1)); }
+
+# Run the Bash hook on a command from $WORK_DIR and compare its exit code
+expect() {
+    local expected="$1"
+    local command="$2"
+    local test_name="$3"
+    local json_input code
+
+    json_input=$("$PYTHON" -c 'import json, sys; print(json.dumps({"tool_name": "Bash", "tool_input": {"command": sys.argv[1]}}))' "$command")
+    set +e
+    (cd "$WORK_DIR" && echo "$json_input" | "$PYTHON" "$SOURCE_DIR/bash-tool-damage-control.py" >/dev/null 2>&1)
+    code=$?
+    set -e
+
+    if [[ "$code" == "$expected" ]]; then
+        pass "$test_name"
+    else
+        fail "$test_name (expected exit $expected, got $code): $command"
+    fi
+}
+
+allowed() { expect 0 "$1" "$2"; }
+blocked() { expect 2 "$1" "$2"; }
+
+echo "========================================="
+echo "Damage Control Bash Parsing Test Suite"
+echo "========================================="
+echo ""
+
+echo -e "${BLUE}Quoting${NC}"
+echo "-----------------------------------------"
+blocked 'cat ~/".ssh"/id_rsa' "quoted pieces of one word are joined"
+blocked 'cat "$HOME/.ssh/id_rsa"' "variables in double quotes are expanded"
+blocked "rm -rf 'src'" "single-quoted delete target"
+allowed 'echo "keys live in ~/.ssh/id_rsa"' "quoted sentence mentioning a path is not a path"
+allowed 'git commit -m "rotate ~/.ssh/id_rsa docs"' "commit message is not a path"
+echo ""
+
+echo -e "${BLUE}Command substitution${NC}"
+echo "-----------------------------------------"
+blocked 'echo $(cat ~/.ssh/id_rsa)' "\$(...) inside an argument"
+blocked 'x="$(rm -rf src)"' "\$(...) inside a quoted assignment"
+blocked 'echo `cat ~/.aws/credentials`' "backquotes"
+allowed 'echo "$(git rev-parse HEAD)"' "harmless substitution"
+echo ""
+
+echo -e "${BLUE}Wrappers${NC}"
+echo "-----------------------------------------"
+blocked 'sudo rm -rf src' "sudo"
+blocked 'sudo -u root cat ~/.aws/credentials' "sudo with a value option"
+blocked 'env FOO=1 cat ~/.ssh/id_rsa' "env with an assignment"
+blocked 'timeout 5 rm -r lib' "timeout"
+blocked 'FOO=1 nice -n 5 rm -rf src' "assignment then nice"
+allowed 'sudo ls /tmp' "sudo on a harmless command"
+echo ""
+
+echo -e "${BLUE}Redirects${NC}"
+echo "-----------------------------------------"
+blocked 'echo key >> ~/.ssh/authorized_keys' "append to a zero-access path"
+blocked 'cat < ~/.ssh/id_rsa' "read a zero-access path from stdin"
+blocked 'echo hello >~/.ssh/config' "redirect target of echo"
+blocked 'echo ~/.ssh/id_rsa > /tmp/x' "echo operand naming a zero-access path"
+blocked 'printf "%s\n" ~/.aws/credentials' "printf operand naming a zero-access path"
+allowed 'ls > /tmp/out.txt 2>&1' "redirect to an unprotected file"
+echo ""
+
+echo -e "${BLUE}Here-documents${NC}"
+echo "-----------------------------------------"
+blocked $'cat <<EOF\n~/.ssh/id_rsa\nEOF' "paths in a here-doc body"
+allowed $'cat <<EOF > notes.txt\nHost example\nEOF' "here-doc body without paths"
+blocked $'cat <<EOF > ~/.ssh/config\nHost x\nEOF' "here-doc written to a zero-access path"
+blocked $'cat <<\'EOF\'\nrm -rf src\nEOF\nrm -rf src' "command after a here-doc"
+blocked $'bash <<EOF\ncat ~/.ssh/id_rsa\nEOF' "here-doc run by a shell"
+blocked 'bash <<< cat\ ~/.ssh/id_rsa' "here-string run by a shell"
+blocked $'python3 - <<EOF\nprint(open(\'~/.ssh/id_rsa\').read())\nEOF' "path in a here-doc script"
+blocked $'sh <<-EOF\n\trm -rf src\n\tEOF' "deletion in a <<- here-doc run by a shell"
+blocked $'cat <<EOF | bash\nrm -rf src\nEOF' "here-doc piped into a shell"
+echo ""
+
+echo -e "${BLUE}Shell code operands${NC}"
+echo "-----------------------------------------"
+blocked "bash -c 'cat ~/.ssh/id_rsa'" "bash -c"
+blocked "sh -ec 'rm -rf src'" "sh with a -c option bundle"
+blocked "bash -o pipefail -c 'rm -rf lib | cat'" "bash -o <option> -c"
+blocked "eval 'rm -rf src'" "eval"
+allowed "bash -c 'ls build'" "harmless bash -c"
+echo ""
+
+echo -e "${BLUE}find -delete${NC}"
+echo "-----------------------------------------"
+blocked "find src -name '*.pyc' -delete" "find -delete under a no-delete path"
+blocked 'find lib -type f -exec rm {} +' "find -exec rm"
+allowed 'find build -name "*.o" -delete' "find -delete elsewhere"
+allowed 'find src -name "*.py"' "find without delete"
+echo ""
+
+echo -e "${BLUE}git rm${NC}"
+echo "-----------------------------------------"
+blocked 'git rm -r src/old' "git rm"
+blocked 'git -C . rm --cached src/app.py' "git -C <dir> rm"
+allowed 'git rm build/output.o' "git rm elsewhere"
+allowed 'git status src' "other git subcommands"
+echo ""
+
+echo -e "${BLUE}mv ... /dev/null${NC}"
+echo "-----------------------------------------"
+blocked 'mv src/app.py /dev/null' "mv into /dev/null"
+allowed 'mv build/a.o build/b.o' "plain mv"
+echo ""
+
+echo -e "${BLUE}Message options${NC}"
+echo "-----------------------------------------"
+blocked 'tar -cf /tmp/x.tar -m ~/.ssh' "tar -m is not a message option"
+blocked 'zip -r /tmp/x.zip -m ~/.ssh/id_rsa' "zip -m is not a message option"
+blocked 'foo -m ~/.ssh/id_rsa' "unknown program with -m"
+allowed 'git commit -am "move ~/.ssh notes"' "git commit -am"
+allowed 'git -C . commit --message="fix ~/.aws docs"' "git -C <dir> commit --message="
+allowed 'git tag -a v1 -m "drop ~/.gnupg"' "git tag -m"
+echo ""
+
+echo -e "${BLUE}xargs${NC}"
+echo "-----------------------------------------"
+blocked 'echo src | xargs rm -rf' "operands piped into xargs rm"
+blocked 'find src -print0 | xargs -0 rm -f' "find output piped into xargs rm"
+blocked 'echo lib | sort | sudo xargs -n1 git rm -r' "operands two stages up"
+allowed 'echo build | xargs rm -rf' "xargs rm elsewhere"
+allowed 'echo src; ls build | xargs rm -f' "operands of an earlier pipeline do not count"
+allowed 'echo src | xargs grep TODO' "xargs with a harmless program"
+echo ""
+
+echo "========================================="
+echo "Test Results"
+echo "========================================="
+echo -e "${GREEN}Passed: $PASS_COUNT${NC}"
+echo -e "${RED}Failed: $FAIL_COUNT${NC}"
+echo ""
+
+if [ "$FAIL_COUNT" -eq 0 ]; then
+    echo -e "${GREEN}All tests passed!${NC}"
+    exit 0
+else
+    echo -e "${RED}Some tests failed${NC}"
+    exit 1
+fi
@@ -37,7 +37,7 @@ EOF
 
     # Run hook and capture exit code
     set +e
-    echo "$json_input" | uv run "$BASH_HOOK" > /dev/null 2>&1
+    echo "$json_input" | python3 "$BASH_HOOK" > /dev/null 2>&1
     local actual_exit=$?
     set -e
 
@@ -70,7 +70,7 @@ EOF
 
     # Run hook and capture exit code
     set +e
-    echo "$json_input" | uv run "$EDIT_HOOK" > /dev/null 2>&1
+    echo "$json_input" | python3 "$EDIT_HOOK" > /dev/null 2>&1
     local actual_exit=$?
     set -e
 
@@ -0,0 +1,263 @@
+#!/bin/bash
+# Damage Control Policy Daemon Test Suite
+# Runs the hooks from the source tree against a private daemon socket and
+# checks that daemon answers match in-process evaluation, that patterns.yaml
+# edits are picked up, that the decision cache answers repeated calls
+# and is invalidated by patterns.yaml edits, and reports per-call hook latency.
+
+set -e
+
+SOURCE_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+WORK_DIR="$(mktemp -d)"
+HOOKS_DIR="$WORK_DIR/hooks"
+PYTHON="${PYTHON:-python3}"
+
+export HAUNT_DAMAGE_CONTROL_SOCKET="$WORK_DIR/policy.sock"
+export HAUNT_DAMAGE_CONTROL_CACHE_FILE="$WORK_DIR/decisions.sqlite"
+
+# Color codes
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+PASS_COUNT=0
+FAIL_COUNT=0
+DAEMON_PID=""
+
+cleanup() {
+    [[ -n "$DAEMON_PID" ]] && kill "$DAEMON_PID" 2>/dev/null || true
+    rm -rf "$WORK_DIR"
+}
+trap cleanup EXIT
+
+pass() { echo -e "${GREEN}✓ PASS${NC}: $1"; PASS_COUNT=$((PASS_COUNT + 1)); }
+fail() { echo -e "${RED}✗ FAIL${NC}: $1"; FAIL_COUNT=$((FAIL_COUNT + 1)); }
+
+# Run a hook; prints "<exit>|<stdout>|<stderr>"
+run_hook() {
+    local hook="$1"
+    local json_input="$2"
+    local out err code
+    set +e
+    out=$(echo "$json_input" | "$PYTHON" "$HOOKS_DIR/$hook-tool-damage-control.py" 2>"$WORK_DIR/stderr")
+    code=$?
+    set -e
+    err=$(cat "$WORK_DIR/stderr")
+    echo "$code|$out|$err"
+}
+
+# Compare daemon and in-process answers for one input
+test_parity() {
+    local hook="$1"
+    local json_input="$2"
+    local test_name="$3"
+
+    local via_daemon in_process
+    via_daemon=$(run_hook "$hook" "$json_input")
+    in_process=$(HAUNT_DAMAGE_CONTROL_DAEMON=0 run_hook "$hook" "$json_input")
+
+    if [[ "$via_daemon" == "$in_process" ]]; then
+        pass "$test_name (exit ${via_daemon%%|*})"
+    else
+        fail "$test_name (daemon: $via_daemon / in-process: $in_process)"
+    fi
+}
+
+wait_for_socket() {
+    for _ in $(seq 1 50); do
+        [[ -S "$HAUNT_DAMAGE_CONTROL_SOCKET" ]] && return 0
+        sleep 0.1
+    done
+    return 1
+}
+
+echo "========================================="
+echo "Damage Control Policy Daemon Tests"
+echo "========================================="
+
+mkdir -p "$HOOKS_DIR"
+cp "$SOURCE_DIR"/*.py "$SOURCE_DIR/patterns.yaml" "$HOOKS_DIR/"
+
+echo ""
+echo -e "${BLUE}Autostart${NC}"
+echo "-----------------------------------------"
+run_hook bash '{"tool_input": {"command": "ls"}}' > /dev/null
+if wait_for_socket; then
+    pass "First hook call starts the daemon"
+else
+    fail "First hook call starts the daemon"
+fi
+DAEMON_PID=$(pgrep -f "policy_daemon.py --socket $HAUNT_DAMAGE_CONTROL_SOCKET" | head -1 || true)
+
+echo ""
+echo -e "${BLUE}Daemon matches in-process evaluation${NC}"
+echo "-----------------------------------------"
+test_parity bash '{"tool_input": {"command": "ls -la"}}' "Safe command"
+test_parity bash '{"tool_input": {"command": "rm -rf /"}}' "rm -rf / blocked"
+test_parity bash '{"tool_input": {"command": "rm -rf ~"}}' "rm -rf ~ blocked"
+test_parity bash '{"tool_input": {"command": "cat ~/.ssh/id_rsa"}}' "Zero-access path blocked"
+test_parity bash '{"tool_input": {"command": "rm -rf .git"}}' "No-delete path blocked"
+test_parity bash '{"tool_input": {"command": "rm -rf node_modules"}}' "Specific deletion"
+test_parity bash 'not json' "Invalid JSON blocked"
+test_parity edit '{"tool_input": {"file_path": "~/.ssh/config"}}' "Edit zero-access path"
+test_parity edit '{"tool_input": {"file_path": "~/.claude/rules/x.md"}}' "Edit read-only path"
+test_parity edit '{"tool_input": {"file_path": "/tmp/safe.txt"}}' "Edit safe path"
+test_parity edit '{"tool_input": {}}' "Edit missing file_path"
+test_parity write '{"tool_input": {"file_path": "~/.aws/credentials"}}' "Write zero-access path"
+test_parity write '{"tool_input": {"file_path": "/tmp/safe.txt"}}' "Write safe path"
+
+test_parity bash '{"tool_input": {"command": "cat ~/.sshkeys"}}' "Sibling of a zero-access path allowed"
+test_parity edit '{"tool_name": "MultiEdit", "tool_input": {"file_path": "/tmp/a.txt", "edits": [{"file_path": "/tmp/b.txt"}, {"file_path": "~/.ssh/config"}]}}' "MultiEdit batch with a zero-access target"
+test_parity edit '{"tool_name": "NotebookEdit", "tool_input": {"notebook_path": "/tmp/safe.ipynb"}}' "NotebookEdit safe path"
+
+echo ""
+echo -e "${BLUE}Errors block in every hook${NC}"
+echo "-----------------------------------------"
+for hook in bash edit write; do
+    result=$(run_hook "$hook" 'not json')
+    if [[ "${result%%|*}" == "2" ]]; then
+        pass "$hook hook blocks invalid input"
+    else
+        fail "$hook hook blocks invalid input (got $result)"
+    fi
+done
+
+echo ""
+echo -e "${BLUE}Paths resolve against the hook's working directory${NC}"
+echo "-----------------------------------------"
+mkdir -p "$WORK_DIR/project"
+ln -s "$HOME/.ssh" "$WORK_DIR/project/keys"
+result=$(cd "$WORK_DIR/project" && run_hook bash '{"tool_input": {"command": "cat keys/id_rsa"}}')
+if [[ "${result%%|*}" == "2" ]]; then
+    pass "Relative symlink into ~/.ssh blocked via the daemon"
+else
+    fail "Relative symlink into ~/.ssh blocked via the daemon (got $result)"
+fi
+result=$(cd "$WORK_DIR/project" && run_hook edit '{"tool_input": {"file_path": "keys/config"}}')
+if [[ "${result%%|*}" == "2" ]]; then
+    pass "Relative edit through the symlink blocked via the daemon"
+else
+    fail "Relative edit through the symlink blocked via the daemon (got $result)"
+fi
+
+# Number of cached allow decisions
+cached_count() {
+    "$PYTHON" -c 'import sqlite3, sys; print(sqlite3.connect(sys.argv[1]).execute("SELECT count(*) FROM decisions").fetchone()[0])' \
+        "$HAUNT_DAMAGE_CONTROL_CACHE_FILE" 2>/dev/null || echo 0
+}
+
+echo ""
+echo -e "${BLUE}Decision cache${NC}"
+echo "-----------------------------------------"
+before=$(cached_count)
+HAUNT_DAMAGE_CONTROL_DAEMON=0 run_hook bash '{"session_id": "a", "tool_input": {"command": "frobnicate now"}}' > /dev/null
+after=$(cached_count)
+if [[ "$after" -gt "$before" ]]; then
+    pass "Allow decision recorded"
+else
+    fail "Allow decision recorded ($before -> $after entries)"
+fi
+if echo '{"session_id": "b", "tool_input": {"command": "frobnicate now"}}' | HAUNT_DAMAGE_CONTROL_DAEMON=0 \
+    "$PYTHON" -X importtime "$HOOKS_DIR/bash-tool-damage-control.py" 2>&1 | grep -q '| *damage_control$'; then
+    fail "Repeated call answered from the cache"
+else
+    pass "Repeated call answered from the cache"
+fi
+if echo '{"tool_name": "Bash", "tool_input": {"command": "frobnicate now", "description": "again", "timeout": 60000}}' \
+    | HAUNT_DAMAGE_CONTROL_DAEMON=0 "$PYTHON" -X importtime "$HOOKS_DIR/bash-tool-damage-control.py" 2>&1 \
+    | grep -q '| *damage_control$'; then
+    fail "Same command with another description and timeout answered from the cache"
+else
+    pass "Same command with another description and timeout answered from the cache"
+fi
+before=$(cached_count)
+HAUNT_DAMAGE_CONTROL_DAEMON=0 run_hook bash '{"tool_input": {"command": "rm -f build.log"}}' > /dev/null
+HAUNT_DAMAGE_CONTROL_DAEMON=0 run_hook bash '{"tool_input": {"command": "cat ~/.ssh/id_rsa"}}' > /dev/null
+after=$(cached_count)
+if [[ "$after" == "$before" ]]; then
+    pass "Deletions and blocks are not cached"
+else
+    fail "Deletions and blocks are not cached ($before -> $after entries)"
+fi
+
+echo ""
+echo -e "${BLUE}Reload on patterns.yaml change${NC}"
+echo "-----------------------------------------"
+cat >> "$HOOKS_DIR/patterns.yaml" <<'EOF'
+
+# Added by test-policy-daemon.sh
+bashToolPatterns:
+  - pattern: '\bfrobnicate\b'
+    reason: "frobnicate is not allowed"
+EOF
+result=$(run_hook bash '{"tool_input": {"command": "frobnicate now"}}')
+if [[ "${result%%|*}" == "2" ]]; then
+    pass "New pattern applies on the next call"
+else
+    fail "New pattern applies on the next call (got $result)"
+fi
+
+result=$(HAUNT_DAMAGE_CONTROL_DAEMON=0 run_hook bash '{"tool_input": {"command": "frobnicate now"}}')
+if [[ "${result%%|*}" == "2" ]]; then
+    pass "In-process evaluation recompiles the artifact (cached allow invalidated)"
+else
+    fail "In-process evaluation recompiles the artifact (cached allow invalidated) (got $result)"
+fi
+
+echo ""
+echo -e "${BLUE}Compiled policy artifact${NC}"
+echo "-----------------------------------------"
+if [[ -f "$HOOKS_DIR/patterns.compiled.json" ]]; then
+    pass "patterns.compiled.json written next to the hooks"
+else
+    fail "patterns.compiled.json written next to the hooks"
+fi
+if echo '{"tool_input": {"command": "ls"}}' | HAUNT_DAMAGE_CONTROL_DAEMON=0 \
+    "$PYTHON" -X importtime "$HOOKS_DIR/bash-tool-damage-control.py" 2>&1 | grep -q '| *yaml$'; then
+    fail "In-process evaluation imports PyYAML"
+else
+    pass "In-process evaluation does not import PyYAML"
+fi
+
+echo ""
+echo -e "${BLUE}Latency (median of 20 calls)${NC}"
+echo "-----------------------------------------"
+"$PYTHON" - "$HOOKS_DIR/bash-tool-damage-control.py" <<'PYEOF'
+import os, statistics, subprocess, sys, time
+
+hook = sys.argv[1]
+payload = b'{"tool_input": {"command": "git status && ls -la src"}}'
+
+def median_ms(argv, env):
+    times = []
+    for _ in range(20):
+        start = time.perf_counter()
+        subprocess.run(argv, input=payload, env=env, capture_output=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+env = dict(os.environ)
+print(f"  interpreter only: {median_ms([sys.executable, '-c', 'pass'], env):6.1f} ms")
+print(f"  via daemon:       {median_ms([sys.executable, hook], env):6.1f} ms")
+env["HAUNT_DAMAGE_CONTROL_DAEMON"] = "0"
+print(f"  cache hit:        {median_ms([sys.executable, hook], env):6.1f} ms")
+env["HAUNT_DAMAGE_CONTROL_CACHE"] = "0"
+print(f"  in-process:       {median_ms([sys.executable, hook], env):6.1f} ms")
+PYEOF
+
+echo ""
+echo "========================================="
+echo "Test Results"
+echo "========================================="
+echo -e "${GREEN}Passed: $PASS_COUNT${NC}"
+echo -e "${RED}Failed: $FAIL_COUNT${NC}"
+echo ""
+
+if [ "$FAIL_COUNT" -eq 0 ]; then
+    echo -e "${GREEN}All tests passed!${NC}"
+    exit 0
+else
+    echo -e "${RED}Some tests failed${NC}"
+    exit 1
+fi
@@ -3,7 +3,11 @@
 # haunt-secrets.sh - Load secrets from 1Password and export as environment variables
 #
 # Usage:
-#   source Haunt/scripts/haunt-secrets.sh [.env file path]
+#   source Haunt/scripts/haunt-secrets.sh [--profile] [.env file path]
+#
+# Options:
+#   --profile  Print how long each `op read` took (per reference and per vault,
+#              slowest first) to stderr. References only, never values.
 #
 # This script reads a .env file, detects secret tags (# @secret:op:vault/item/field),
 # fetches secrets from 1Password using `op read`, and exports them as environment variables.
@@ -23,7 +27,24 @@
 set -e
 
 # Default .env file location
-ENV_FILE="${1:-.env}"
+ENV_FILE=".env"
+HAUNT_PROFILE=""
+for arg in "$@"; do
+    case "$arg" in
+        --profile) HAUNT_PROFILE=1 ;;
+        *) ENV_FILE="$arg" ;;
+    esac
+done
+
+# Microseconds since the epoch (whole seconds on bash < 5)
+_haunt_now_us() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        local now="${EPOCHREALTIME/[.,]/}"
+        echo "$((10#$now))"
+    else
+        echo "$(( $(date +%s) * 1000000 ))"
+    fi
+}
 
 # Validate OP_SERVICE_ACCOUNT_TOKEN exists
 if [[ -z "${OP_SERVICE_ACCOUNT_TOKEN:-}" ]]; then
@@ -48,6 +69,10 @@ fi
 prev_line=""
 secret_ref=""
 
+# --profile: one "<microseconds> op://<reference>" line per op read
+profile_lines=""
+profile_start=$(_haunt_now_us)
+
 # Process .env file line by line
 while IFS= read -r line || [[ -n "$line" ]]; do
     # Detect secret tag: # @secret:op:vault/item/field
@@ -70,10 +95,14 @@ while IFS= read -r line || [[ -n "$line" ]]; do
         # Check if previous line was a secret tag
         if [[ -n "$secret_ref" ]]; then
             # Fetch secret from 1Password
+            fetch_start=$(_haunt_now_us)
             if ! secret_value=$(op read "op://${secret_ref}" 2>/dev/null); then
                 echo "ERROR: Failed to read secret from 1Password: op://${secret_ref}" >&2
                 return 2 2>/dev/null || exit 2
             fi
+            if [[ -n "$HAUNT_PROFILE" ]]; then
+                profile_lines+="$(( $(_haunt_now_us) - fetch_start )) op://${secret_ref}"$'\n'
+            fi
             # Export secret using eval for compatibility
             eval export "${var_name}=\"\${secret_value}\""
             secret_ref=""  # Reset after processing
@@ -90,5 +119,22 @@ while IFS= read -r line || [[ -n "$line" ]]; do
     fi
 done < "$ENV_FILE"
 
+# Profile breakdown on stderr (references and timings only)
+if [[ -n "$HAUNT_PROFILE" ]]; then
+    {
+        echo "haunt-secrets profile: $(( ($(_haunt_now_us) - profile_start) / 1000 )) ms total"
+        printf '%s' "$profile_lines" | awk '
+            NF { split($2, parts, "/"); vault = parts[1] "//" parts[3]
+                 total[vault] += $1; count[vault]++; reads++ }
+            END { print "op processes: op read=" reads + 0
+                  for (v in total) printf "  %9.1f ms  x%-3d %s\n", total[v] / 1000, count[v], v }' \
+            | { read -r header; echo "$header"; echo "vaults (slowest first):"; sort -rn; }
+        if [[ -n "$profile_lines" ]]; then
+            echo "references (slowest first):"
+            printf '%s' "$profile_lines" | sort -rn | awk '{ printf "  %9.1f ms  %s\n", $1 / 1000, $2 }'
+        fi
+    } >&2
+fi
+
 # Success - no output (security: don't print secrets)
 return 0 2>/dev/null || exit 0
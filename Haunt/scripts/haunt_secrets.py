@@ -26,9 +26,30 @@ Main API Usage:
     >>> secrets = get_secrets(".env")
     >>> token = secrets["GITHUB_TOKEN"]  # actual secret from 1Password
 
+    Batch mode: resolve every tag with a single `op inject` call
+    >>> secrets = get_secrets(".env", batch=True)
+
+    Parallel mode: run up to max_workers `op read` calls at once
+    >>> secrets = get_secrets(".env", max_workers=8)
+
 Lower-level functions:
+- tokenize_env_file(env_file) -> EnvFileTokens (memoized single pass)
 - parse_secret_tags(env_file) -> Dict[str, Tuple[str, str, str]]
 - fetch_secret(vault, item, field) -> str
+- fetch_secrets_batch(secret_tags) -> Dict[str, str]
+- fetch_secrets_parallel(secret_tags, max_workers) -> Dict[str, str]
+- fetch_item_field_names(vault, item) -> Set[str] (field names only; values are received, then discarded)
+
+Validation:
+    >>> result = validate_secrets(".env", metadata_only=True)  # one item lookup per item
+    >>> result.latencies["GITHUB_TOKEN"]  # seconds
+
+Profiling:
+    >>> get_secrets(".env")
+    >>> stats()["fetch"]["vaults"]  # slowest vaults first
+
+    $ python haunt_secrets.py --profile .env      # breakdown on stderr
+    $ python haunt_secrets.py --json .env         # stats() as JSON on stdout
 
 ========== OUTPUT MASKING IMPLEMENTATION (REQ-303) ==========
 
@@ -69,12 +90,19 @@ Test Coverage:
 ==================================================================
 """
 
+import argparse
+import json
 import os
 import re
+import secrets
 import subprocess
+import sys
+import threading
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple, TypeVar
 
 
 # Configure logging
@@ -89,6 +117,20 @@ TAG_SEPARATOR = "/"
 OP_CLI_COMMAND = "op"
 OP_TOKEN_ENV_VAR = "OP_SERVICE_ACCOUNT_TOKEN"
 
+# Default thread count for parallel fetches (1 = serial, original behavior)
+DEFAULT_MAX_WORKERS = 1
+
+# Default thread count for metadata-only validation (item lookups return field names only)
+DEFAULT_METADATA_WORKERS = 8
+
+_T = TypeVar("_T")
+
+# Instrumentation: name -> count, and name -> [count, total seconds, max seconds].
+# Only names and op:// references are recorded, never secret values.
+_COUNTERS: Dict[str, int] = {}
+_TIMERS: Dict[str, List[float]] = {}
+_STATS_LOCK = threading.Lock()
+
 
 # ========== EXCEPTION CLASSES ==========
 
@@ -117,6 +159,25 @@ class SecretNotFoundError(Exception):
     pass
 
 
+class SecretFetchError(Exception):
+    """
+    Exception raised when one or more secrets fail during a parallel fetch.
+
+    Aggregates every per-secret failure instead of stopping at the first one.
+
+    Attributes:
+        errors: List of (var_name, op_reference, exception) tuples in .env order
+    """
+
+    def __init__(self, errors: List[Tuple[str, str, Exception]]):
+        self.errors = errors
+        details = "; ".join(
+            f"{var_name} ({op_ref}): {type(error).__name__}: {error}"
+            for var_name, op_ref, error in errors
+        )
+        super().__init__(f"Failed to fetch {len(errors)} secret(s) from 1Password. {details}")
+
+
 def _validate_tag_format(tag_content: str, line_num: int, full_line: str) -> None:
     """
     Validate tag format and raise SecretTagError with specific error message.
@@ -152,56 +213,105 @@ def _validate_tag_format(tag_content: str, line_num: int, full_line: str) -> Non
     )
 
 
-def parse_secret_tags(env_file: str) -> Dict[str, Tuple[str, str, str]]:
+class EnvFileTokens(NamedTuple):
     """
-    Parse 1Password secret tags from an .env file.
+    Result of one pass over an .env file.
+
+    Attributes:
+        secret_tags: Tagged variables mapped to (vault, item, field)
+        variables: Every VAR=value assignment in file order (value stripped)
+        line_numbers: 1-indexed line of each variable's (last) assignment
+
+    Shared between callers via the memo - treat as read-only.
+    """
+
+    secret_tags: Dict[str, Tuple[str, str, str]]
+    variables: Dict[str, str]
+    line_numbers: Dict[str, int]
+
+
+# Files modified within this window are always re-read: mtime granularity is
+# coarse on most filesystems, so a same-size rewrite could look unchanged
+_RACY_WINDOW_NS = 1_000_000_000
+
+# Memo of tokenized files: absolute path -> ((mtime_ns, size), read_at_ns, tokens)
+_TOKEN_CACHE: Dict[str, Tuple[Tuple[int, int], int, EnvFileTokens]] = {}
+_MAX_CACHED_FILES = 64
+
+# Regex patterns for parsing
+_TAG_PREFIX_PATTERN = re.compile(rf'^\s*#\s*{re.escape(SECRET_TAG_PREFIX)}')
+_TAG_PATTERN = re.compile(
+    rf'^\s*#\s*{re.escape(SECRET_TAG_PREFIX)}'
+    r'([a-zA-Z0-9_-]+)/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_-]+)(?:\s|#|$)'
+)
+_VAR_PATTERN = re.compile(r'^([A-Z_][A-Z0-9_]*)=')
+
+
+def tokenize_env_file(env_file: str) -> EnvFileTokens:
+    """
+    Read and scan an .env file once, collecting secret tags and all assignments.
+
+    Results are memoized by (path, mtime_ns, size), so repeated loads of an
+    unchanged file in a long-lived process cost one stat() call. Files
+    modified within the last second are always re-read.
 
     Args:
         env_file: Path to .env file containing secret tags
 
     Returns:
-        Dictionary mapping variable names to (vault, item, field) tuples.
-        Example: {"GITHUB_TOKEN": ("ghost-county", "api-keys", "github-token")}
+        EnvFileTokens with secret_tags, variables and line_numbers
 
     Raises:
         FileNotFoundError: If env_file does not exist
         SecretTagError: If secret tags are malformed or invalid
-
-    Tag Format:
-        # @secret:op:vault/item/field
-        VAR_NAME=placeholder
-
-    The tag must be immediately followed by a variable assignment on the next line.
     """
-    file_path = Path(env_file)
+    key = os.path.abspath(env_file)
 
-    # Check file exists
-    if not file_path.exists():
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {env_file}")
 
-    # Read file content
-    with open(file_path, 'r') as f:
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        cached_signature, read_at_ns, tokens = cached
+        if cached_signature == signature and read_at_ns - signature[0] > _RACY_WINDOW_NS:
+            _incr("parse.memo_hits")
+            return tokens
+
+    read_at_ns = time.time_ns()
+    started = time.perf_counter()
+    with open(key, 'r') as f:
         lines = f.readlines()
 
-    # Regex patterns for parsing
-    tag_prefix_pattern = re.compile(rf'^\s*#\s*{re.escape(SECRET_TAG_PREFIX)}')
-    tag_pattern = re.compile(
-        rf'^\s*#\s*{re.escape(SECRET_TAG_PREFIX)}'
-        r'([a-zA-Z0-9_-]+)/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_-]+)(?:\s|#|$)'
-    )
-    var_pattern = re.compile(r'^([A-Z_][A-Z0-9_]*)=')
+    tokens = _tokenize_lines(lines)
+    _record_time("parse", time.perf_counter() - started)
+    _incr("parse.files")
+
+    _TOKEN_CACHE.pop(key, None)
+    if len(_TOKEN_CACHE) >= _MAX_CACHED_FILES:
+        del _TOKEN_CACHE[next(iter(_TOKEN_CACHE))]
+    _TOKEN_CACHE[key] = (signature, read_at_ns, tokens)
+
+    return tokens
+
 
-    result: Dict[str, Tuple[str, str, str]] = {}
+def _tokenize_lines(lines: List[str]) -> EnvFileTokens:
+    """Single pass over .env lines; see tokenize_env_file()."""
+    secret_tags: Dict[str, Tuple[str, str, str]] = {}
+    variables: Dict[str, str] = {}
+    line_numbers: Dict[str, int] = {}
     i = 0
 
     while i < len(lines):
         # Check if line contains a secret tag
-        if tag_prefix_pattern.match(lines[i]):
+        if _TAG_PREFIX_PATTERN.match(lines[i]):
             # Extract tag content and remove inline comments
             tag_content = lines[i].split(SECRET_TAG_PREFIX)[1].split('#')[0].strip()
 
             # Validate full tag format
-            tag_match = tag_pattern.match(lines[i])
+            tag_match = _TAG_PATTERN.match(lines[i])
 
             if not tag_match:
                 # Tag has prefix but invalid format - provide specific error
@@ -217,8 +327,7 @@ def parse_secret_tags(env_file: str) -> Dict[str, Tuple[str, str, str]]:
                     f"Secret tag on line {i+1} has no variable assignment following it"
                 )
 
-            next_line_idx = i + 1
-            next_line = lines[next_line_idx].strip()
+            next_line = lines[i + 1].strip()
 
             # Skip blank lines is NOT allowed - tag must be immediately before variable
             if not next_line:
@@ -227,7 +336,7 @@ def parse_secret_tags(env_file: str) -> Dict[str, Tuple[str, str, str]]:
                 )
 
             # Check if next line is a variable assignment
-            var_match = var_pattern.match(next_line)
+            var_match = _VAR_PATTERN.match(next_line)
             if not var_match:
                 raise SecretTagError(
                     f"Secret tag on line {i+1} is not followed by a variable assignment. "
@@ -237,23 +346,56 @@ def parse_secret_tags(env_file: str) -> Dict[str, Tuple[str, str, str]]:
             var_name = var_match.group(1)
 
             # Check for duplicate variable names
-            if var_name in result:
+            if var_name in secret_tags:
                 raise SecretTagError(
                     f"Duplicate secret tag for variable '{var_name}' (line {i+1})"
                 )
 
-            result[var_name] = (vault, item, field)
+            secret_tags[var_name] = (vault, item, field)
 
-            # Skip the variable line since we processed it
-            i += 2
+            # Move to the variable line; it is recorded as an assignment below
+            i += 1
             continue
 
+        line = lines[i].strip()
+
+        # Skip comments, empty lines, and secret tags; record VAR_NAME=value
+        if line and not line.startswith('#') and '=' in line:
+            var_name, value = line.split('=', 1)
+            var_name = var_name.strip()
+            variables[var_name] = value.strip()
+            line_numbers[var_name] = i + 1
+
         i += 1
 
-    return result
+    return EnvFileTokens(secret_tags, variables, line_numbers)
 
 
-def load_secrets(env_file: str) -> None:
+def parse_secret_tags(env_file: str) -> Dict[str, Tuple[str, str, str]]:
+    """
+    Parse 1Password secret tags from an .env file.
+
+    Args:
+        env_file: Path to .env file containing secret tags
+
+    Returns:
+        Dictionary mapping variable names to (vault, item, field) tuples.
+        Example: {"GITHUB_TOKEN": ("ghost-county", "api-keys", "github-token")}
+
+    Raises:
+        FileNotFoundError: If env_file does not exist
+        SecretTagError: If secret tags are malformed or invalid
+
+    Tag Format:
+        # @secret:op:vault/item/field
+        VAR_NAME=placeholder
+
+    The tag must be immediately followed by a variable assignment on the next line.
+    """
+    return dict(tokenize_env_file(env_file).secret_tags)
+
+
+def load_secrets(env_file: str, batch: bool = False, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
     """
     Load secrets from .env file and set them in os.environ.
 
@@ -265,6 +407,9 @@ def load_secrets(env_file: str) -> None:
 
     Args:
         env_file: Path to .env file
+        batch: If True, resolve all tagged secrets with one `op inject` call
+        max_workers: Number of concurrent `op read` calls (1 = serial). When
+            greater than 1, every failure is collected into one SecretFetchError
 
     Returns:
         None - modifies os.environ directly
@@ -276,6 +421,7 @@ def load_secrets(env_file: str) -> None:
         OpNotInstalledError: If op CLI not installed
         AuthenticationError: If 1Password auth fails
         SecretNotFoundError: If vault/item/field not found
+        SecretFetchError: If max_workers > 1 and any secret fails to fetch
 
     Security:
         - Logs variable names loaded, NEVER secret values
@@ -285,33 +431,30 @@ def load_secrets(env_file: str) -> None:
         >>> load_secrets(".env")
         >>> token = os.environ["GITHUB_TOKEN"]  # actual secret value
     """
-    # Parse secret tags
-    secret_tags = parse_secret_tags(env_file)
+    # Tokenize .env once: secret tags and plaintext assignments
+    tokens = tokenize_env_file(env_file)
+    secret_tags = tokens.secret_tags
 
     # Fetch secrets from 1Password
-    secrets_dict = {}
-    for var_name, (vault, item, field) in secret_tags.items():
-        logger.info(f"Loading secret for {var_name}")
-        secret_value = fetch_secret(vault, item, field)
-        secrets_dict[var_name] = secret_value
+    if batch:
+        logger.info(f"Loading {len(secret_tags)} secrets in batch: {', '.join(secret_tags)}")
+        secrets_dict = fetch_secrets_batch(secret_tags)
+    elif max_workers > 1:
+        logger.info(f"Loading {len(secret_tags)} secrets with {max_workers} workers: {', '.join(secret_tags)}")
+        secrets_dict = fetch_secrets_parallel(secret_tags, max_workers=max_workers)
+    else:
+        secrets_dict = {}
+        for var_name, (vault, item, field) in secret_tags.items():
+            logger.info(f"Loading secret for {var_name}")
+            secret_value = fetch_secret(vault, item, field)
+            secrets_dict[var_name] = secret_value
 
-    # Parse plaintext variables from .env file
+    # Plaintext variables (secrets are already fetched)
     plaintext_vars = {}
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            # Skip comments, empty lines, and secret tags
-            if not line or line.startswith('#'):
-                continue
-            # Match VAR_NAME=value pattern
-            if '=' in line:
-                var_name, value = line.split('=', 1)
-                var_name = var_name.strip()
-                value = value.strip()
-                # Only add if not a secret (secrets are already fetched)
-                if var_name not in secrets_dict:
-                    plaintext_vars[var_name] = value
-                    logger.info(f"Loading plaintext variable {var_name}")
+    for var_name, value in tokens.variables.items():
+        if var_name not in secrets_dict:
+            plaintext_vars[var_name] = value
+            logger.info(f"Loading plaintext variable {var_name}")
 
     # Set all variables in os.environ
     for var_name, value in secrets_dict.items():
@@ -323,7 +466,7 @@ def load_secrets(env_file: str) -> None:
     logger.info(f"Loaded {len(secrets_dict)} secrets and {len(plaintext_vars)} plaintext variables")
 
 
-def get_secrets(env_file: str) -> Dict[str, str]:
+def get_secrets(env_file: str, batch: bool = False, max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, str]:
     """
     Get secrets from .env file without modifying os.environ.
 
@@ -335,6 +478,9 @@ def get_secrets(env_file: str) -> Dict[str, str]:
 
     Args:
         env_file: Path to .env file
+        batch: If True, resolve all tagged secrets with one `op inject` call
+        max_workers: Number of concurrent `op read` calls (1 = serial). When
+            greater than 1, every failure is collected into one SecretFetchError
 
     Returns:
         Dict mapping variable names to values (both secrets and plaintext)
@@ -346,6 +492,7 @@ def get_secrets(env_file: str) -> Dict[str, str]:
         OpNotInstalledError: If op CLI not installed
         AuthenticationError: If 1Password auth fails
         SecretNotFoundError: If vault/item/field not found
+        SecretFetchError: If max_workers > 1 and any secret fails to fetch
 
     Security:
         - Logs variable names loaded, NEVER secret values
@@ -355,32 +502,30 @@ def get_secrets(env_file: str) -> Dict[str, str]:
         >>> secrets = get_secrets(".env")
         >>> token = secrets["GITHUB_TOKEN"]  # actual secret value
     """
-    # Parse secret tags
-    secret_tags = parse_secret_tags(env_file)
+    # Tokenize .env once: secret tags and plaintext assignments
+    tokens = tokenize_env_file(env_file)
+    secret_tags = tokens.secret_tags
 
     # Fetch secrets from 1Password
-    secrets_dict = {}
-    for var_name, (vault, item, field) in secret_tags.items():
-        logger.info(f"Fetching secret for {var_name}")
-        secret_value = fetch_secret(vault, item, field)
-        secrets_dict[var_name] = secret_value
-
-    # Parse plaintext variables from .env file
-    plaintext_vars = {}
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            # Skip comments, empty lines, and secret tags
-            if not line or line.startswith('#'):
-                continue
-            # Match VAR_NAME=value pattern
-            if '=' in line:
-                var_name, value = line.split('=', 1)
-                var_name = var_name.strip()
-                value = value.strip()
-                # Only add if not a secret (secrets are already fetched)
-                if var_name not in secrets_dict:
-                    plaintext_vars[var_name] = value
+    if batch:
+        logger.info(f"Fetching {len(secret_tags)} secrets in batch: {', '.join(secret_tags)}")
+        secrets_dict = fetch_secrets_batch(secret_tags)
+    elif max_workers > 1:
+        logger.info(f"Fetching {len(secret_tags)} secrets with {max_workers} workers: {', '.join(secret_tags)}")
+        secrets_dict = fetch_secrets_parallel(secret_tags, max_workers=max_workers)
+    else:
+        secrets_dict = {}
+        for var_name, (vault, item, field) in secret_tags.items():
+            logger.info(f"Fetching secret for {var_name}")
+            secret_value = fetch_secret(vault, item, field)
+            secrets_dict[var_name] = secret_value
+
+    # Plaintext variables (secrets are already fetched)
+    plaintext_vars = {
+        var_name: value
+        for var_name, value in tokens.variables.items()
+        if var_name not in secrets_dict
+    }
 
     # Combine and return
     result = {**secrets_dict, **plaintext_vars}
@@ -391,40 +536,64 @@ def get_secrets(env_file: str) -> Dict[str, str]:
 
 class ValidationResult:
     """Result of validate_secrets() operation"""
-    def __init__(self, success: bool, validated: list = None, missing: list = None):
+    def __init__(self, success: bool, validated: list = None, missing: list = None,
+                 latencies: Dict[str, float] = None):
         self.success = success
         self.validated = validated or []
         self.missing = missing or []
+        # Seconds spent on each variable's 1Password check (shared by
+        # variables that resolve through the same reference or item)
+        self.latencies = latencies or {}
 
 
-def validate_secrets(env_file: str, debug: bool = False) -> ValidationResult:
+def validate_secrets(
+    env_file: str,
+    debug: bool = False,
+    max_workers: Optional[int] = None,
+    metadata_only: bool = False
+) -> ValidationResult:
     """
     Validate that all secrets in .env file are resolvable WITHOUT fetching/exporting them.
 
     This function checks if all tagged secrets can be retrieved from 1Password
     without modifying os.environ or actually storing the secret values.
 
+    By default each unique reference is read with `op read`. With
+    metadata_only=True, fields are grouped by item and each unique item is
+    looked up once with `op item get` (concurrently); a variable is valid if
+    its field exists on the item. `op item get` still sends field values to
+    this process, which holds them in memory until the lookup returns; they
+    are then discarded, never returned, logged or stored.
+
     Args:
         env_file: Path to .env file
         debug: If True, print detailed diagnostics to stderr
+        max_workers: Number of checks run concurrently (default: 1 for
+            value reads, DEFAULT_METADATA_WORKERS for metadata_only)
+        metadata_only: Check item/field existence with `op item get` instead
+            of reading each value (values are still received, then discarded)
 
     Returns:
         ValidationResult with:
             - success: True if all secrets resolvable, False otherwise
             - validated: List of successfully resolved variable names
             - missing: List of tuples (var_name, op_reference, error_msg) for failures
+            - latencies: Dict of var_name -> seconds spent on its check
 
     Raises:
         FileNotFoundError: If env_file doesn't exist
         SecretTagError: If secret tags are malformed
 
     Example:
-        >>> result = validate_secrets(".env", debug=True)
+        >>> result = validate_secrets(".env", metadata_only=True)
         >>> if result.success:
         ...     print(f"All {len(result.validated)} secrets are valid")
         ... else:
         ...     print(f"Missing: {result.missing}")
     """
+    if max_workers is None:
+        max_workers = DEFAULT_METADATA_WORKERS if metadata_only else DEFAULT_MAX_WORKERS
+
     # Parse secret tags
     if debug:
         logger.info(f"Parsing secret tags from {env_file}")
@@ -441,24 +610,46 @@ def validate_secrets(env_file: str, debug: bool = False) -> ValidationResult:
     # Validate each secret
     validated = []
     missing = []
+    latencies = {}
+
+    if debug:
+        for var_name, (vault, item, field) in secret_tags.items():
+            logger.info(f"Checking {var_name} → op://{vault}/{item}/{field}")
+
+    if metadata_only:
+        # One lookup per unique (vault, item); fields are matched locally
+        items = list(dict.fromkeys((vault, item) for vault, item, _ in secret_tags.values()))
+        item_fields, item_errors, item_latency = _run_timed(
+            lambda vault_item: fetch_item_field_names(*vault_item), items, max_workers
+        )
+    else:
+        # Attempt to fetch each secret (validates it exists and is accessible)
+        references = list(dict.fromkeys(secret_tags.values()))
+        _, errors, reference_latency = _run_timed(
+            lambda reference: fetch_secret(*reference), references, max_workers
+        )
 
     for var_name, (vault, item, field) in secret_tags.items():
         op_ref = f"op://{vault}/{item}/{field}"
 
-        if debug:
-            logger.info(f"Checking {var_name} → {op_ref}")
-
-        try:
-            # Attempt to fetch secret (validates it exists and is accessible)
-            _ = fetch_secret(vault, item, field)
+        if metadata_only:
+            latencies[var_name] = item_latency[(vault, item)]
+            error = item_errors.get((vault, item))
+            if error is None and field.lower() not in item_fields[(vault, item)]:
+                error = SecretNotFoundError(
+                    f"Field '{field}' not found in item '{item}' (vault '{vault}')"
+                )
+        else:
+            latencies[var_name] = reference_latency[(vault, item, field)]
+            error = errors.get((vault, item, field))
 
+        if error is None:
             if debug:
-                logger.info(f"✓ {var_name} is resolvable")
+                logger.info(f"✓ {var_name} is resolvable ({latencies[var_name] * 1000:.0f} ms)")
 
             validated.append(var_name)
-
-        except (MissingTokenError, OpNotInstalledError, AuthenticationError, SecretNotFoundError) as e:
-            error_msg = str(e)
+        else:
+            error_msg = str(error)
 
             if debug:
                 logger.error(f"✗ {var_name} failed validation: {error_msg}")
@@ -470,10 +661,143 @@ def validate_secrets(env_file: str, debug: bool = False) -> ValidationResult:
         logger.error(f"Validation failed for {len(missing)} secret(s)")
         for var_name, op_ref, error_msg in missing:
             logger.error(f"  - {var_name} ({op_ref}): {error_msg}")
-        return ValidationResult(success=False, validated=validated, missing=missing)
+        return ValidationResult(success=False, validated=validated, missing=missing, latencies=latencies)
     else:
         logger.info(f"✓ Validated {len(validated)} secret(s): {', '.join(validated)}")
-        return ValidationResult(success=True, validated=validated, missing=[])
+        return ValidationResult(success=True, validated=validated, missing=[], latencies=latencies)
+
+
+def _without_values(pairs: List[Tuple[str, object]]) -> Dict[str, object]:
+    """
+    json object_pairs_hook that leaves "value" keys out of the parsed objects.
+
+    The decoder has already decoded each value string by the time the hook
+    runs; this only keeps values out of the result (and frees them sooner),
+    it does not stop them reaching this process.
+    """
+    return {key: item for key, item in pairs if key != "value"}
+
+
+def fetch_item_field_names(vault: str, item: str) -> Set[str]:
+    """
+    Return the field labels and ids of a 1Password item, lowercased.
+
+    Uses `op item get <item> --vault <vault> --format json`. The op CLI has
+    no call that returns an item's field names without their values, so
+    every field value (concealed ones included) IS received: it is held in
+    the captured stdout and decoded by the JSON parser. Values are then
+    discarded: they are left out of the parsed fields, released when this
+    function returns, and never returned or logged.
+
+    Args:
+        vault: Name of the 1Password vault
+        item: Name of the item within the vault
+
+    Returns:
+        Set of lowercased field labels and ids
+
+    Raises:
+        MissingTokenError: If OP_SERVICE_ACCOUNT_TOKEN environment variable not set
+        OpNotInstalledError: If the `op` CLI is not installed or not found
+        AuthenticationError: If 1Password authentication fails
+        SecretNotFoundError: If the vault or item doesn't exist in 1Password
+    """
+    if not os.environ.get(OP_TOKEN_ENV_VAR):
+        raise MissingTokenError(
+            f"{OP_TOKEN_ENV_VAR} environment variable is not set. "
+            "Set it to your 1Password service account token."
+        )
+
+    command = [OP_CLI_COMMAND, "item", "get", item, "--vault", vault, "--format", "json"]
+
+    try:
+        logger.info(f"Looking up item metadata in 1Password: vault={vault}, item={item}")
+        _incr("subprocess.op item get")
+        started = time.perf_counter()
+        result = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        _record_time(f"fetch.vault:op://{vault}", time.perf_counter() - started)
+    except FileNotFoundError as e:
+        logger.error(f"1Password CLI (op) not found: {e}")
+        raise OpNotInstalledError(
+            "1Password CLI (op) is not installed or not found in PATH. "
+            "Install it from: https://developer.1password.com/docs/cli"
+        )
+
+    if result.returncode != 0:
+        stderr = result.stderr.lower()
+        if "invalid service account token" in stderr or "authentication" in stderr:
+            logger.error(f"1Password authentication failed: {result.stderr.strip()}")
+            raise AuthenticationError(
+                f"1Password authentication failed. Check that {OP_TOKEN_ENV_VAR} is valid."
+            )
+        logger.error(f"Item lookup failed: {result.stderr.strip()}")
+        raise SecretNotFoundError(
+            f"Item not found in 1Password. "
+            f"Verify vault='{vault}', item='{item}' exist. "
+            f"Error: {result.stderr.strip()}"
+        )
+
+    try:
+        fields = json.loads(result.stdout, object_pairs_hook=_without_values).get("fields") or []
+    except (ValueError, AttributeError):
+        raise SecretNotFoundError(
+            f"Unexpected response from 1Password for vault='{vault}', item='{item}'"
+        )
+
+    # SECURITY: keep names only; values were left out of the parsed fields
+    names = set()
+    for entry in fields:
+        for key in ("label", "id"):
+            name = entry.get(key)
+            if name:
+                names.add(name.lower())
+
+    return names
+
+
+def _run_timed(
+    check: Callable[[_T], object],
+    keys: List[_T],
+    max_workers: int
+) -> Tuple[Dict[_T, object], Dict[_T, Exception], Dict[_T, float]]:
+    """
+    Run check(key) for each key, optionally on a thread pool, timing each call.
+
+    Returns:
+        Tuple of (results, errors, latencies) dicts keyed by key. Every key
+        appears in latencies and in exactly one of results/errors.
+    """
+    check_errors = (MissingTokenError, OpNotInstalledError, AuthenticationError, SecretNotFoundError)
+
+    def run_one(key: _T):
+        started = time.perf_counter()
+        try:
+            return check(key), None, time.perf_counter() - started
+        except check_errors as e:
+            return None, e, time.perf_counter() - started
+
+    if max_workers > 1 and len(keys) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as pool:
+            outcomes = list(pool.map(run_one, keys))
+    else:
+        outcomes = [run_one(key) for key in keys]
+
+    results = {}
+    errors = {}
+    latencies = {}
+    for key, (result, error, elapsed) in zip(keys, outcomes):
+        latencies[key] = elapsed
+        if error is None:
+            results[key] = result
+        else:
+            errors[key] = error
+
+    return results, errors, latencies
 
 
 def fetch_secret(vault: str, item: str, field: str) -> str:
@@ -538,12 +862,17 @@ def fetch_secret(vault: str, item: str, field: str) -> str:
     # Execute op CLI command
     try:
         logger.info(f"Fetching secret from 1Password: vault={vault}, item={item}, field={field}")
+        _incr("subprocess.op read")
+        started = time.perf_counter()
         result = subprocess.run(
             command,
             capture_output=True,
             text=True,
             check=False  # Don't raise on non-zero exit - we handle errors manually
         )
+        elapsed = time.perf_counter() - started
+        _record_time(f"fetch.reference:{op_reference}", elapsed)
+        _record_time(f"fetch.vault:op://{vault}", elapsed)
     except FileNotFoundError as e:
         logger.error(f"1Password CLI (op) not found: {e}")
         raise OpNotInstalledError(
@@ -582,3 +911,306 @@ def fetch_secret(vault: str, item: str, field: str) -> str:
     raise SecretNotFoundError(
         f"Failed to fetch secret from 1Password. Error: {result.stderr.strip()}"
     )
+
+
+def fetch_secrets_batch(secret_tags: Dict[str, Tuple[str, str, str]]) -> Dict[str, str]:
+    """
+    Fetch many secrets from 1Password with a single `op inject` invocation.
+
+    A template with one `{{ op://vault/item/field }}` placeholder per unique
+    reference is piped to `op inject`. Placeholders are separated by a random
+    boundary line so each value (multiline values included) maps back to its
+    reference, and from there to every variable tagged with it.
+
+    Args:
+        secret_tags: Mapping of variable names to (vault, item, field) tuples,
+            as returned by parse_secret_tags()
+
+    Returns:
+        Dict mapping variable names to secret values (in secret_tags order)
+
+    Raises:
+        MissingTokenError: If OP_SERVICE_ACCOUNT_TOKEN environment variable not set
+        OpNotInstalledError: If the `op` CLI is not installed or not found
+        AuthenticationError: If 1Password authentication fails
+        SecretNotFoundError: If any vault, item, or field doesn't exist in 1Password
+
+    Error Reporting:
+        `op inject` fails the whole template when one reference is bad and does
+        not reliably say which. On any non-auth failure every unique reference is
+        re-fetched with fetch_secret(), so the raised SecretNotFoundError names
+        the exact vault/item/field, just like the per-variable path.
+
+    Example:
+        >>> tags = parse_secret_tags(".env")
+        >>> values = fetch_secrets_batch(tags)
+    """
+    if not secret_tags:
+        return {}
+
+    token = os.environ.get(OP_TOKEN_ENV_VAR)
+    if not token:
+        raise MissingTokenError(
+            f"{OP_TOKEN_ENV_VAR} environment variable is not set. "
+            "Set it to your 1Password service account token."
+        )
+
+    # Deduplicate references while keeping first-seen order
+    references = list(dict.fromkeys(secret_tags.values()))
+
+    boundary = f"--haunt-secrets-{secrets.token_hex(16)}--"
+    template = "".join(
+        f"{boundary}\n{{{{ op://{vault}/{item}/{field} }}}}\n"
+        for vault, item, field in references
+    )
+    template += f"{boundary}\n"
+
+    try:
+        logger.info(f"Fetching {len(references)} secret reference(s) from 1Password via op inject")
+        _incr("subprocess.op inject")
+        started = time.perf_counter()
+        result = subprocess.run(
+            [OP_CLI_COMMAND, "inject"],
+            input=template,
+            capture_output=True,
+            text=True,
+            check=False  # Don't raise on non-zero exit - we handle errors manually
+        )
+        _record_time("fetch.batch:op inject", time.perf_counter() - started)
+    except FileNotFoundError as e:
+        logger.error(f"1Password CLI (op) not found: {e}")
+        raise OpNotInstalledError(
+            "1Password CLI (op) is not installed or not found in PATH. "
+            "Install it from: https://developer.1password.com/docs/cli"
+        )
+
+    if result.returncode == 0:
+        chunks = result.stdout.split(f"{boundary}\n")
+        # Leading/trailing chunks are empty; one chunk per reference in between
+        if len(chunks) == len(references) + 2:
+            values = {
+                reference: chunk.strip()
+                for reference, chunk in zip(references, chunks[1:-1])
+            }
+            logger.info(f"Successfully fetched {len(references)} secret reference(s) in batch")
+            # SECURITY: Never log the actual secret values
+            return {var_name: values[ref] for var_name, ref in secret_tags.items()}
+        logger.error("op inject returned unexpected output; falling back to per-secret fetch")
+    else:
+        stderr = result.stderr.lower()
+        if "invalid service account token" in stderr or "authentication" in stderr:
+            logger.error(f"1Password authentication failed: {result.stderr.strip()}")
+            raise AuthenticationError(
+                f"1Password authentication failed. Check that {OP_TOKEN_ENV_VAR} is valid."
+            )
+        logger.error(f"Batch fetch failed, retrying per secret to locate failure: {result.stderr.strip()}")
+
+    # Fall back to per-reference reads so errors name the failing vault/item/field
+    values = {reference: fetch_secret(*reference) for reference in references}
+    return {var_name: values[ref] for var_name, ref in secret_tags.items()}
+
+
+def fetch_secrets_parallel(
+    secret_tags: Dict[str, Tuple[str, str, str]],
+    max_workers: int = 4
+) -> Dict[str, str]:
+    """
+    Fetch secrets from 1Password with up to max_workers concurrent `op read` calls.
+
+    Unlike the serial loop, a failure does not stop the remaining fetches:
+    every SecretNotFoundError/AuthenticationError is collected and raised
+    together as a single SecretFetchError once all fetches have finished.
+
+    Args:
+        secret_tags: Mapping of variable names to (vault, item, field) tuples,
+            as returned by parse_secret_tags()
+        max_workers: Maximum number of `op` processes running at once
+
+    Returns:
+        Dict mapping variable names to secret values, in secret_tags order
+        (deterministic regardless of completion order)
+
+    Raises:
+        ValueError: If max_workers is less than 1
+        MissingTokenError: If OP_SERVICE_ACCOUNT_TOKEN environment variable not set
+        OpNotInstalledError: If the `op` CLI is not installed or not found
+        SecretFetchError: If any secret failed; .errors lists every failure
+
+    Example:
+        >>> tags = parse_secret_tags(".env")
+        >>> values = fetch_secrets_parallel(tags, max_workers=8)
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    if not secret_tags:
+        return {}
+
+    # Fail fast on environment problems instead of reporting them once per secret
+    if not os.environ.get(OP_TOKEN_ENV_VAR):
+        raise MissingTokenError(
+            f"{OP_TOKEN_ENV_VAR} environment variable is not set. "
+            "Set it to your 1Password service account token."
+        )
+
+    values, errors, _ = _run_timed(
+        lambda reference: fetch_secret(*reference),
+        list(dict.fromkeys(secret_tags.values())),
+        max_workers
+    )
+
+    for error in errors.values():
+        if isinstance(error, (MissingTokenError, OpNotInstalledError)):
+            raise error
+
+    if errors:
+        raise SecretFetchError([
+            (var_name, f"op://{vault}/{item}/{field}", errors[(vault, item, field)])
+            for var_name, (vault, item, field) in secret_tags.items()
+            if (vault, item, field) in errors
+        ])
+
+    return {var_name: values[ref] for var_name, ref in secret_tags.items()}
+
+
+# ========== INSTRUMENTATION ==========
+
+def _incr(name: str, amount: int = 1) -> None:
+    with _STATS_LOCK:
+        _COUNTERS[name] = _COUNTERS.get(name, 0) + amount
+
+
+def _record_time(name: str, seconds: float) -> None:
+    with _STATS_LOCK:
+        timer = _TIMERS.get(name)
+        if timer is None:
+            _TIMERS[name] = [1, seconds, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+
+def _timer_summary(count: float, total: float, maximum: float) -> Dict[str, float]:
+    return {
+        "count": int(count),
+        "total_ms": round(total * 1000, 3),
+        "mean_ms": round(total * 1000 / count, 3) if count else 0.0,
+        "max_ms": round(maximum * 1000, 3),
+    }
+
+
+def stats() -> Dict[str, object]:
+    """
+    Return timings and counters recorded since import (or reset_stats()).
+
+    Returns:
+        Dict with sections:
+            - parse: files_read, memo_hits, time
+            - fetch: references, vaults and batches, each name -> timer
+              ({"count", "total_ms", "mean_ms", "max_ms"}), slowest first
+            - subprocess: op processes spawned, by subcommand
+
+    Security:
+        - Only op:// references and vault names are recorded, NEVER values
+    """
+    with _STATS_LOCK:
+        counters = dict(_COUNTERS)
+        timers = {name: _timer_summary(*values) for name, values in _TIMERS.items()}
+
+    def section(prefix: str) -> Dict[str, Dict[str, float]]:
+        grouped = {name[len(prefix):]: timing for name, timing in timers.items() if name.startswith(prefix)}
+        return dict(sorted(grouped.items(), key=lambda item: -item[1]["total_ms"]))
+
+    return {
+        "parse": {
+            "files_read": counters.get("parse.files", 0),
+            "memo_hits": counters.get("parse.memo_hits", 0),
+            "time": timers.get("parse", _timer_summary(0, 0.0, 0.0)),
+        },
+        "fetch": {
+            "references": section("fetch.reference:"),
+            "vaults": section("fetch.vault:"),
+            "batches": section("fetch.batch:"),
+        },
+        "subprocess": {
+            name[len("subprocess."):]: count
+            for name, count in sorted(counters.items()) if name.startswith("subprocess.")
+        },
+    }
+
+
+def reset_stats() -> None:
+    """Zero every counter and timer."""
+    with _STATS_LOCK:
+        _COUNTERS.clear()
+        _TIMERS.clear()
+
+
+def format_profile(data: Dict[str, object]) -> str:
+    """Render stats() as a human-readable breakdown, slowest vaults and references first."""
+    lines = []
+    parse = data["parse"]
+    lines.append(
+        f"parse: {parse['files_read']} file(s) read, {parse['memo_hits']} memo hit(s), "
+        f"{parse['time']['total_ms']:.1f} ms"
+    )
+    for title, key in (("vaults", "vaults"), ("batches", "batches"), ("references", "references")):
+        timings = data["fetch"][key]
+        if not timings:
+            continue
+        lines.append(f"{title} (slowest first):")
+        for name, timing in timings.items():
+            lines.append(
+                f"  {timing['total_ms']:9.1f} ms  x{timing['count']:<3} "
+                f"max {timing['max_ms']:.1f} ms  {name}"
+            )
+    spawned = ", ".join(f"{name}={count}" for name, count in data["subprocess"].items()) or "none"
+    lines.append(f"op processes: {spawned}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Resolve every secret in an .env file without printing values.
+
+    Useful to check that a file loads and, with --profile, to see where the
+    time goes (parse, each vault and reference, op processes spawned).
+
+    Returns:
+        0 on success, 1 if the token is missing, 2 if 1Password fails,
+        3 if the .env file is missing (same codes as haunt-secrets.sh)
+    """
+    parser = argparse.ArgumentParser(description="Resolve 1Password secrets from an .env file.")
+    parser.add_argument("env_file", nargs="?", default=".env")
+    parser.add_argument("--batch", action="store_true", help="resolve all tags with one `op inject` call")
+    parser.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="concurrent `op read` calls")
+    parser.add_argument("--profile", action="store_true", help="print a timing breakdown to stderr")
+    parser.add_argument("--json", action="store_true", help="print stats() as JSON to stdout")
+    args = parser.parse_args(argv)
+
+    code = 0
+    try:
+        resolved = get_secrets(args.env_file, batch=args.batch, max_workers=args.max_workers)
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        code = 3
+    except MissingTokenError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        code = 1
+    except (SecretTagError, OpNotInstalledError, AuthenticationError, SecretNotFoundError, SecretFetchError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        code = 2
+    else:
+        print(f"Resolved {len(resolved)} variable(s) from {args.env_file}", file=sys.stderr)
+
+    if args.profile:
+        print(format_profile(stats()), file=sys.stderr)
+    if args.json:
+        print(json.dumps(stats(), indent=2))
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1960,14 +1960,19 @@ setup_hooks() {
         return 0
     fi
 
-    # Check for uv (required for running Python hooks)
-    if ! command -v uv &> /dev/null; then
-        warning "uv is not installed. Python hooks require uv to run."
-        warning "Install uv: curl -LsSf https://astral.sh/uv/install.sh | sh"
+    # Check for python3 (the hooks run as plain python3 scripts)
+    if ! command -v python3 &> /dev/null; then
+        warning "python3 is not installed. Damage-control hooks require python3."
         warning "Skipping hooks setup"
         return 0
     fi
 
+    # PyYAML (or uv, to provide it) is only needed to recompile patterns.yaml
+    if ! python3 -c "import yaml" &> /dev/null && ! command -v uv &> /dev/null; then
+        warning "Neither PyYAML nor uv is installed. Hooks cannot recompile patterns.yaml after edits."
+        warning "Install one: python3 -m pip install pyyaml, or curl -LsSf https://astral.sh/uv/install.sh | sh"
+    fi
+
     # Create hooks target directory
     if [[ ! -d "$hooks_target" ]]; then
         if [[ "$DRY_RUN" == false ]]; then
@@ -0,0 +1,127 @@
+"""Benchmark contains_secret() on agent tool output.
+
+Compares the prefiltered contains_secret() against the previous approach
+(a substring test per registered secret, then each of the four PATTERNS)
+on a synthetic corpus of typical tool results: directory listings, test
+runs, grep hits, diffs, JSON and shell prompts. A few outputs leak a
+registered secret or a token-shaped string. Results are checked to be
+identical before timing.
+
+Usage:
+    cd Haunt/secrets
+    python benchmarks/bench_contains.py [--secrets 20] [--outputs 5000]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from haunt_secrets import redaction  # noqa: E402
+
+
+TOOL_OUTPUTS = [
+    "-rw-r--r--  1 dev staff  {n} Jan 14 09:12 src/module_{n}.py\n"
+    "drwxr-xr-x  4 dev staff  128 Jan 14 09:12 tests\n",
+    "tests/test_module_{n}.py::TestThing::test_case_{m} PASSED [ {m}%]\n",
+    "src/app/views.py:{n}:    return render(request, 'page_{m}.html', context)\n",
+    "@@ -{n},7 +{n},8 @@ def handler(event):\n-    retries = {m}\n+    retries = {m} + 1\n",
+    '{{"id": {n}, "status": "ok", "items": [{m}, {n}], "next": null}}\n',
+    "$ cd /home/dev/project && make test\nok  \tpkg/server\t0.{m}s\n",
+    "Traceback (most recent call last):\n  File \"app.py\", line {n}, in <module>\nKeyError: 'user_{m}'\n",
+    "npm WARN deprecated package@{m}.0.0: use the new API instead\n",
+]
+
+LEAKS = [
+    "export API_TOKEN={secret}\n",
+    "Authorization: Bearer sk_live_{rand}\n",
+    "commit {hex40}\nAuthor: Dev <dev@example.com>\n",
+    "request_id=550e8400-e29b-41d4-a716-{hex12}\n",
+]
+
+
+def make_secrets(count, rng):
+    alphabet = string.ascii_letters + string.digits + "!@#%^&*-_"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(12, 48)))
+        for _ in range(count)
+    ]
+
+
+def make_corpus(count, secrets, rng):
+    """Tool outputs of 1-20 lines; about 2% contain something secret-like."""
+    corpus = []
+    for _ in range(count):
+        lines = [
+            rng.choice(TOOL_OUTPUTS).format(n=rng.randint(1, 9999), m=rng.randint(1, 99))
+            for _ in range(rng.randint(1, 20))
+        ]
+        if rng.random() < 0.02:
+            lines.append(rng.choice(LEAKS).format(
+                secret=rng.choice(secrets),
+                rand="".join(rng.choice(string.ascii_letters) for _ in range(16)),
+                hex40="".join(rng.choice("0123456789abcdef") for _ in range(40)),
+                hex12="".join(rng.choice("0123456789abcdef") for _ in range(12)),
+            ))
+        corpus.append("".join(lines))
+    return corpus
+
+
+def legacy_contains_secret(text):
+    """The pre-prefilter algorithm."""
+    if not text:
+        return False
+    for secret in redaction._REGISTERED_SECRETS:
+        if secret in text:
+            return True
+    for pattern in redaction.PATTERNS.values():
+        if pattern.search(text):
+            return True
+    return False
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--secrets", type=int, default=20)
+    parser.add_argument("--outputs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(1234)
+    secrets = make_secrets(args.secrets, rng)
+    corpus = make_corpus(args.outputs, secrets, rng)
+    size_mb = sum(map(len, corpus)) / (1024 * 1024)
+
+    redaction.reset_secrets()
+    for i, secret in enumerate(secrets):
+        redaction.register_secret(f"SECRET_{i}", secret)
+
+    expected = [legacy_contains_secret(text) for text in corpus]
+    actual = [redaction.contains_secret(text) for text in corpus]
+    assert actual == expected, "prefiltered results differ from legacy results"
+
+    legacy = timed(lambda: [legacy_contains_secret(text) for text in corpus], args.repeat)
+    fast = timed(lambda: [redaction.contains_secret(text) for text in corpus], args.repeat)
+
+    print(f"{args.secrets} secrets, {args.outputs} tool outputs, {size_mb:.2f} MB, "
+          f"{sum(expected)} flagged (best of {args.repeat})")
+    print(f"  legacy contains_secret:  {legacy * 1000:8.1f} ms  {size_mb / legacy:8.2f} MB/s")
+    print(f"  prefiltered:             {fast * 1000:8.1f} ms  {size_mb / fast:8.2f} MB/s")
+    print(f"  speedup:                 {legacy / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
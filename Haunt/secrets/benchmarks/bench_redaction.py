@@ -0,0 +1,109 @@
+"""Benchmark redact() throughput with many registered secrets.
+
+Compares the single-pass engine in haunt_secrets.redaction against the
+previous approach (one re.sub per registered secret, then one pass per
+pattern) on 1 MB of synthetic log text with 500 registered secrets.
+
+Usage:
+    cd Haunt/secrets
+    python benchmarks/bench_redaction.py [--secrets 500] [--size-mb 1]
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from haunt_secrets import redaction  # noqa: E402
+
+
+LOG_TEMPLATES = [
+    "2025-01-14 09:12:{s:02d} INFO  request id={n} path=/api/v1/items status=200 took={ms}ms",
+    "2025-01-14 09:12:{s:02d} DEBUG cache lookup key=user:{n} hit=true",
+    "2025-01-14 09:12:{s:02d} WARN  retrying upstream call attempt={n} backoff={ms}ms",
+    "2025-01-14 09:12:{s:02d} INFO  connected to db host=db-{n}.internal port=5432",
+    "PASSED tests/test_module_{n}.py::TestThing::test_case_{ms}",
+]
+
+
+def make_secrets(count, rng):
+    """Random secrets of mixed length and alphabet (some with punctuation)."""
+    alphabet = string.ascii_letters + string.digits + "!@#%^&*-_"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(12, 48)))
+        for _ in range(count)
+    ]
+
+
+def make_log(size_bytes, secrets, rng):
+    """Synthetic log lines with a registered secret leaked every ~200 lines."""
+    lines = []
+    total = 0
+    while total < size_bytes:
+        line = rng.choice(LOG_TEMPLATES).format(
+            s=rng.randint(0, 59), n=rng.randint(1, 99999), ms=rng.randint(1, 999)
+        )
+        if rng.random() < 0.005:
+            line += f" token={rng.choice(secrets)}"
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+def legacy_redact(text, secrets):
+    """The pre-engine algorithm: O(secrets x text length)."""
+    for secret in secrets:
+        text = re.sub(re.escape(secret), redaction.REDACTED_PLACEHOLDER, text)
+    for pattern in redaction.PATTERNS.values():
+        text = pattern.sub(redaction.REDACTED_PLACEHOLDER, text)
+    return text
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--secrets", type=int, default=500)
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(1234)
+    secrets = make_secrets(args.secrets, rng)
+    text = make_log(int(args.size_mb * 1024 * 1024), secrets, rng)
+    size_mb = len(text) / (1024 * 1024)
+
+    redaction.reset_secrets()
+    for i, secret in enumerate(secrets):
+        redaction.register_secret(f"SECRET_{i}", secret)
+
+    start = time.perf_counter()
+    redaction.redact("warm up")  # includes the one-off matcher build
+    build = time.perf_counter() - start
+
+    legacy = timed(lambda: legacy_redact(text, secrets), args.repeat)
+    engine = timed(lambda: redaction.redact(text), args.repeat)
+
+    assert not any(secret in redaction.redact(text) for secret in secrets)
+
+    print(f"{args.secrets} secrets, {size_mb:.2f} MB of log text (best of {args.repeat})")
+    print(f"  matcher build:  {build * 1000:8.1f} ms (once per registry change)")
+    print(f"  legacy redact:  {legacy * 1000:8.1f} ms  {size_mb / legacy:8.2f} MB/s")
+    print(f"  engine redact:  {engine * 1000:8.1f} ms  {size_mb / engine:8.2f} MB/s")
+    print(f"  speedup:        {legacy / engine:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark redact_structure() against redacting repr() of the payload.
+
+Builds a nested JSON-like API response (~10 MB when serialized) with 500
+registered secrets, a few of them leaked into string values, and times:
+
+- redact(repr(payload)): the old way (returns a string, loses the structure)
+- redact_structure(payload), first call and repeated calls (clean strings
+  are remembered until the registry changes)
+
+Usage:
+    cd Haunt/secrets
+    python benchmarks/bench_structure.py [--secrets 500] [--size-mb 10]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from haunt_secrets import redaction  # noqa: E402
+
+
+STATUSES = ["active", "pending", "suspended", "archived"]
+
+
+def make_secrets(count, rng):
+    alphabet = string.ascii_letters + string.digits + "!@#%^&*-_"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(12, 48)))
+        for _ in range(count)
+    ]
+
+
+def make_payload(size_bytes, secrets, rng):
+    """A paginated list of user records, roughly size_bytes when repr()'d."""
+    records = []
+    total = 0
+    while total < size_bytes:
+        n = len(records)
+        record = {
+            "id": n,
+            "name": f"user-{n}",
+            "email": f"user{n}@example.com",
+            "status": rng.choice(STATUSES),
+            "score": rng.random(),
+            "roles": ["reader", "writer"] if n % 3 else ["reader"],
+            "address": {"city": rng.choice(["Oslo", "Lima", "Pune"]), "zip": f"{rng.randint(10000, 99999)}"},
+            "notes": f"last login from 10.0.{n % 256}.{n % 97} via web client",
+        }
+        if rng.random() < 0.002:
+            record["notes"] += f" token={rng.choice(secrets)}"
+        records.append(record)
+        total += 260
+    return {"data": records, "page": 1, "total": len(records)}
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--secrets", type=int, default=500)
+    parser.add_argument("--size-mb", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(1234)
+    secrets = make_secrets(args.secrets, rng)
+    payload = make_payload(int(args.size_mb * 1024 * 1024), secrets, rng)
+    size_mb = len(repr(payload)) / (1024 * 1024)
+
+    redaction.reset_secrets()
+    for i, secret in enumerate(secrets):
+        redaction.register_secret(f"SECRET_{i}", secret)
+    redaction.redact("warm up")  # one-off matcher build
+
+    start = time.perf_counter()
+    redacted = redaction.redact_structure(payload)
+    first = time.perf_counter() - start
+
+    legacy = timed(lambda: redaction.redact(repr(payload)), args.repeat)
+    structure = timed(lambda: redaction.redact_structure(payload), args.repeat)
+
+    assert not any(secret in repr(redacted) for secret in secrets)
+
+    print(f"{args.secrets} secrets, {len(payload['data'])} records, {size_mb:.2f} MB as repr() (best of {args.repeat})")
+    print(f"  redact(repr(payload)):      {legacy * 1000:8.1f} ms")
+    print(f"  redact_structure (first):   {first * 1000:8.1f} ms  {legacy / first:5.1f}x")
+    print(f"  redact_structure (repeat):  {structure * 1000:8.1f} ms  {legacy / structure:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,84 @@
-"""Haunt Secrets - 1Password secret tag parser for .env files."""
+"""Haunt Secrets - 1Password secret tag parser for .env files.
 
-from .parser import parse_env_file, parse_env_content
-from .loader import load_secrets, get_secrets
+Public names are imported from their submodules on first access, so
+`import haunt_secrets` (and `haunt_secrets.redaction`, used by hooks on
+every tool call) does not pay for subprocess, asyncio or http.client.
+"""
 
-__all__ = ["parse_env_file", "parse_env_content", "load_secrets", "get_secrets"]
+# Public name -> submodule defining it
+_EXPORTS = {
+    "parse_env_file": "parser",
+    "parse_env_content": "parser",
+    "load_secrets": "loader",
+    "get_secrets": "loader",
+    "load_layered_secrets": "loader",
+    "get_layered_secrets": "loader",
+    "env_layers": "loader",
+    "SecretCache": "cache",
+    "run": "runner",
+    "aget_secrets": "aio",
+    "aload_secrets": "aio",
+    "SecretRefresher": "refresh",
+    "SecretSnapshot": "refresh",
+    "stats": "metrics",
+    "stats_json": "metrics",
+    "reset_stats": "metrics",
+    "SecretBackend": "backends",
+    "OpCliBackend": "backends",
+    "HttpBackend": "backends",
+    "DictBackend": "backends",
+    "FileBackend": "backends",
+    "register_backend": "backends",
+    "unregister_backend": "backends",
+    "MissingTokenError": "errors",
+    "OpNotInstalledError": "errors",
+    "AuthenticationError": "errors",
+    "SecretNotFoundError": "errors",
+    "SecretTimeoutError": "errors",
+    "BackendUnavailableError": "errors",
+}
+
+__all__ = list(_EXPORTS)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .parser import parse_env_file, parse_env_content
+    from .loader import load_secrets, get_secrets, load_layered_secrets, get_layered_secrets, env_layers
+    from .cache import SecretCache
+    from .runner import run
+    from .aio import aget_secrets, aload_secrets
+    from .refresh import SecretRefresher, SecretSnapshot
+    from .metrics import stats, stats_json, reset_stats
+    from .backends import (
+        SecretBackend,
+        OpCliBackend,
+        HttpBackend,
+        DictBackend,
+        FileBackend,
+        register_backend,
+        unregister_backend,
+    )
+    from .errors import (
+        MissingTokenError,
+        OpNotInstalledError,
+        AuthenticationError,
+        SecretNotFoundError,
+        SecretTimeoutError,
+        BackendUnavailableError,
+    )
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
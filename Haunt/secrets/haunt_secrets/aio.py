@@ -0,0 +1,281 @@
+"""asyncio variants of get_secrets/load_secrets.
+
+op processes are spawned with asyncio.create_subprocess_exec, capped by a
+semaphore, and awaited with a per-fetch timeout, so loading or reloading
+secrets never blocks the event loop. File and cache I/O run in the default
+executor. Cancelling the calling task kills any op processes still running.
+
+Errors use the same types as scripts/haunt_secrets.py (MissingTokenError,
+OpNotInstalledError, AuthenticationError, SecretNotFoundError) plus
+SecretTimeoutError; all subclass RuntimeError.
+
+Secrets tagged for other backends (see backends.py) are fetched with the
+backend's fetch_many() in the default executor.
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+from . import metrics
+from .backends import OpCliBackend, get_backend
+from .errors import SecretTimeoutError, op_error, op_not_installed
+from .loader import (
+    _batch_template,
+    _build_secrets,
+    _merge_layers,
+    _reference_backend,
+    _require_token,
+    _split_batch_output,
+    _split_reference,
+)
+
+if TYPE_CHECKING:
+    from .cache import SecretCache
+
+# Maximum op processes running at once per call
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Seconds allowed for each op process
+DEFAULT_FETCH_TIMEOUT = 30.0
+
+
+async def aload_secrets(
+    path: Union[str, Path],
+    batch: bool = False,
+    cache: Optional["SecretCache"] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: Optional[float] = DEFAULT_FETCH_TIMEOUT
+) -> None:
+    """
+    Load secrets from .env file and export to os.environ without blocking the loop.
+
+    os.environ is only updated after every secret resolved, so a failed or
+    cancelled reload leaves the previous values in place.
+
+    Raises:
+        Same as aget_secrets()
+    """
+    secrets_dict = await aget_secrets(
+        path,
+        batch=batch,
+        cache=cache,
+        max_concurrency=max_concurrency,
+        timeout=timeout
+    )
+
+    # Export to environment
+    for key, value in secrets_dict.items():
+        os.environ[key] = value
+
+
+async def aget_secrets(
+    path: Union[str, Path],
+    batch: bool = False,
+    cache: Optional["SecretCache"] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: Optional[float] = DEFAULT_FETCH_TIMEOUT
+) -> Dict[str, str]:
+    """
+    Load secrets from .env file and return as dict (no side effects).
+
+    Args:
+        path: Path to .env file (string or Path object)
+        batch: If True, resolve all secrets with a single `op inject` process
+        cache: Optional SecretCache consulted before 1Password
+        max_concurrency: Maximum op processes running at once (ignored with batch)
+        timeout: Seconds allowed per op process (None = no limit)
+
+    Returns:
+        Dict mapping variable names to values (both secrets and plaintext)
+
+    Raises:
+        MissingTokenError: If OP_SERVICE_ACCOUNT_TOKEN not set
+        OpNotInstalledError: If op is not installed
+        AuthenticationError: If the service account token is rejected
+        SecretNotFoundError: If a secret cannot be read
+        SecretTimeoutError: If an op process exceeds timeout
+        FileNotFoundError: If .env file not found
+        ValueError: If max_concurrency is less than 1
+
+    Example:
+        >>> secrets = await aget_secrets('.env', max_concurrency=8, timeout=10)
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+    loop = asyncio.get_running_loop()
+    values, references = await loop.run_in_executor(None, _merge_layers, [path])
+
+    _require_token(references.values())
+
+    resolved = await _aresolve_references(
+        list(dict.fromkeys(references.values())),
+        batch=batch,
+        cache=cache,
+        max_concurrency=max_concurrency,
+        timeout=timeout
+    )
+
+    # Everything is resolved: substitution and registration need no op calls
+    return _build_secrets(values, references, resolved=resolved)
+
+
+async def _aresolve_references(
+    references: List[str],
+    batch: bool,
+    cache: Optional["SecretCache"],
+    max_concurrency: int,
+    timeout: Optional[float]
+) -> Dict[str, str]:
+    """Resolve unique references: cache first (in the executor), then op or other backends."""
+    loop = asyncio.get_running_loop()
+
+    values: Dict[str, str] = {}
+    if cache is not None:
+        cached = await loop.run_in_executor(None, lambda: {ref: cache.get(ref) for ref in references})
+        values = {ref: value for ref, value in cached.items() if value is not None}
+
+    missing = [ref for ref in references if ref not in values]
+    if not missing:
+        return values
+
+    # Only the op CLI has an async path; other backends run in the executor
+    op_refs: List[str] = []
+    other: Dict[str, List[str]] = {}
+    for ref in missing:
+        name = _reference_backend(ref)
+        if isinstance(get_backend(name), OpCliBackend):
+            op_refs.append(ref)
+        else:
+            other.setdefault(name, []).append(ref)
+
+    fetched: Dict[str, str] = {}
+    for name, refs in other.items():
+        with metrics.timed(f"fetch.batch:{name}"):
+            fetched.update(await loop.run_in_executor(None, _fetch_from_backend, name, refs))
+
+    if op_refs:
+        fetched.update(await _afetch_op(op_refs, batch, max_concurrency, timeout))
+
+    if cache is not None:
+        await loop.run_in_executor(None, lambda: [cache.set(ref, value) for ref, value in fetched.items()])
+
+    values.update(fetched)
+    return values
+
+
+def _fetch_from_backend(name: str, references: List[str]) -> Dict[str, str]:
+    """Resolve references with one fetch_many() call on a non-op backend (blocking)."""
+    parts = {ref: tuple(_split_reference(ref)) for ref in references}
+    results = get_backend(name).fetch_many(list(parts.values()))
+    return {ref: results[part] for ref, part in parts.items()}
+
+
+async def _afetch_op(
+    missing: List[str],
+    batch: bool,
+    max_concurrency: int,
+    timeout: Optional[float]
+) -> Dict[str, str]:
+    """Resolve op references with one `op inject` or concurrent `op read` processes."""
+    if batch:
+        with metrics.timed("fetch.batch:op"):
+            fetched = await _afetch_batch(missing, timeout)
+        if fetched is None:
+            batch = False
+
+    if not batch:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results = await _gather_or_cancel([_afetch_secret(ref, semaphore, timeout) for ref in missing])
+        fetched = dict(zip(missing, results))
+
+    return fetched
+
+
+async def _afetch_secret(reference: str, semaphore: asyncio.Semaphore, timeout: Optional[float]) -> str:
+    """Read one op:// reference with `op read`, holding a semaphore slot."""
+    op_reference = "op://" + "/".join(_split_reference(reference))
+    async with semaphore:
+        start = time.perf_counter()
+        returncode, stdout, stderr = await _run_op(["op", "read", op_reference], None, timeout, reference)
+        metrics.record_fetch(reference, time.perf_counter() - start)
+
+    if returncode != 0:
+        raise op_error(stderr, "/".join(_split_reference(reference)))
+
+    return stdout.strip()
+
+
+async def _afetch_batch(references: List[str], timeout: Optional[float]) -> Optional[Dict[str, str]]:
+    """Resolve references with one `op inject`; None if op rejected the template."""
+    boundary, template = _batch_template(["op://" + "/".join(_split_reference(ref)) for ref in references])
+    returncode, stdout, _ = await _run_op(["op", "inject"], template, timeout, "op inject")
+
+    if returncode != 0:
+        return None
+    return _split_batch_output(stdout, boundary, references)
+
+
+async def _run_op(args: List[str], stdin: Optional[str], timeout: Optional[float], what: str):
+    """Run op, killing it on timeout or cancellation. Returns (returncode, stdout, stderr)."""
+    metrics.incr(f"subprocess.op {args[1]}")
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,  # Prevent leaks to stdout/stderr
+            stderr=asyncio.subprocess.PIPE
+        )
+    except FileNotFoundError:
+        raise op_not_installed()
+
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(stdin.encode() if stdin is not None else None),
+            timeout
+        )
+    except asyncio.TimeoutError:
+        await _kill(proc)
+        raise SecretTimeoutError(f"1Password fetch timed out after {timeout}s: {what}")
+    except asyncio.CancelledError:
+        await _kill(proc)
+        raise
+
+    return proc.returncode, stdout.decode(), stderr.decode()
+
+
+async def _kill(proc: "asyncio.subprocess.Process") -> None:
+    """Kill proc if still running and reap it."""
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+
+async def _gather_or_cancel(coroutines: list) -> list:
+    """Like asyncio.gather, but cancel the remaining tasks on the first failure."""
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    if pending:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    # Raise the first failure in reference order, like the serial loader
+    for task in tasks:
+        if task.done() and not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+
+    return [task.result() for task in tasks]
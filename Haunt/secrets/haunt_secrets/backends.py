@@ -0,0 +1,586 @@
+"""Pluggable secret backends.
+
+A backend resolves (vault, item, field) references to values. Three ship
+with the package:
+
+- OpCliBackend ("op"): the 1Password CLI, one `op read` per secret or a
+  single `op inject` for a batch
+- HttpBackend ("connect"): a 1Password Connect-style HTTP server, using a
+  pool of keep-alive connections and fetching each item once for all of
+  its fields
+- DictBackend / FileBackend ("file"): values from a dict or JSON file, for
+  tests and offline development
+
+Selection:
+- The .env tag names the backend: `# @secret:connect:vault/item/field`
+  (`# @secret:op:...` is the default and unchanged)
+- HAUNT_SECRETS_BACKEND=<name> redirects `op` tags to another backend
+  (e.g. `connect` in CI) without editing .env files
+- register_backend(name, backend) installs or replaces a backend
+"""
+
+import http.client
+import json
+import os
+import queue
+import secrets
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote, urlsplit
+
+from . import metrics
+from .errors import (
+    AuthenticationError,
+    BackendUnavailableError,
+    MissingTokenError,
+    SecretNotFoundError,
+    op_error,
+    op_not_installed,
+)
+
+# (vault, item, field)
+Reference = Tuple[str, str, str]
+
+# Environment variable naming the backend that serves `op` tags
+BACKEND_ENV_VAR = "HAUNT_SECRETS_BACKEND"
+
+# Environment variables configuring the default HTTP and file backends
+CONNECT_HOST_ENV_VAR = "OP_CONNECT_HOST"
+CONNECT_TOKEN_ENV_VAR = "OP_CONNECT_TOKEN"
+SECRETS_FILE_ENV_VAR = "HAUNT_SECRETS_FILE"
+
+# Default HTTP pool size and per-request timeout in seconds
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_HTTP_TIMEOUT = 10.0
+
+
+class SecretBackend:
+    """
+    Base class for secret backends.
+
+    Subclasses implement fetch(); fetch_many() defaults to calling it once
+    per reference. Backends whose bulk path is cheaper than single fetches
+    set prefers_bulk so the loader always hands them every reference at once.
+
+    Attributes:
+        prefers_bulk: Use fetch_many() even when batch=False
+        requires_op_token: Needs OP_SERVICE_ACCOUNT_TOKEN (checked before fetching)
+    """
+
+    prefers_bulk = False
+    requires_op_token = False
+
+    def fetch(self, vault: str, item: str, field: str) -> str:
+        """Return the value of one field. Raises SecretNotFoundError if absent."""
+        raise NotImplementedError
+
+    def fetch_many(self, references: List[Reference]) -> Dict[Reference, str]:
+        """Return values for every reference (duplicates fetched once)."""
+        return {reference: self.fetch(*reference) for reference in dict.fromkeys(references)}
+
+    def close(self) -> None:
+        """Release any resources (connections, processes)."""
+
+
+class OpCliBackend(SecretBackend):
+    """Resolve secrets with the 1Password CLI (`op read` / `op inject`)."""
+
+    requires_op_token = True
+
+    def fetch(self, vault: str, item: str, field: str) -> str:
+        return _fetch_secret(vault, item, field)
+
+    def fetch_many(self, references: List[Reference]) -> Dict[Reference, str]:
+        refs = {f"op://{vault}/{item}/{field}": (vault, item, field) for vault, item, field in references}
+        values = _fetch_secrets_batch(list(refs))
+        return {refs[ref]: value for ref, value in values.items()}
+
+
+class DictBackend(SecretBackend):
+    """
+    Resolve secrets from an in-memory mapping.
+
+    Keys are "vault/item/field" (an "op://" prefix is accepted).
+
+    Usage:
+        register_backend("op", DictBackend({"prod/api/key": "test-value"}))
+    """
+
+    prefers_bulk = True
+
+    def __init__(self, values: Mapping[str, str]):
+        self._values = {_strip_scheme(key): value for key, value in values.items()}
+
+    def fetch(self, vault: str, item: str, field: str) -> str:
+        try:
+            return self._values[f"{vault}/{item}/{field}"]
+        except KeyError:
+            raise SecretNotFoundError(
+                f"Failed to fetch secret. Vault/item/field: {vault}/{item}/{field}. "
+                f"Error: not present in {type(self).__name__}"
+            )
+
+
+class FileBackend(DictBackend):
+    """
+    Resolve secrets from a JSON file of {"vault/item/field": "value"}.
+
+    The file is read once, when the backend is created.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path) as f:
+            values = json.load(f)
+        if not isinstance(values, dict):
+            raise ValueError(f"{self.path} must contain a JSON object of \"vault/item/field\": value")
+        super().__init__(values)
+
+    @classmethod
+    def from_env(cls) -> "FileBackend":
+        """Create from HAUNT_SECRETS_FILE."""
+        path = os.environ.get(SECRETS_FILE_ENV_VAR)
+        if not path:
+            raise BackendUnavailableError(
+                f"{SECRETS_FILE_ENV_VAR} must be set to use the 'file' secret backend."
+            )
+        return cls(path)
+
+
+class HttpBackend(SecretBackend):
+    """
+    Resolve secrets from a 1Password Connect-style HTTP API.
+
+    Endpoints used (all GET, bearer-token authenticated):
+        /v1/vaults?filter=name eq "<vault>"              -> vault id
+        /v1/vaults/<id>/items?filter=title eq "<item>"   -> item id
+        /v1/vaults/<id>/items/<id>                       -> item with fields
+
+    Vault and item ids are memoized per backend. fetch_many() groups
+    references by item, so each item is downloaded once no matter how
+    many of its fields are needed, and items are fetched concurrently over
+    a pool of keep-alive connections (no process fork per secret).
+    Fields match by label or id, case-insensitively.
+
+    Usage:
+        register_backend("connect", HttpBackend("http://connect.internal:8080", token))
+        # .env: # @secret:connect:prod/database/password
+    """
+
+    prefers_bulk = True
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token: Optional[str] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_HTTP_TIMEOUT
+    ):
+        """
+        Initialize the backend. No connection is opened until the first fetch.
+
+        Args:
+            base_url: Server URL (default: OP_CONNECT_HOST)
+            token: Bearer token (default: OP_CONNECT_TOKEN)
+            max_connections: Pool size and maximum concurrent item fetches
+            timeout: Socket timeout per request in seconds
+
+        Raises:
+            BackendUnavailableError: If no base URL is configured
+            MissingTokenError: If no token is configured
+            ValueError: If base_url is not http(s) or max_connections < 1
+        """
+        base_url = base_url or os.environ.get(CONNECT_HOST_ENV_VAR)
+        token = token or os.environ.get(CONNECT_TOKEN_ENV_VAR)
+        if not base_url:
+            raise BackendUnavailableError(
+                f"{CONNECT_HOST_ENV_VAR} must be set to use the HTTP secret backend."
+            )
+        if not token:
+            raise MissingTokenError(
+                f"{CONNECT_TOKEN_ENV_VAR} environment variable must be set. "
+                "This token is required to authenticate with the secrets server."
+            )
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be at least 1, got {max_connections}")
+
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"base_url must be an http(s) URL, got {base_url!r}")
+
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self._prefix = url.path.rstrip("/")
+        self._headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+        self._pool = _ConnectionPool(url.scheme, url.hostname, url.port, max_connections, timeout)
+        self._vault_ids: Dict[str, str] = {}
+        self._item_ids: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "HttpBackend":
+        """Create from OP_CONNECT_HOST / OP_CONNECT_TOKEN."""
+        return cls()
+
+    @property
+    def connections_opened(self) -> int:
+        """Number of TCP connections opened so far (for monitoring keep-alive reuse)."""
+        return self._pool.opened
+
+    def fetch(self, vault: str, item: str, field: str) -> str:
+        return self.fetch_many([(vault, item, field)])[(vault, item, field)]
+
+    def fetch_many(self, references: List[Reference]) -> Dict[Reference, str]:
+        items = list(dict.fromkeys((vault, item) for vault, item, _ in references))
+
+        if len(items) > 1 and self.max_connections > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_connections, len(items))) as pool:
+                fields_by_item = dict(zip(items, pool.map(lambda key: self._item_fields(*key), items)))
+        else:
+            fields_by_item = {key: self._item_fields(*key) for key in items}
+
+        values = {}
+        for vault, item, field in references:
+            value = fields_by_item[(vault, item)].get(field.lower())
+            if value is None:
+                raise SecretNotFoundError(
+                    f"Failed to fetch secret from secrets server. "
+                    f"Vault/item/field: {vault}/{item}/{field}. Error: field not found"
+                )
+            values[(vault, item, field)] = value
+        return values
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _item_fields(self, vault: str, item: str) -> Dict[str, str]:
+        """Download one item and index its field values by lowercased label and id."""
+        vault_id = self._vault_id(vault)
+        item_id = self._item_id(vault_id, vault, item)
+        data = self._get_json(f"/v1/vaults/{quote(vault_id)}/items/{quote(item_id)}", f"{vault}/{item}")
+
+        fields: Dict[str, str] = {}
+        for entry in data.get("fields") or []:
+            value = entry.get("value")
+            if value is None:
+                continue
+            for key in ("label", "id"):
+                name = entry.get(key)
+                if name:
+                    fields.setdefault(name.lower(), value)
+        return fields
+
+    def _vault_id(self, vault: str) -> str:
+        with self._lock:
+            if vault in self._vault_ids:
+                return self._vault_ids[vault]
+
+        vault_id = self._lookup_id(f"/v1/vaults?filter={_filter('name', vault)}", vault)
+
+        with self._lock:
+            self._vault_ids[vault] = vault_id
+        return vault_id
+
+    def _item_id(self, vault_id: str, vault: str, item: str) -> str:
+        with self._lock:
+            if (vault_id, item) in self._item_ids:
+                return self._item_ids[(vault_id, item)]
+
+        item_id = self._lookup_id(
+            f"/v1/vaults/{quote(vault_id)}/items?filter={_filter('title', item)}",
+            f"{vault}/{item}"
+        )
+
+        with self._lock:
+            self._item_ids[(vault_id, item)] = item_id
+        return item_id
+
+    def _lookup_id(self, path: str, what: str) -> str:
+        matches = self._get_json(path, what)
+        if not matches:
+            raise SecretNotFoundError(
+                f"Failed to fetch secret from secrets server. Vault/item: {what}. Error: not found"
+            )
+        return matches[0]["id"]
+
+    def _get_json(self, path: str, what: str) -> Any:
+        metrics.incr("http.requests")
+        try:
+            status, body = self._pool.request("GET", self._prefix + path, self._headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise BackendUnavailableError(f"Secrets server {self.base_url} unreachable: {e}")
+
+        if status in (401, 403):
+            raise AuthenticationError(
+                f"Secrets server rejected the token (HTTP {status}). "
+                f"Check that {CONNECT_TOKEN_ENV_VAR} is valid."
+            )
+        if status == 404:
+            raise SecretNotFoundError(
+                f"Failed to fetch secret from secrets server. Vault/item: {what}. Error: HTTP 404"
+            )
+        if status >= 400:
+            raise BackendUnavailableError(f"Secrets server returned HTTP {status} for {what}")
+
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise BackendUnavailableError(f"Secrets server returned invalid JSON for {what}")
+
+
+def _filter(attribute: str, value: str) -> str:
+    """Build a URL-encoded `<attribute> eq "<value>"` filter expression."""
+    return quote(f'{attribute} eq "{value}"')
+
+
+class _ConnectionPool:
+    """
+    Fixed-size pool of keep-alive HTTP(S) connections to one host.
+
+    At most `size` requests are in flight; idle connections are reused
+    most-recently-used first. A request on a reused connection that the
+    server already closed is retried once on a fresh connection.
+    """
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], size: int, timeout: float):
+        self._factory: Callable[[], http.client.HTTPConnection]
+        if scheme == "https":
+            self._factory = lambda: http.client.HTTPSConnection(host, port, timeout=timeout)
+        else:
+            self._factory = lambda: http.client.HTTPConnection(host, port, timeout=timeout)
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._opened_lock = threading.Lock()
+        self.opened = 0
+
+    def request(self, method: str, path: str, headers: Dict[str, str]) -> Tuple[int, bytes]:
+        with self._slots:
+            try:
+                conn, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self._new(), False
+
+            while True:
+                try:
+                    conn.request(method, path, headers=headers)
+                    response = conn.getresponse()
+                    body = response.read()
+                except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                        ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    if not reused:
+                        raise
+                    # Stale keep-alive connection: retry once on a new one
+                    conn, reused = self._new(), False
+                    continue
+                except BaseException:
+                    conn.close()
+                    raise
+
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._idle.put(conn)
+                return response.status, body
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _new(self) -> http.client.HTTPConnection:
+        with self._opened_lock:
+            self.opened += 1
+        return self._factory()
+
+
+# ========== REGISTRY ==========
+
+_BACKENDS: Dict[str, SecretBackend] = {}
+_BACKENDS_LOCK = threading.Lock()
+
+# Backends created on first use when not registered explicitly
+_DEFAULT_FACTORIES: Dict[str, Callable[[], SecretBackend]] = {
+    "op": OpCliBackend,
+    "connect": HttpBackend.from_env,
+    "file": FileBackend.from_env,
+}
+
+
+def register_backend(name: str, backend: SecretBackend) -> None:
+    """Install backend under name, replacing (and closing) any previous one."""
+    with _BACKENDS_LOCK:
+        previous = _BACKENDS.get(name)
+        _BACKENDS[name] = backend
+    if previous is not None and previous is not backend:
+        previous.close()
+
+
+def unregister_backend(name: str) -> Optional[SecretBackend]:
+    """Remove and return the backend registered under name (not closed)."""
+    with _BACKENDS_LOCK:
+        return _BACKENDS.pop(name, None)
+
+
+def is_known_backend(name: str) -> bool:
+    """True if tags naming name can be served: registered, or created on first use."""
+    name = resolve_backend_name(name)
+    with _BACKENDS_LOCK:
+        return name in _BACKENDS or name in _DEFAULT_FACTORIES
+
+
+def resolve_backend_name(name: str) -> str:
+    """Apply configuration: HAUNT_SECRETS_BACKEND redirects `op` tags."""
+    if name == "op":
+        return os.environ.get(BACKEND_ENV_VAR) or "op"
+    return name
+
+
+def get_backend(name: str) -> SecretBackend:
+    """
+    Return the backend serving tags named name, creating a default one if needed.
+
+    Raises:
+        ValueError: If no backend is registered or known under that name
+        BackendUnavailableError / MissingTokenError: If a default backend is misconfigured
+    """
+    name = resolve_backend_name(name)
+
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(name)
+        if backend is not None:
+            return backend
+
+        factory = _DEFAULT_FACTORIES.get(name)
+        if factory is None:
+            raise ValueError(
+                f"Unknown secret backend '{name}'. "
+                f"Register one with register_backend('{name}', backend)."
+            )
+        backend = _BACKENDS[name] = factory()
+        return backend
+
+
+# ========== 1PASSWORD CLI ==========
+
+def _fetch_secret(vault: str, item: str, field: str) -> str:
+    """
+    Fetch secret from 1Password using op CLI.
+
+    Args:
+        vault: Vault name
+        item: Item name
+        field: Field name
+
+    Returns:
+        Secret value from 1Password (whitespace stripped)
+
+    Raises:
+        AuthenticationError: If the service account token is rejected
+        SecretNotFoundError: If op cannot read the secret
+        OpNotInstalledError: If op is not installed
+    """
+    # Construct op read command: op read op://vault/item/field
+    secret_ref = f"op://{vault}/{item}/{field}"
+    cmd = ["op", "read", secret_ref]
+
+    metrics.incr("subprocess.op read")
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,  # Prevent leaks to stdout/stderr
+            text=True,
+            check=False  # We'll handle errors manually
+        )
+    except FileNotFoundError:
+        raise op_not_installed()
+
+    if result.returncode != 0:
+        # Sanitize error - don't expose secret path details in error message
+        raise op_error(result.stderr, f"{vault}/{item}/{field}")
+
+    # Return secret value, stripping trailing whitespace/newlines
+    return result.stdout.strip()
+
+
+def _fetch_secrets_batch(references: List[str]) -> Dict[str, str]:
+    """
+    Resolve many op:// references with a single `op inject` invocation.
+
+    A template containing one `{{ op://vault/item/field }}` placeholder per
+    unique reference is fed to `op inject` on stdin. Each placeholder is
+    wrapped in a random boundary line so values (including multiline ones)
+    can be mapped back to their reference.
+
+    If the batch call fails, every reference is re-read individually with
+    _fetch_secret() so the error names the vault/item/field that failed.
+
+    Args:
+        references: op:// references to resolve (duplicates are fetched once)
+
+    Returns:
+        Dict mapping each reference to its secret value (whitespace stripped)
+
+    Raises:
+        OpNotInstalledError: If op is not installed
+        AuthenticationError: If the service account token is rejected
+        SecretNotFoundError: If a reference cannot be resolved
+    """
+    unique_refs = list(dict.fromkeys(references))
+    if not unique_refs:
+        return {}
+
+    boundary, template = _batch_template(unique_refs)
+
+    metrics.incr("subprocess.op inject")
+    try:
+        result = subprocess.run(
+            ["op", "inject"],
+            input=template,
+            capture_output=True,  # Prevent leaks to stdout/stderr
+            text=True,
+            check=False
+        )
+    except FileNotFoundError:
+        raise op_not_installed()
+
+    values = _split_batch_output(result.stdout, boundary, unique_refs) if result.returncode == 0 else None
+
+    # Anything unexpected means op rejected the template: retry one by one
+    if values is None:
+        return {ref: _fetch_secret(*_strip_scheme(ref).split("/", 2)) for ref in unique_refs}
+
+    return values
+
+
+def _batch_template(references: List[str]) -> Tuple[str, str]:
+    """Build an `op inject` template with one boundary-wrapped placeholder per reference."""
+    boundary = f"--haunt-secrets-{secrets.token_hex(16)}--"
+    template = "".join(f"{boundary}\n{{{{ {ref} }}}}\n" for ref in references)
+    template += f"{boundary}\n"
+    return boundary, template
+
+
+def _split_batch_output(output: str, boundary: str, references: List[str]) -> Optional[Dict[str, str]]:
+    """Map injected output back to references, or None if it doesn't match the template."""
+    chunks = output.split(f"{boundary}\n")
+
+    # Leading/trailing chunks are empty; anything else means op rejected the template
+    if len(chunks) != len(references) + 2:
+        return None
+
+    return {
+        ref: value.strip()
+        for ref, value in zip(references, chunks[1:-1])
+    }
+
+
+def _strip_scheme(reference: str) -> str:
+    """Drop a leading "<backend>://" from a reference."""
+    scheme, sep, rest = reference.partition("://")
+    return rest if sep else reference
@@ -0,0 +1,251 @@
+"""Opt-in encrypted on-disk cache for secrets resolved from 1Password.
+
+Entries are keyed by op://vault/item/field reference, expire after a
+per-entry TTL, and are encrypted with keys derived from
+OP_SERVICE_ACCOUNT_TOKEN so only holders of the same token can read them.
+
+The cache lives in a tmpfs-friendly directory (XDG_RUNTIME_DIR or /dev/shm
+when available) created with 0700 permissions; entry files are 0600.
+
+Encryption uses only the standard library: an HMAC-SHA256 keystream in
+counter mode (encrypt) followed by an HMAC-SHA256 tag over the whole entry
+(encrypt-then-MAC). Reference names are never written to disk - file names
+are keyed HMACs of the reference.
+"""
+
+import hashlib
+import hmac
+import os
+import secrets
+import struct
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from . import metrics
+
+# Default entry lifetime in seconds
+DEFAULT_TTL_SECONDS = 300
+
+# Environment variable overriding the cache directory
+CACHE_DIR_ENV_VAR = "HAUNT_SECRETS_CACHE_DIR"
+
+# Token used to derive cache keys
+TOKEN_ENV_VAR = "OP_SERVICE_ACCOUNT_TOKEN"
+
+# On-disk entry layout: version | nonce | expires_at | ciphertext | tag
+_FORMAT_VERSION = 1
+_NONCE_SIZE = 16
+_TAG_SIZE = 32
+_HEADER = struct.Struct(">B16sd")
+_ENTRY_SUFFIX = ".entry"
+
+
+class SecretCache:
+    """
+    TTL-bounded, encrypted on-disk cache of resolved secret values.
+
+    Usage:
+        cache = SecretCache(ttl=600)
+        secrets = get_secrets('.env', cache=cache)  # first run fetches via op
+        secrets = get_secrets('.env', cache=cache)  # within TTL: no op spawned
+
+    Attributes:
+        ttl: Default entry lifetime in seconds
+        directory: Directory holding the encrypted entry files
+        hits: Number of get() calls answered from the cache
+        misses: Number of get() calls that found no valid entry
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        directory: Optional[Union[str, Path]] = None,
+        token: Optional[str] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Default lifetime of new entries in seconds
+            directory: Cache directory (default: default_cache_dir())
+            token: Key material (default: OP_SERVICE_ACCOUNT_TOKEN)
+
+        Raises:
+            RuntimeError: If no token is available to derive keys from
+            RuntimeError: If the cache directory is not private to this user
+        """
+        token = token if token is not None else os.environ.get(TOKEN_ENV_VAR)
+        if not token:
+            raise RuntimeError(
+                f"{TOKEN_ENV_VAR} environment variable must be set. "
+                "The secret cache derives its encryption key from this token."
+            )
+
+        self.ttl = ttl
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+        self._enc_key = _derive_key(token, b"encrypt")
+        self._mac_key = _derive_key(token, b"authenticate")
+        self._name_key = _derive_key(token, b"entry-name")
+
+        _ensure_private_dir(self.directory)
+
+    def get(self, reference: str) -> Optional[str]:
+        """
+        Return the cached value for reference, or None if absent/expired.
+
+        Expired, corrupt, or foreign (different token) entries count as misses;
+        expired and corrupt entries are removed.
+        """
+        entry_path = self._entry_path(reference)
+        try:
+            data = entry_path.read_bytes()
+        except OSError:
+            self.misses += 1
+            metrics.incr("cache.misses")
+            return None
+
+        value = self._decrypt(reference, data)
+        if value is None:
+            _unlink_quietly(entry_path)
+            self.misses += 1
+            metrics.incr("cache.misses")
+            return None
+
+        self.hits += 1
+        metrics.incr("cache.hits")
+        return value
+
+    def set(self, reference: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        Store value for reference, expiring after ttl seconds (default: self.ttl).
+
+        The entry is written to a 0600 temp file and atomically renamed into place.
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        data = self._encrypt(reference, value, expires_at)
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, self._entry_path(reference))
+        except BaseException:
+            _unlink_quietly(Path(tmp_name))
+            raise
+
+    def invalidate(self, reference: Optional[str] = None) -> int:
+        """
+        Remove one entry, or every entry in the cache directory if reference is None.
+
+        Returns:
+            Number of entries removed
+        """
+        if reference is not None:
+            return 1 if _unlink_quietly(self._entry_path(reference)) else 0
+
+        removed = 0
+        for entry_path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            if _unlink_quietly(entry_path):
+                removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters as a dict."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _entry_path(self, reference: str) -> Path:
+        """File name is a keyed hash so reference names never touch disk."""
+        name = hmac.new(self._name_key, reference.encode(), hashlib.sha256).hexdigest()
+        return self.directory / f"{name}{_ENTRY_SUFFIX}"
+
+    def _encrypt(self, reference: str, value: str, expires_at: float) -> bytes:
+        nonce = secrets.token_bytes(_NONCE_SIZE)
+        plaintext = value.encode("utf-8")
+        ciphertext = _xor(plaintext, _keystream(self._enc_key, nonce, len(plaintext)))
+        body = _HEADER.pack(_FORMAT_VERSION, nonce, expires_at) + ciphertext
+        return body + self._tag(reference, body)
+
+    def _decrypt(self, reference: str, data: bytes) -> Optional[str]:
+        if len(data) < _HEADER.size + _TAG_SIZE:
+            return None
+
+        body, tag = data[:-_TAG_SIZE], data[-_TAG_SIZE:]
+        if not hmac.compare_digest(tag, self._tag(reference, body)):
+            return None
+
+        version, nonce, expires_at = _HEADER.unpack_from(body)
+        if version != _FORMAT_VERSION or expires_at <= time.time():
+            return None
+
+        ciphertext = body[_HEADER.size:]
+        plaintext = _xor(ciphertext, _keystream(self._enc_key, nonce, len(ciphertext)))
+        return plaintext.decode("utf-8")
+
+    def _tag(self, reference: str, body: bytes) -> bytes:
+        # Bind the entry to its reference so files can't be swapped between refs
+        return hmac.new(self._mac_key, reference.encode() + b"\0" + body, hashlib.sha256).digest()
+
+
+def default_cache_dir() -> Path:
+    """
+    Pick a tmpfs-friendly, per-user cache directory.
+
+    Order: $HAUNT_SECRETS_CACHE_DIR, $XDG_RUNTIME_DIR/haunt-secrets,
+    /dev/shm/haunt-secrets-<uid>, <tempdir>/haunt-secrets-<uid>.
+    """
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        return Path(override)
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return Path(runtime_dir) / "haunt-secrets"
+
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    if os.path.isdir("/dev/shm"):
+        return Path("/dev/shm") / f"haunt-secrets-{uid}"
+
+    return Path(tempfile.gettempdir()) / f"haunt-secrets-{uid}"
+
+
+def _derive_key(token: str, purpose: bytes) -> bytes:
+    """Derive an independent 256-bit key per purpose from the service account token."""
+    prk = hmac.new(b"haunt-secrets-cache-v1", token.encode("utf-8"), hashlib.sha256).digest()
+    return hmac.new(prk, purpose + b"\x01", hashlib.sha256).digest()
+
+
+def _keystream(key: bytes, nonce: bytes, length: int) -> bytes:
+    """HMAC-SHA256 in counter mode."""
+    blocks = []
+    for counter in range((length + 31) // 32):
+        blocks.append(hmac.new(key, nonce + counter.to_bytes(8, "big"), hashlib.sha256).digest())
+    return b"".join(blocks)[:length]
+
+
+def _xor(data: bytes, stream: bytes) -> bytes:
+    return (int.from_bytes(data, "big") ^ int.from_bytes(stream, "big")).to_bytes(len(data), "big")
+
+
+def _ensure_private_dir(directory: Path) -> None:
+    """Create directory as 0700 and refuse to use one owned by someone else."""
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    st = directory.stat()
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        raise RuntimeError(f"Secret cache directory {directory} is not owned by the current user")
+    if st.st_mode & 0o077:
+        os.chmod(directory, 0o700)
+
+
+def _unlink_quietly(path: Path) -> bool:
+    try:
+        path.unlink()
+        return True
+    except OSError:
+        return False
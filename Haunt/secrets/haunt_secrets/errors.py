@@ -0,0 +1,70 @@
+"""Exception types raised when resolving secrets from 1Password.
+
+Names match scripts/haunt_secrets.py so callers can handle both APIs the
+same way. Every class subclasses RuntimeError, which is what the package
+raised before these types existed, so `except RuntimeError` keeps working.
+"""
+
+
+class MissingTokenError(RuntimeError):
+    """Raised when OP_SERVICE_ACCOUNT_TOKEN environment variable is not set"""
+
+
+class OpNotInstalledError(RuntimeError):
+    """Raised when the 1Password CLI (op) is not installed or not found"""
+
+
+class AuthenticationError(RuntimeError):
+    """Raised when 1Password authentication fails"""
+
+
+class SecretNotFoundError(RuntimeError):
+    """Raised when vault, item, or field is not found in 1Password"""
+
+
+class SecretTimeoutError(RuntimeError):
+    """Raised when a 1Password fetch does not finish within its timeout"""
+
+
+class BackendUnavailableError(RuntimeError):
+    """Raised when a secret backend cannot be reached or is not configured"""
+
+
+def op_error(stderr: str, location: str) -> RuntimeError:
+    """
+    Build the exception for a failed `op` call from its stderr.
+
+    Args:
+        stderr: Error output of the op process
+        location: "vault/item/field" of the secret being fetched
+
+    Returns:
+        AuthenticationError for token/auth failures, SecretNotFoundError otherwise
+    """
+    stderr = stderr.strip()
+    message = (
+        f"Failed to fetch secret from 1Password. "
+        f"Vault/item/field: {location}. "
+        f"Error: {stderr}"
+    )
+
+    lowered = stderr.lower()
+    if "invalid service account token" in lowered or "authentication" in lowered:
+        return AuthenticationError(message)
+    return SecretNotFoundError(message)
+
+
+def op_not_installed() -> OpNotInstalledError:
+    """Build the exception for a missing op executable."""
+    return OpNotInstalledError(
+        "1Password CLI (op) not found. "
+        "Install it from: https://developer.1password.com/docs/cli/get-started/"
+    )
+
+
+def missing_token() -> MissingTokenError:
+    """Build the exception for a missing service account token."""
+    return MissingTokenError(
+        "OP_SERVICE_ACCOUNT_TOKEN environment variable must be set. "
+        "This token is required to authenticate with 1Password CLI."
+    )
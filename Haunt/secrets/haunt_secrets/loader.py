@@ -1,15 +1,33 @@
 """Load secrets from 1Password via subprocess and expose as environment variables or dict."""
 
 import os
-import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Union
-
-from .parser import parse_env_file
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .backends import (  # noqa: F401 - re-exported for aio and existing callers
+    _batch_template,
+    _fetch_secret,
+    _fetch_secrets_batch,
+    _split_batch_output,
+    get_backend,
+)
+from . import metrics
+from .errors import missing_token
+from .parser import _secrets_with_warnings
 from .redaction import register_secret
+from .tokenizer import DEFAULT_BACKEND, tokenize_env_file
+
+if TYPE_CHECKING:
+    from .cache import SecretCache
 
 
-def load_secrets(path: Union[str, Path]) -> None:
+def load_secrets(
+    path: Union[str, Path],
+    batch: bool = False,
+    cache: Optional["SecretCache"] = None
+) -> None:
     """
     Load secrets from .env file and export to os.environ.
 
@@ -20,6 +38,8 @@ def load_secrets(path: Union[str, Path]) -> None:
 
     Args:
         path: Path to .env file (string or Path object)
+        batch: If True, resolve all secrets with a single `op inject` call
+        cache: Optional SecretCache; cached references skip 1Password entirely
 
     Returns:
         None (side-effect only - exports to os.environ)
@@ -35,27 +55,39 @@ def load_secrets(path: Union[str, Path]) -> None:
         >>> print(os.environ['DB_PASSWORD'])
         secret_value_from_1password
     """
-    secrets_dict = get_secrets(path)
+    secrets_dict = get_secrets(path, batch=batch, cache=cache)
 
     # Export to environment
     for key, value in secrets_dict.items():
         os.environ[key] = value
 
 
-def get_secrets(path: Union[str, Path]) -> Dict[str, str]:
+def get_secrets(
+    path: Union[str, Path],
+    batch: bool = False,
+    cache: Optional["SecretCache"] = None,
+    lazy: bool = False
+) -> Union[Dict[str, str], "LazySecrets"]:
     """
     Load secrets from .env file and return as dict (no side effects).
 
     This function:
     1. Parses .env file to identify secrets (using @secret:op: tags)
-    2. Fetches secrets from 1Password using op CLI
+    2. Fetches secrets from 1Password using op CLI (or the backend named in the tag)
     3. Returns dict with ALL variables (secrets + plaintext)
 
     Args:
         path: Path to .env file (string or Path object)
+        batch: If True, resolve all secrets with a single `op inject` call
+            instead of one `op read` per variable
+        cache: Optional SecretCache; references cached within their TTL are
+            served from disk without spawning op, misses are stored after fetch
+        lazy: If True, return a LazySecrets mapping that fetches each secret
+            on first access instead of resolving everything up front
 
     Returns:
-        Dict mapping variable names to values (both secrets and plaintext)
+        Dict mapping variable names to values (both secrets and plaintext),
+        or a LazySecrets mapping when lazy is True
 
     Raises:
         RuntimeError: If OP_SERVICE_ACCOUNT_TOKEN not set
@@ -69,31 +101,180 @@ def get_secrets(path: Union[str, Path]) -> Dict[str, str]:
         >>> print(secrets['PLAIN_VAR'])
         plaintext_value
     """
-    # Validate token exists before proceeding
-    if "OP_SERVICE_ACCOUNT_TOKEN" not in os.environ:
-        raise RuntimeError(
-            "OP_SERVICE_ACCOUNT_TOKEN environment variable must be set. "
-            "This token is required to authenticate with 1Password CLI."
-        )
+    values, references = _merge_layers([path])
+
+    # Validate token exists before fetching anything
+    _require_token(references.values())
+
+    return _build_secrets(values, references, batch=batch, cache=cache, lazy=lazy)
+
+
+def load_layered_secrets(
+    paths: Iterable[Union[str, Path]],
+    batch: bool = False,
+    cache: Optional["SecretCache"] = None,
+    missing_ok: bool = False
+) -> None:
+    """
+    Load stacked .env files and export the merged result to os.environ.
+
+    Same precedence and fetching rules as get_layered_secrets().
+
+    Raises:
+        RuntimeError: If OP_SERVICE_ACCOUNT_TOKEN not set
+        RuntimeError: If op command fails to fetch secret
+        FileNotFoundError: If a file is missing and missing_ok is False
+    """
+    secrets_dict = get_layered_secrets(paths, batch=batch, cache=cache, missing_ok=missing_ok)
+
+    for key, value in secrets_dict.items():
+        os.environ[key] = value
+
+
+def get_layered_secrets(
+    paths: Iterable[Union[str, Path]],
+    batch: bool = False,
+    cache: Optional["SecretCache"] = None,
+    missing_ok: bool = False,
+    lazy: bool = False
+) -> Union[Dict[str, str], "LazySecrets"]:
+    """
+    Load stacked .env files (later files override earlier ones) and return as dict.
+
+    Precedence is resolved before anything is fetched:
+    1. Each file is tokenized and its variables merged over the previous layers
+    2. A variable's final definition decides whether it is a secret or plaintext
+    3. The unique op:// references still needed are fetched once each and
+       fanned out to every variable that uses them
+
+    A secret overridden by a plaintext value in a later file is never fetched.
+
+    Args:
+        paths: .env files from lowest to highest precedence
+            (e.g. env_layers('.', 'prod') or ['.env', '.env.local', '.env.prod'])
+        batch: If True, resolve all needed references with a single `op inject` call
+        cache: Optional SecretCache consulted before 1Password
+        missing_ok: If True, silently skip files that do not exist
+        lazy: If True, return a LazySecrets mapping (see get_secrets)
+
+    Returns:
+        Dict mapping every variable from every layer to its final value,
+        or a LazySecrets mapping when lazy is True
+
+    Raises:
+        RuntimeError: If OP_SERVICE_ACCOUNT_TOKEN not set
+        RuntimeError: If op command fails to fetch secret
+        FileNotFoundError: If a file is missing and missing_ok is False
+
+    Example:
+        >>> secrets = get_layered_secrets(env_layers('.', 'staging'))
+    """
+    values, references = _merge_layers(paths, missing_ok=missing_ok)
+    _require_token(references.values())
+
+    return _build_secrets(values, references, batch=batch, cache=cache, lazy=lazy)
+
+
+def env_layers(directory: Union[str, Path] = ".", stage: Optional[str] = None) -> List[Path]:
+    """
+    Return the existing .env layers in directory, lowest precedence first.
+
+    Order: .env, .env.local, .env.<stage> (when stage is given).
+
+    Example:
+        >>> env_layers('.', 'prod')
+        [PosixPath('.env'), PosixPath('.env.local'), PosixPath('.env.prod')]
+    """
+    directory = Path(directory)
+    names = [".env", ".env.local"]
+    if stage:
+        names.append(f".env.{stage}")
+
+    return [directory / name for name in names if (directory / name).is_file()]
+
+
+def _require_token(references: Iterable[str]) -> None:
+    """
+    Fail fast before any fetching if a backend needs the missing service account token.
+
+    Only the op CLI backend needs OP_SERVICE_ACCOUNT_TOKEN; files whose
+    secrets all live in other backends (or that have no secrets) load without it.
+    """
+    if "OP_SERVICE_ACCOUNT_TOKEN" in os.environ:
+        return
+
+    for backend in dict.fromkeys(_reference_backend(ref) for ref in references):
+        if get_backend(backend).requires_op_token:
+            raise missing_token()
+
+
+def _merge_layers(
+    paths: Iterable[Union[str, Path]],
+    missing_ok: bool = False
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Merge .env files in precedence order without fetching anything.
+
+    Returns:
+        (values, references): every variable's final .env value in first-seen
+        order, and the <backend>:// reference of each variable whose final
+        definition is a tagged secret
+    """
+    values: Dict[str, str] = {}
+    references: Dict[str, str] = {}
+
+    for path in paths:
+        if missing_ok and not Path(path).exists():
+            continue
+
+        # Tokenize .env once: secret tags and all variables (secrets + plaintext)
+        tokens = tokenize_env_file(path)
+        secrets_metadata = _secrets_with_warnings(tokens)
+
+        for var_name, value in tokens.assignments.items():
+            values[var_name] = value
+            metadata = secrets_metadata.get(var_name)
+            if metadata is not None:
+                references[var_name] = _secret_reference(
+                    metadata["vault"], metadata["item"], metadata["field"], metadata["backend"]
+                )
+            else:
+                # Plaintext override: an earlier layer's secret must not be fetched
+                references.pop(var_name, None)
+
+    return values, references
+
+
+def _build_secrets(
+    values: Dict[str, str],
+    references: Dict[str, str],
+    batch: bool = False,
+    cache: Optional["SecretCache"] = None,
+    lazy: bool = False,
+    resolved: Optional[Dict[str, str]] = None
+) -> Union[Dict[str, str], "LazySecrets"]:
+    """
+    Resolve references once each and substitute them into values.
 
-    # Parse .env file to identify secrets
-    path_obj = Path(path)
-    secrets_metadata = parse_env_file(path_obj)
+    resolved, if given, must already map every reference to its value
+    (used by the asyncio loader, which fetches on its own).
+    """
+    if lazy:
+        return LazySecrets(values, references, batch=batch, cache=cache)
 
-    # Read all variables from .env (both secrets and plaintext)
-    all_vars = _read_all_env_vars(path_obj)
+    # Resolve each unique reference once (cache first, then 1Password)
+    if resolved is not None:
+        secret_values = resolved
+    else:
+        secret_values = _resolve_references(list(references.values()), batch=batch, cache=cache)
 
-    # Fetch secrets from 1Password and replace placeholders
+    # Replace placeholders with resolved secrets
     result = {}
-    for var_name, value in all_vars.items():
-        if var_name in secrets_metadata:
-            # This is a secret - fetch from 1Password
-            metadata = secrets_metadata[var_name]
-            secret_value = _fetch_secret(
-                metadata["vault"],
-                metadata["item"],
-                metadata["field"]
-            )
+    for var_name, value in values.items():
+        reference = references.get(var_name)
+        if reference is not None:
+            # This is a secret - use the value resolved from 1Password
+            secret_value = secret_values[reference]
             result[var_name] = secret_value
 
             # Register secret with redaction module to prevent leaks
@@ -105,76 +286,192 @@ def get_secrets(path: Union[str, Path]) -> Dict[str, str]:
     return result
 
 
-def _fetch_secret(vault: str, item: str, field: str) -> str:
+class LazySecrets(Mapping[str, str]):
     """
-    Fetch secret from 1Password using op CLI.
+    Read-only mapping of .env variables whose secrets are fetched on first access.
 
-    Args:
-        vault: Vault name
-        item: Item name
-        field: Field name
+    Every variable name is known up front; plaintext values are available
+    immediately. Each secret is fetched from 1Password (or the cache) the
+    first time it is read, memoized, and registered for redaction. Variables
+    sharing a reference share one fetch. Use prefetch() to resolve several
+    secrets with one `op inject` call before reading them.
 
-    Returns:
-        Secret value from 1Password (whitespace stripped)
+    Iterating keys never fetches; reading values (items(), values(), dict(...))
+    fetches each pending secret individually, so prefetch() first when most
+    values are needed.
 
-    Raises:
-        RuntimeError: If op command fails
-    """
-    # Construct op read command: op read op://vault/item/field
-    secret_ref = f"op://{vault}/{item}/{field}"
-    cmd = ["op", "read", secret_ref]
-
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,  # Prevent leaks to stdout/stderr
-            text=True,
-            check=False  # We'll handle errors manually
-        )
-
-        if result.returncode != 0:
-            # Sanitize error - don't expose secret path details in error message
-            raise RuntimeError(
-                f"Failed to fetch secret from 1Password. "
-                f"Vault/item/field: {vault}/{item}/{field}. "
-                f"Error: {result.stderr.strip()}"
+    Usage:
+        secrets = get_secrets('.env', lazy=True)   # no op calls yet
+        secrets['APP_NAME']                        # plaintext, no op call
+        secrets['DB_PASSWORD']                     # one `op read`, memoized
+        secrets.prefetch(['API_KEY', 'STRIPE_KEY'])  # one `op inject`
+
+    Thread-safe: concurrent readers of the same secret trigger one fetch.
+    """
+
+    def __init__(
+        self,
+        values: Dict[str, str],
+        references: Dict[str, str],
+        batch: bool = False,
+        cache: Optional["SecretCache"] = None
+    ):
+        """
+        Initialize the mapping.
+
+        Args:
+            values: All variables from the .env file, in file order
+            references: Secret variable names mapped to op:// references
+            batch: If True, single-key misses also go through `op inject`
+            cache: Optional SecretCache consulted before 1Password
+        """
+        self._values = values
+        self._references = references
+        self._batch = batch
+        self._cache = cache
+        self._resolved: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> str:
+        reference = self._references.get(key)
+        if reference is None:
+            return self._values[key]
+
+        if reference not in self._resolved:
+            self.prefetch([key])
+        return self._resolved[reference]
+
+    def __contains__(self, key: object) -> bool:
+        # Mapping's default would call __getitem__ and fetch the secret
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        # Never include values: plaintext is harmless but fetched secrets are not
+        return f"{type(self).__name__}({list(self._values)!r})"
+
+    def is_secret(self, key: str) -> bool:
+        """Return True if key is a tagged secret (fetched or not)."""
+        return key in self._references
+
+    def is_resolved(self, key: str) -> bool:
+        """Return True if key's value is available without contacting 1Password."""
+        reference = self._references.get(key)
+        return reference is None or reference in self._resolved
+
+    def prefetch(self, keys: Optional[Iterable[str]] = None) -> None:
+        """
+        Resolve the secrets behind keys (default: every secret) in one round.
+
+        Pending references are deduplicated and, when more than one is
+        pending, fetched with a single `op inject` call. Plaintext and
+        already-resolved keys are ignored.
+
+        Raises:
+            KeyError: If a key is not a variable in the .env file
+            RuntimeError: If op command fails to fetch a secret
+        """
+        keys = list(self._references if keys is None else keys)
+        for key in keys:
+            if key not in self._values:
+                raise KeyError(key)
+
+        with self._lock:
+            pending = {
+                key: self._references[key]
+                for key in keys
+                if key in self._references and self._references[key] not in self._resolved
+            }
+            if not pending:
+                return
+
+            unique_refs = list(dict.fromkeys(pending.values()))
+            fetched = _resolve_references(
+                unique_refs,
+                batch=self._batch or len(unique_refs) > 1,
+                cache=self._cache
             )
 
-        # Return secret value, stripping trailing whitespace/newlines
-        return result.stdout.strip()
+            # Register every variable sharing a fetched reference
+            for var_name, reference in self._references.items():
+                if reference in fetched:
+                    register_secret(var_name, fetched[reference])
 
-    except FileNotFoundError:
-        raise RuntimeError(
-            "1Password CLI (op) not found. "
-            "Install it from: https://developer.1password.com/docs/cli/get-started/"
-        )
+            self._resolved.update(fetched)
 
 
-def _read_all_env_vars(path: Path) -> Dict[str, str]:
+def _resolve_references(
+    references: List[str],
+    batch: bool = False,
+    cache: Optional["SecretCache"] = None
+) -> Dict[str, str]:
     """
-    Read all variable assignments from .env file.
+    Resolve references, consulting the cache before their backends.
 
-    This includes both secrets (which will be replaced) and plaintext variables.
+    Cache misses are grouped by backend. A backend receives all of its
+    references in one fetch_many() call when batch is set or the backend
+    prefers bulk fetches (e.g. HTTP); otherwise it is asked one at a time.
 
     Args:
-        path: Path to .env file
+        references: <backend>:// references to resolve (duplicates resolved once)
+        batch: If True, fetch each backend's cache misses in one call
+            (a single `op inject` for 1Password)
+        cache: Optional SecretCache to read from and populate
 
     Returns:
-        Dict mapping variable names to their values from .env file
+        Dict mapping each reference to its secret value
     """
-    result = {}
-    content = path.read_text()
+    values = {}
+    missing = []
+    for ref in dict.fromkeys(references):
+        cached = cache.get(ref) if cache is not None else None
+        if cached is not None:
+            values[ref] = cached
+        else:
+            missing.append(ref)
+
+    by_backend: Dict[str, List[str]] = {}
+    for ref in missing:
+        by_backend.setdefault(_reference_backend(ref), []).append(ref)
+
+    fetched = {}
+    for name, refs in by_backend.items():
+        backend = get_backend(name)
+        parts = {ref: tuple(_split_reference(ref)) for ref in refs}
+        if batch or backend.prefers_bulk:
+            with metrics.timed(f"fetch.batch:{name}"):
+                results = backend.fetch_many(list(parts.values()))
+            fetched.update({ref: results[part] for ref, part in parts.items()})
+        else:
+            for ref, part in parts.items():
+                start = time.perf_counter()
+                fetched[ref] = backend.fetch(*part)
+                metrics.record_fetch(ref, time.perf_counter() - start)
 
-    for line in content.splitlines():
-        line = line.strip()
+    if cache is not None:
+        for ref, value in fetched.items():
+            cache.set(ref, value)
 
-        # Skip comments and empty lines
-        if not line or line.startswith("#"):
-            continue
+    values.update(fetched)
+    return values
 
-        # Check for variable assignment
-        if "=" in line:
-            var_name, var_value = line.split("=", 1)
-            result[var_name.strip()] = var_value.strip()
 
-    return result
+def _secret_reference(vault: str, item: str, field: str, backend: str = DEFAULT_BACKEND) -> str:
+    """Build the <backend>://vault/item/field reference for a secret (op://... for 1Password)."""
+    return f"{backend}://{vault}/{item}/{field}"
+
+
+def _split_reference(reference: str) -> List[str]:
+    """Split a <backend>://vault/item/field reference back into its three parts."""
+    return reference.partition("://")[2].split("/", 2)
+
+
+def _reference_backend(reference: str) -> str:
+    """Return the backend name of a <backend>://vault/item/field reference."""
+    return reference.partition("://")[0]
+
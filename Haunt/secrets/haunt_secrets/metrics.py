@@ -0,0 +1,166 @@
+"""Timing and counter instrumentation for secret loading and redaction.
+
+Every stage records into one process-wide registry:
+
+- parse: .env tokenization (files read vs memo hits, time spent)
+- fetch: per-reference and per-vault latency, batch calls per backend,
+  HTTP requests
+- subprocess: op processes spawned, by subcommand
+- cache: SecretCache hits and misses
+- redaction: calls and characters scanned by redact(), contains_secret()
+  and redact_structure()
+
+Only names and references are recorded, never secret values.
+
+Usage:
+    from haunt_secrets import load_secrets, stats
+    load_secrets('.env')
+    print(stats()["fetch"]["vaults"])       # slowest vaults first
+
+Set HAUNT_SECRETS_STATS=<path> to have the stats written as JSON when
+the process exits. Counters on hot paths (redaction) are updated without
+a lock, so they can under-count slightly under heavy concurrency.
+
+redaction imports this module, so it only imports builtin modules and ones
+the interpreter loads at startup (json is imported when stats are dumped).
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import time
+from _thread import allocate_lock
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional
+
+# Environment variable naming a file to write stats JSON to at exit
+STATS_ENV_VAR = "HAUNT_SECRETS_STATS"
+
+# name -> count
+_COUNTERS: Dict[str, int] = {}
+
+# name -> [count, total seconds, max seconds]
+_TIMERS: Dict[str, List[float]] = {}
+
+# threading.Lock without importing threading
+_LOCK = allocate_lock()
+
+
+def incr(name: str, amount: int = 1) -> None:
+    """Add amount to the counter name."""
+    _COUNTERS[name] = _COUNTERS.get(name, 0) + amount
+
+
+def record_time(name: str, seconds: float) -> None:
+    """Add one observation of seconds to the timer name."""
+    with _LOCK:
+        timer = _TIMERS.get(name)
+        if timer is None:
+            _TIMERS[name] = [1, seconds, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+
+class timed:
+    """Context manager recording the duration of the with-block under the timer name (also on error)."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        record_time(self.name, time.perf_counter() - self._start)
+
+
+def stats() -> Dict[str, Any]:
+    """
+    Return a snapshot of every counter and timer, grouped by stage.
+
+    Returns:
+        Dict with "parse", "fetch", "subprocess", "cache" and "redaction"
+        sections. Timers are {"count", "total_ms", "mean_ms", "max_ms"};
+        fetch "references" and "vaults" are sorted slowest (by total) first.
+    """
+    with _LOCK:
+        counters = dict(_COUNTERS)
+        timers = {name: _timer_summary(*values) for name, values in _TIMERS.items()}
+
+    def section(prefix: str) -> Dict[str, Any]:
+        grouped = {name[len(prefix):]: timing for name, timing in timers.items() if name.startswith(prefix)}
+        return dict(sorted(grouped.items(), key=lambda item: -item[1]["total_ms"]))
+
+    return {
+        "parse": {
+            "files_read": counters.get("parse.files", 0),
+            "memo_hits": counters.get("parse.memo_hits", 0),
+            "time": timers.get("parse", _timer_summary(0, 0.0, 0.0)),
+        },
+        "fetch": {
+            "references": section("fetch.reference:"),
+            "vaults": section("fetch.vault:"),
+            "batches": section("fetch.batch:"),
+            "http_requests": counters.get("http.requests", 0),
+        },
+        "subprocess": {
+            name[len("subprocess."):]: count
+            for name, count in sorted(counters.items()) if name.startswith("subprocess.")
+        },
+        "cache": {
+            "hits": counters.get("cache.hits", 0),
+            "misses": counters.get("cache.misses", 0),
+        },
+        "redaction": {
+            "calls": counters.get("redaction.calls", 0),
+            "chars_scanned": counters.get("redaction.chars", 0),
+        },
+    }
+
+
+def stats_json(indent: Optional[int] = 2) -> str:
+    """Return stats() serialized as JSON."""
+    import json
+
+    return json.dumps(stats(), indent=indent)
+
+
+def reset_stats() -> None:
+    """Zero every counter and timer."""
+    with _LOCK:
+        _COUNTERS.clear()
+        _TIMERS.clear()
+
+
+def record_fetch(reference: str, seconds: float) -> None:
+    """Record the latency of fetching one <backend>://vault/item/field reference."""
+    record_time(f"fetch.reference:{reference}", seconds)
+    scheme, _, rest = reference.partition("://")
+    record_time(f"fetch.vault:{scheme}://{rest.split('/', 1)[0]}", seconds)
+
+
+def _timer_summary(count: float, total: float, maximum: float) -> Dict[str, float]:
+    return {
+        "count": int(count),
+        "total_ms": round(total * 1000, 3),
+        "mean_ms": round(total * 1000 / count, 3) if count else 0.0,
+        "max_ms": round(maximum * 1000, 3),
+    }
+
+
+def _write_at_exit() -> None:
+    path = os.environ.get(STATS_ENV_VAR)
+    if path:
+        try:
+            with open(path, "w") as f:
+                f.write(stats_json())
+        except OSError:
+            pass
+
+
+atexit.register(_write_at_exit)
@@ -4,9 +4,15 @@ import sys
 from pathlib import Path
 from typing import Dict, Union
 
-# Tag format constants
-SECRET_TAG_PREFIX = "# @secret:op:"
-REQUIRED_TAG_PARTS = 3  # vault/item/field
+# Tag constants live with the tokenizer; re-exported here for existing importers
+from .tokenizer import (  # noqa: F401
+    DEFAULT_BACKEND,
+    REQUIRED_TAG_PARTS,
+    SECRET_TAG_PREFIX,
+    EnvTokens,
+    tokenize_env_content,
+    tokenize_env_file,
+)
 
 
 def parse_env_content(content: str) -> Dict[str, Dict[str, str]]:
@@ -36,67 +42,7 @@ def parse_env_content(content: str) -> Dict[str, Dict[str, str]]:
         >>> result["DB_PASSWORD"]["vault"]
         'prod'
     """
-    secrets = {}
-    lines = content.splitlines()
-
-    # Track the last seen tag
-    last_tag = None
-
-    for line in lines:
-        line = line.strip()
-
-        if _is_secret_tag(line):
-            last_tag = _parse_secret_tag(line)
-        elif _is_variable_assignment(line):
-            if last_tag is not None:
-                var_name = _extract_variable_name(line)
-                secrets[var_name] = last_tag
-                last_tag = None
-
-    return secrets
-
-
-def _is_secret_tag(line: str) -> bool:
-    """Check if line is a secret tag comment."""
-    return line.startswith(SECRET_TAG_PREFIX)
-
-
-def _is_variable_assignment(line: str) -> bool:
-    """Check if line is a variable assignment (not a comment)."""
-    return "=" in line and not line.startswith("#")
-
-
-def _extract_variable_name(line: str) -> str:
-    """Extract variable name from assignment line."""
-    return line.split("=")[0].strip()
-
-
-def _parse_secret_tag(line: str) -> Dict[str, str] | None:
-    """
-    Parse secret tag and return metadata dict or None if malformed.
-
-    Args:
-        line: Line containing secret tag (e.g., "# @secret:op:vault/item/field")
-
-    Returns:
-        Dict with vault/item/field keys, or None if malformed
-    """
-    tag_content = line[len(SECRET_TAG_PREFIX):].strip()
-    parts = tag_content.split("/")
-
-    if len(parts) == REQUIRED_TAG_PARTS:
-        vault, item, field = parts
-        return {
-            "vault": vault,
-            "item": item,
-            "field": field
-        }
-    else:
-        print(
-            f"WARNING: Malformed secret tag (expected {REQUIRED_TAG_PARTS} parts, got {len(parts)}): {line}",
-            file=sys.stderr
-        )
-        return None
+    return _secrets_with_warnings(tokenize_env_content(content))
 
 
 def parse_env_file(path: Union[str, Path]) -> Dict[str, Dict[str, str]]:
@@ -117,10 +63,35 @@ def parse_env_file(path: Union[str, Path]) -> Dict[str, Dict[str, str]]:
         >>> "API_KEY" in result
         True
     """
-    path_obj = Path(path)
+    return _secrets_with_warnings(tokenize_env_file(path))
 
-    if not path_obj.exists():
-        raise FileNotFoundError(f"File not found: {path}")
 
-    content = path_obj.read_text()
-    return parse_env_content(content)
+def _secrets_with_warnings(tokens: EnvTokens) -> Dict[str, Dict[str, str]]:
+    """
+    Report malformed tags and return a caller-owned copy of the secret metadata.
+
+    Tags naming a backend that is neither registered nor built in
+    (`# @secret:todo:...`) are not secret tags: they are dropped with a
+    warning, and their variable stays an ordinary assignment. The check runs
+    here rather than in the memoized tokenizer because backends can be
+    registered at any time.
+    """
+    for warning in tokens.warnings:
+        print(warning, file=sys.stderr)
+
+    secrets = {}
+    for var_name, metadata in tokens.secrets.items():
+        backend = metadata["backend"]
+        if backend != DEFAULT_BACKEND:
+            # Deferred: the backends module is only needed for non-default tags
+            from .backends import is_known_backend
+
+            if not is_known_backend(backend):
+                print(
+                    f"WARNING: Ignoring secret tag for {var_name}: unknown backend '{backend}' "
+                    f"(register one with register_backend('{backend}', backend))",
+                    file=sys.stderr,
+                )
+                continue
+        secrets[var_name] = dict(metadata)
+    return secrets
@@ -0,0 +1,273 @@
+"""Logging integration for secret redaction.
+
+Kept out of redaction.py so that importing the core redactor does not pull
+in logging, threading and queue; haunt_secrets.redaction re-exports every
+public name here on first access.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import redaction
+from .redaction import _LEAF_SEPARATOR, redact
+
+
+class SecretRedactingFormatter(logging.Formatter):
+    """Logging formatter that automatically redacts secrets.
+
+    This formatter wraps the standard logging.Formatter and redacts
+    all known secrets from log messages before they are emitted.
+
+    Usage:
+        handler = logging.StreamHandler()
+        handler.setFormatter(SecretRedactingFormatter())
+        logger.addHandler(handler)
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, **kwargs):
+        """Initialize the redacting formatter.
+
+        Args:
+            fmt: Log format string (same as logging.Formatter)
+            datefmt: Date format string (same as logging.Formatter)
+            **kwargs: Additional arguments for logging.Formatter
+        """
+        super().__init__(fmt=fmt, datefmt=datefmt, **kwargs)
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the log record and redact any secrets.
+
+        Args:
+            record: The log record to format
+
+        Returns:
+            Formatted and redacted log message
+        """
+        # Format the record using parent formatter
+        formatted = super().format(record)
+
+        # Redact any secrets from the formatted message
+        return redact(formatted)
+
+
+# ========== QUEUED LOGGING ==========
+
+# Most records redacted together in one listener pass
+DEFAULT_LOG_BATCH_SIZE = 256
+
+# Recently redacted messages remembered by the listener
+DEFAULT_LOG_CACHE_SIZE = 1024
+
+
+class RedactingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that only enqueues: all formatting happens on the listener.
+
+    The stock QueueHandler formats each record on the calling thread (so
+    it can be pickled); this one puts the record on the queue untouched.
+    Objects passed as log arguments are therefore formatted later, on the
+    listener thread - don't mutate them after logging.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class RedactingQueueListener:
+    """Drain a log queue on a background thread, redacting records in batches.
+
+    Each batch (up to batch_size records already waiting) is handled in
+    one go: messages are rendered with getMessage(), looked up in an LRU
+    keyed by (message, registry version), and the misses are redacted with
+    a single scan of their concatenation. Exception and stack text is
+    rendered and redacted the same way. The redacted records (args
+    cleared, exc_text set) are then passed to the handlers, so any
+    formatter works and no handler ever sees an unredacted message.
+
+    Usage:
+        listener = setup_redacted_logging(logging.StreamHandler())
+        logging.getLogger(__name__).info("token=%s", token)  # only enqueues
+        listener.stop()  # flushes everything still queued (also run at exit)
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        log_queue: "queue.SimpleQueue[Any]",
+        *handlers: logging.Handler,
+        batch_size: int = DEFAULT_LOG_BATCH_SIZE,
+        cache_size: int = DEFAULT_LOG_CACHE_SIZE
+    ):
+        """Initialize the listener (call start() to begin draining).
+
+        Args:
+            log_queue: Queue the RedactingQueueHandler writes to
+            *handlers: Handlers receiving redacted records (their levels are respected)
+            batch_size: Most records redacted in one pass
+            cache_size: Redacted messages kept in the LRU (0 disables it)
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+        self._exception_formatter = logging.Formatter()
+        self._thread: Optional[threading.Thread] = None
+        self._detach: Optional[Tuple[logging.Logger, logging.Handler]] = None
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        if self._thread is not None:
+            raise RuntimeError("listener already started")
+
+        self._thread = threading.Thread(target=self._run, name="haunt-secrets-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Flush every queued record to the handlers and stop the thread.
+
+        Records logged after stop() are no longer delivered; when the
+        listener came from setup_redacted_logging() its queue handler is
+        removed from the logger first.
+        """
+        if self._detach is not None:
+            logger, handler = self._detach
+            logger.removeHandler(handler)
+            self._detach = None
+
+        if self._thread is None:
+            return
+
+        self.queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+        atexit.unregister(self.stop)
+
+        for handler in self.handlers:
+            handler.flush()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(record is self._STOP for record in batch)
+            records = [record for record in batch if record is not self._STOP]
+            if records:
+                self._handle_batch(records)
+            if stop:
+                return
+
+    def _handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """Redact a batch of records in place, then hand them to the handlers."""
+        texts = []
+        for record in records:
+            try:
+                message = record.getMessage()
+            except Exception:
+                # Same fallback as logging: report the bad call, keep going
+                message = f"{record.msg!r} (formatting failed with args {len(record.args or ())})"
+            record.msg, record.args = message, None
+            texts.append(message)
+
+            if record.exc_info and not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+            if record.exc_text:
+                texts.append(record.exc_text)
+            if record.stack_info:
+                texts.append(record.stack_info)
+
+        redacted = self._redact_all(texts)
+        for record in records:
+            record.msg = redacted[record.msg]
+            if record.exc_text:
+                record.exc_text = redacted[record.exc_text]
+            if record.stack_info:
+                record.stack_info = redacted[record.stack_info]
+
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+    def _redact_all(self, texts: List[str]) -> Dict[str, str]:
+        """Map each text to its redacted form, via the LRU and one scan for the misses."""
+        version = redaction._REGISTRY_VERSION
+        results: Dict[str, str] = {}
+        misses = []
+        for text in dict.fromkeys(texts):
+            cached = self._cache.get((text, version))
+            if cached is not None:
+                self._cache.move_to_end((text, version))
+                results[text] = cached
+            else:
+                misses.append(text)
+
+        if misses:
+            # One pass over all misses; matches cannot span the separator
+            joined = redact(_LEAF_SEPARATOR.join(misses))
+            parts = joined.split(_LEAF_SEPARATOR)
+            if len(parts) != len(misses):
+                parts = [redact(text) for text in misses]
+
+            for text, clean in zip(misses, parts):
+                results[text] = clean
+                if self.cache_size > 0:
+                    self._cache[(text, version)] = clean
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return results
+
+
+def setup_redacted_logging(
+    *handlers: logging.Handler,
+    logger: Optional[logging.Logger] = None,
+    level: Optional[int] = None,
+    batch_size: int = DEFAULT_LOG_BATCH_SIZE,
+    cache_size: int = DEFAULT_LOG_CACHE_SIZE
+) -> RedactingQueueListener:
+    """Route logger through a queue so redaction runs off the calling threads.
+
+    Attaches a RedactingQueueHandler to logger (default: the root logger)
+    and starts a RedactingQueueListener delivering redacted records to
+    handlers. Logging calls then cost one queue put; redaction and
+    formatting happen in batches on the listener thread. Queued records
+    are flushed by listener.stop() and automatically at interpreter exit.
+
+    Args:
+        *handlers: Destination handlers (e.g. StreamHandler, FileHandler)
+        logger: Logger to attach to (default: root logger)
+        level: Optional level to set on logger
+        batch_size: Most records redacted in one pass
+        cache_size: Redacted messages kept in the LRU
+
+    Returns:
+        The started listener (call stop() to flush and detach)
+    """
+    logger = logger if logger is not None else logging.getLogger()
+    log_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+
+    listener = RedactingQueueListener(log_queue, *handlers, batch_size=batch_size, cache_size=cache_size)
+    queue_handler = RedactingQueueHandler(log_queue)
+
+    listener.start()
+    logger.addHandler(queue_handler)
+    if level is not None:
+        logger.setLevel(level)
+    listener._detach = (logger, queue_handler)
+
+    return listener
@@ -0,0 +1,352 @@
+"""Streaming secret redaction: chunked text, file objects and sys.stdout/stderr.
+
+haunt_secrets.redaction re-exports every public name here on first access.
+"""
+
+import bisect
+import codecs
+import io
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, List, Optional, Tuple
+
+from . import redaction
+from .redaction import _literal_matcher, redact
+
+
+# Default chunk size for redact_stream()
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on text held back waiting for a safe cut point
+DEFAULT_MAX_BUFFER = 1024 * 1024
+
+# Characters that can neither be part of a PATTERNS match nor a \w word
+# character; cutting next to one never changes what the patterns see.
+_SEPARATOR_RE = re.compile(r"[^\w+/=\-]")
+_LAST_SEPARATOR_RE = re.compile(r"[\s\S]*[^\w+/=\-]")
+
+# (registry version, sorted secrets, first characters, longest length)
+_SECRET_INDEX: Tuple[int, List[str], frozenset, int] = (-1, [], frozenset(), 0)
+
+
+def _secret_index() -> Tuple[List[str], frozenset, int]:
+    """Return (sorted secrets, first characters, longest length) for the current registry."""
+    global _SECRET_INDEX
+
+    version, ordered, first_chars, longest = _SECRET_INDEX
+    if version != redaction._REGISTRY_VERSION:
+        version = redaction._REGISTRY_VERSION
+        ordered = sorted(redaction._REGISTERED_SECRETS)
+        first_chars = frozenset(secret[0] for secret in ordered)
+        longest = max(map(len, ordered), default=0)
+        _SECRET_INDEX = (version, ordered, first_chars, longest)
+
+    return ordered, first_chars, longest
+
+
+def _pending_secret_start(text: str) -> int:
+    """Return the earliest index where a suffix of text could begin a registered secret.
+
+    Returns len(text) if no suffix is a proper prefix of any secret.
+    """
+    ordered, first_chars, longest = _secret_index()
+    start = max(0, len(text) - longest + 1)
+
+    for i in range(start, len(text)):
+        if text[i] in first_chars:
+            suffix = text[i:]
+            j = bisect.bisect_left(ordered, suffix)
+            if j < len(ordered) and ordered[j].startswith(suffix):
+                return i
+
+    return len(text)
+
+
+class StreamRedactor:
+    """Incremental redactor for text that arrives in chunks.
+
+    feed() returns the redacted portion of the text seen so far that can
+    no longer be affected by future input, and holds back the rest:
+    - any suffix that could be the start of a registered secret, and
+    - a trailing run of pattern characters that future input could extend.
+
+    Cuts are only made next to a separator character and never inside a
+    registered-secret match, so concatenating every feed() result plus
+    flush() gives the same output as redact() on the whole text. Memory
+    stays bounded by the longest secret or token run rather than the
+    stream size.
+
+    If max_buffer characters accumulate without any safe cut point (for
+    example a multi-megabyte base64 line), the buffer is cut anyway just
+    before any pending secret prefix; registered secrets are still never
+    split, but a pattern match may be judged on either side of the cut.
+
+    Usage:
+        redactor = StreamRedactor()
+        for chunk in chunks:
+            out.write(redactor.feed(chunk))
+        out.write(redactor.flush())
+    """
+
+    def __init__(self, max_buffer: int = DEFAULT_MAX_BUFFER):
+        """Initialize the redactor.
+
+        Args:
+            max_buffer: Characters to hold before forcing a cut
+        """
+        self.max_buffer = max_buffer
+        self._buffer = ""
+
+    def feed(self, text: str) -> str:
+        """Add text to the stream and return whatever is now safe to emit, redacted."""
+        if not text:
+            return ""
+
+        self._buffer += text
+        cut = self._safe_cut(self._buffer)
+        ready, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        return redact(ready) if ready else ""
+
+    def flush(self) -> str:
+        """Return all held-back text, redacted. Call at end of stream."""
+        ready, self._buffer = self._buffer, ""
+        return redact(ready) if ready else ""
+
+    def _safe_cut(self, text: str) -> int:
+        """Find the largest index at which text can be split without changing redaction."""
+        limit = _pending_secret_start(text)
+
+        literal_matcher = _literal_matcher()
+        spans = [m.span() for m in literal_matcher.finditer(text)] if literal_matcher else []
+
+        cut = limit
+        while cut > 0:
+            # Never split a registered secret
+            for start, end in spans:
+                if start < cut < end:
+                    cut = start
+            if cut == 0:
+                break
+
+            # Cut must touch a separator so no pattern run crosses it
+            if _SEPARATOR_RE.match(text, cut - 1) or (cut < len(text) and _SEPARATOR_RE.match(text, cut)):
+                return cut
+
+            match = _LAST_SEPARATOR_RE.match(text, 0, cut - 1)
+            cut = match.end() if match else 0
+
+        if len(text) > self.max_buffer:
+            # No safe point in a huge buffer: cut before any pending secret, outside matches
+            cut = limit
+            for start, end in spans:
+                if start < cut < end:
+                    cut = start
+            return cut
+
+        return 0
+
+
+class RedactingWriter(io.TextIOBase):
+    """Text stream wrapper that redacts everything written through it.
+
+    Writes pass through a StreamRedactor, so secrets split across several
+    write() calls are still caught. flush() flushes the target but keeps
+    held-back text; close() (or detach()) emits it.
+
+    Usage:
+        with RedactingWriter(open('build.log', 'w'), close_target=True) as log:
+            log.write(output)
+    """
+
+    def __init__(self, target: IO[str], close_target: bool = False, max_buffer: int = DEFAULT_MAX_BUFFER):
+        """Initialize the writer.
+
+        Args:
+            target: Text stream that receives redacted output
+            close_target: Close target when this writer is closed
+            max_buffer: Passed to StreamRedactor
+        """
+        super().__init__()
+        self.target = target
+        self.close_target = close_target
+        self._redactor = StreamRedactor(max_buffer=max_buffer)
+        self._lock = threading.Lock()
+
+    @property
+    def encoding(self) -> Optional[str]:
+        return getattr(self.target, "encoding", None)
+
+    @property
+    def errors(self) -> Optional[str]:
+        return getattr(self.target, "errors", None)
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self.target.isatty()
+
+    def fileno(self) -> int:
+        return self.target.fileno()
+
+    def write(self, text: str) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        with self._lock:
+            ready = self._redactor.feed(text)
+            if ready:
+                self.target.write(ready)
+        return len(text)
+
+    def flush(self) -> None:
+        if not self.closed:
+            self.target.flush()
+
+    def detach(self) -> IO[str]:
+        """Emit held-back text and return the target without closing it."""
+        with self._lock:
+            self._drain()
+        target = self.target
+        self.close_target = False
+        super().close()
+        return target
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        with self._lock:
+            self._drain()
+        if self.close_target:
+            self.target.close()
+        super().close()
+
+    def _drain(self) -> None:
+        remaining = self._redactor.flush()
+        if remaining:
+            self.target.write(remaining)
+        self.target.flush()
+
+
+class RedactingBinaryWriter(io.RawIOBase):
+    """Binary stream wrapper that decodes, redacts and re-encodes written bytes.
+
+    Undecodable bytes round-trip unchanged via the surrogateescape handler,
+    and multi-byte characters split across writes are reassembled first.
+    """
+
+    def __init__(self, target: IO[bytes], encoding: str = "utf-8", close_target: bool = False,
+                 max_buffer: int = DEFAULT_MAX_BUFFER):
+        """Initialize the writer.
+
+        Args:
+            target: Binary stream that receives redacted output
+            encoding: Text encoding of the stream
+            close_target: Close target when this writer is closed
+            max_buffer: Passed to StreamRedactor
+        """
+        super().__init__()
+        self.target = target
+        self.encoding = encoding
+        self.close_target = close_target
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="surrogateescape")
+        self._redactor = StreamRedactor(max_buffer=max_buffer)
+        self._lock = threading.Lock()
+
+    def writable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self.target.fileno()
+
+    def write(self, data: bytes) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        with self._lock:
+            ready = self._redactor.feed(self._decoder.decode(bytes(data)))
+            if ready:
+                self.target.write(ready.encode(self.encoding, errors="surrogateescape"))
+        return len(data)
+
+    def flush(self) -> None:
+        if not self.closed:
+            self.target.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        with self._lock:
+            remaining = self._redactor.feed(self._decoder.decode(b"", final=True))
+            remaining += self._redactor.flush()
+            if remaining:
+                self.target.write(remaining.encode(self.encoding, errors="surrogateescape"))
+            self.target.flush()
+        if self.close_target:
+            self.target.close()
+        super().close()
+
+
+def redact_stream(source: IO[Any], destination: IO[Any], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  encoding: str = "utf-8") -> int:
+    """Copy source to destination in chunks, redacting secrets on the way.
+
+    Works with text or binary file objects and pipes; memory use is bounded
+    by chunk_size plus the redactor's hold-back, not the stream length.
+
+    Args:
+        source: Readable stream (text or binary)
+        destination: Writable stream of the same kind as source
+        chunk_size: Size of each read() call
+        encoding: Encoding used when source is binary
+
+    Returns:
+        Number of characters (text) or bytes (binary) read from source
+    """
+    total = 0
+    first = source.read(chunk_size)
+
+    if isinstance(first, (bytes, bytearray)):
+        writer: IO[Any] = RedactingBinaryWriter(destination, encoding=encoding)
+    else:
+        writer = RedactingWriter(destination)
+
+    chunk = first
+    while chunk:
+        total += len(chunk)
+        writer.write(chunk)
+        chunk = source.read(chunk_size)
+
+    writer.close()
+    return total
+
+
+@contextmanager
+def redact_std_streams(stdout: bool = True, stderr: bool = True) -> Iterator[None]:
+    """Install redacting wrappers over sys.stdout and/or sys.stderr.
+
+    Anything printed inside the block is redacted before reaching the real
+    stream; held-back text is emitted and the originals restored on exit.
+    Output written directly to file descriptors 1/2 (e.g. by child
+    processes) is not affected.
+
+    Usage:
+        with redact_std_streams():
+            print(f"token={token}")   # prints token=***REDACTED***
+    """
+    originals = {}
+    if stdout:
+        originals["stdout"] = sys.stdout
+        sys.stdout = RedactingWriter(sys.stdout)
+    if stderr:
+        originals["stderr"] = sys.stderr
+        sys.stderr = RedactingWriter(sys.stderr)
+
+    try:
+        yield
+    finally:
+        for name, original in originals.items():
+            wrapper = getattr(sys, name)
+            setattr(sys, name, original)
+            if isinstance(wrapper, RedactingWriter):
+                wrapper.detach()
@@ -2,36 +2,120 @@
 
 This module provides comprehensive safeguards to prevent secret exposure
 in logs, stdout, stderr, and any other output.
+
+Hooks import it on every tool call, so importing it is kept cheap: `re`
+is imported and PATTERNS compiled on first use, and the logging and
+streaming helpers live in redacted_logging / redacted_streams, loaded
+the first time one of their names is accessed here.
 """
 
-import re
-import logging
-from typing import Optional, Set, Any
+from __future__ import annotations
+
+import bisect
+
+from . import metrics
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Tuple
 
 
 # Global registry of known secret values
 _REGISTERED_SECRETS: Set[str] = set()
 
+# Bumped on every registry change; compiled matchers are rebuilt lazily when it moves
+_REGISTRY_VERSION = 0
+
+# (registry version, compiled alternation of registered literals or None)
+_LITERAL_MATCHER: Tuple[int, Optional[Pattern[str]]] = (-1, None)
+
+# (PATTERNS values it was built from, single compiled alternation of all patterns)
+_PATTERN_MATCHER: Tuple[Tuple[Pattern[str], ...], Optional[Pattern[str]]] = ((), None)
+
+# Above this many registered secrets, one literal-matcher pass beats a
+# substring test per secret (str.__contains__ is much faster per byte)
+_LITERAL_SCAN_THRESHOLD = 512
+
+# (registry version, shortest secret length, first characters) for contains_secret()
+_LITERAL_PREFILTER: Tuple[int, float, frozenset] = (-1, float("inf"), frozenset())
+
 # Redaction placeholder
 REDACTED_PLACEHOLDER = "***REDACTED***"
 
-
-# Patterns for common secret formats
-PATTERNS = {
-    'api_key': re.compile(r'\b[a-zA-Z0-9]{20,}\b'),  # Long alphanumeric strings
-    'oauth_token': re.compile(
-        r'\b(?:ops|ntn|secret|sk|pk)_[a-zA-Z0-9_-]{10,}\b'
-    ),  # OAuth tokens with common prefixes
-    'uuid': re.compile(
-        r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b',
-        re.IGNORECASE
-    ),  # UUID/GUID
-    'base64': re.compile(
-        r'\b[A-Za-z0-9+/]{32,}={0,2}\b'
-    ),  # Base64 encoded strings (32+ chars)
+# Every PATTERNS match is at least this many characters drawn from
+# _PATTERN_CHARS; the merged matcher uses it as a cheap lookahead gate.
+# Keep in sync when adding patterns.
+_PATTERN_MIN_LENGTH = 13
+_PATTERN_CHARS = r"A-Za-z0-9_+/=\-"
+
+# Compiled _PATTERN_CHARS run finder (built on first use)
+_PATTERN_RUN_RE: Optional[Pattern[str]] = None
+
+# Names defined in the logging/streaming submodules, re-exported lazily by __getattr__
+_LAZY_EXPORTS = {
+    "SecretRedactingFormatter": "redacted_logging",
+    "RedactingQueueHandler": "redacted_logging",
+    "RedactingQueueListener": "redacted_logging",
+    "setup_redacted_logging": "redacted_logging",
+    "DEFAULT_LOG_BATCH_SIZE": "redacted_logging",
+    "DEFAULT_LOG_CACHE_SIZE": "redacted_logging",
+    "StreamRedactor": "redacted_streams",
+    "RedactingWriter": "redacted_streams",
+    "RedactingBinaryWriter": "redacted_streams",
+    "redact_stream": "redacted_streams",
+    "redact_std_streams": "redacted_streams",
+    "DEFAULT_CHUNK_SIZE": "redacted_streams",
+    "DEFAULT_MAX_BUFFER": "redacted_streams",
 }
 
 
+def _build_patterns() -> Dict[str, Pattern[str]]:
+    """Compile the patterns for common secret formats (see PATTERNS)."""
+    import re
+
+    return {
+        'api_key': re.compile(r'\b[a-zA-Z0-9]{20,}\b'),  # Long alphanumeric strings
+        'oauth_token': re.compile(
+            r'\b(?:ops|ntn|secret|sk|pk)_[a-zA-Z0-9_-]{10,}\b'
+        ),  # OAuth tokens with common prefixes
+        'uuid': re.compile(
+            r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b',
+            re.IGNORECASE
+        ),  # UUID/GUID
+        'base64': re.compile(
+            r'\b[A-Za-z0-9+/]{32,}={0,2}\b'
+        ),  # Base64 encoded strings (32+ chars)
+    }
+
+
+def _patterns() -> Dict[str, Pattern[str]]:
+    """Return PATTERNS, compiling it on first use."""
+    global PATTERNS
+
+    try:
+        return PATTERNS
+    except NameError:
+        PATTERNS = _build_patterns()
+        return PATTERNS
+
+
+def __getattr__(name: str) -> Any:
+    # PATTERNS (a plain module global once built) and the submodule names are resolved on first access
+    if name == "PATTERNS":
+        return _patterns()
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(f".{_LAZY_EXPORTS[name]}", __package__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | {"PATTERNS"} | set(_LAZY_EXPORTS))
+
+
 def register_secret(name: str, value: Optional[str]) -> None:
     """Register a secret value for redaction.
 
@@ -39,8 +123,31 @@ def register_secret(name: str, value: Optional[str]) -> None:
         name: Name/identifier of the secret (for logging purposes)
         value: The secret value to redact (None values are ignored)
     """
+    global _REGISTRY_VERSION
+
     if value is not None and isinstance(value, str) and value:
-        _REGISTERED_SECRETS.add(value)
+        if value not in _REGISTERED_SECRETS:
+            _REGISTERED_SECRETS.add(value)
+            _REGISTRY_VERSION += 1
+
+
+def unregister_secret(value: Optional[str]) -> bool:
+    """Stop redacting a secret value (e.g. a rotated-out secret after its grace period).
+
+    Args:
+        value: The secret value to forget
+
+    Returns:
+        True if the value was registered
+    """
+    global _REGISTRY_VERSION
+
+    if value not in _REGISTERED_SECRETS:
+        return False
+
+    _REGISTERED_SECRETS.discard(value)
+    _REGISTRY_VERSION += 1
+    return True
 
 
 def reset_secrets() -> None:
@@ -48,12 +155,122 @@ def reset_secrets() -> None:
 
     Used primarily for testing to ensure clean state between tests.
     """
+    global _REGISTRY_VERSION
+
     _REGISTERED_SECRETS.clear()
+    _REGISTRY_VERSION += 1
+
+
+def _literal_matcher() -> Optional[Pattern[str]]:
+    """Return one compiled alternation matching every registered secret.
+
+    The alternation is laid out as a radix trie (see _literal_alternation)
+    so the regex engine walks shared prefixes once instead of trying every
+    secret at every position, and always prefers the longest secret that
+    matches. The regex is rebuilt only when the registry version has
+    changed since the last build.
+
+    Returns:
+        Compiled pattern, or None if no secrets are registered
+    """
+    global _LITERAL_MATCHER
+
+    version, matcher = _LITERAL_MATCHER
+    if version != _REGISTRY_VERSION:
+        version = _REGISTRY_VERSION
+        import re
+
+        literals = sorted(_REGISTERED_SECRETS, key=len, reverse=True)
+        matcher = re.compile(_literal_alternation(literals)) if literals else None
+        _LITERAL_MATCHER = (version, matcher)
+
+    return matcher
+
+
+def _pattern_matcher() -> Pattern[str]:
+    """Return PATTERNS merged into a single alternation for one-pass scanning.
+
+    Per-pattern flags are preserved with scoped inline flags, and the
+    alternatives keep PATTERNS order. A lookahead gate rejects positions
+    not followed by _PATTERN_MIN_LENGTH pattern characters before any
+    alternative is tried. The merged regex is rebuilt if PATTERNS is modified.
+    """
+    global _PATTERN_MATCHER
+
+    patterns = tuple(_patterns().values())
+    built_from, matcher = _PATTERN_MATCHER
+    if matcher is None or built_from != patterns:
+        import re
+
+        alternatives = "|".join(
+            f"(?i:{pattern.pattern})" if pattern.flags & re.IGNORECASE else f"(?:{pattern.pattern})"
+            for pattern in patterns
+        )
+        matcher = re.compile(f"(?=[{_PATTERN_CHARS}]{{{_PATTERN_MIN_LENGTH}}})(?:{alternatives})")
+        _PATTERN_MATCHER = (patterns, matcher)
+
+    return matcher
+
+
+def _literal_alternation(literals: Iterable[str]) -> str:
+    """Build regex source matching any of the literals, structured as a radix trie.
+
+    For secrets "abc", "abd" and "ab" this produces "ab(?:c|d)?": shared
+    prefixes are matched once, and the greedy "?" makes the longest
+    matching literal win, exactly like a longest-first flat alternation.
+
+    Args:
+        literals: Non-empty strings to match
+
+    Returns:
+        Regex source string
+    """
+    trie: Dict[str, dict] = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}  # Terminal marker: a literal ends here
+
+    return _trie_source(trie)
+
+
+def _trie_source(node: Dict[str, dict]) -> str:
+    """Render one trie node (and its subtree) as regex source."""
+    import re
+
+    branches = []
+    for char in sorted(key for key in node if key):
+        child = node[char]
+        chain = char
+
+        # Collapse runs of single-child, non-terminal nodes into one literal
+        while len(child) == 1 and "" not in child:
+            (next_char, child), = child.items()
+            chain += next_char
+
+        branches.append(re.escape(chain) + _trie_source(child))
+
+    if not branches:
+        return ""
+
+    source = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        source = f"(?:{source})?"
+    return source
 
 
 def contains_secret(text: Any) -> bool:
     """Check if text contains any known or pattern-matched secrets.
 
+    Most text is rejected by cheap prefilters before any full scan:
+    - Registered secrets are only searched for when the text is at least
+      as long as the shortest secret and contains one of their first
+      characters; large registries use one pass of the literal matcher
+      instead of a substring test per secret
+    - PATTERNS only match runs of _PATTERN_MIN_LENGTH or more pattern
+      characters, so the patterns run only inside such runs
+
     Args:
         text: Text to check (will be converted to string if not already)
 
@@ -74,19 +291,57 @@ def contains_secret(text: Any) -> bool:
     if not text:
         return False
 
-    # Check registered secrets
-    for secret in _REGISTERED_SECRETS:
-        if secret in text:
-            return True
+    metrics.incr("redaction.calls")
+    metrics.incr("redaction.chars", len(text))
 
-    # Check pattern-based detection
-    for pattern in PATTERNS.values():
-        if pattern.search(text):
-            return True
+    # Check registered secrets
+    min_length, first_chars = _literal_prefilter()
+    if len(text) >= min_length and not first_chars.isdisjoint(text):
+        if len(_REGISTERED_SECRETS) > _LITERAL_SCAN_THRESHOLD:
+            literal_matcher = _literal_matcher()
+            if literal_matcher is not None and literal_matcher.search(text):
+                return True
+        else:
+            for secret in _REGISTERED_SECRETS:
+                if secret in text:
+                    return True
+
+    # Check pattern-based detection, only inside candidate windows
+    if len(text) >= _PATTERN_MIN_LENGTH:
+        pattern_matcher = _pattern_matcher()
+        for run in _pattern_run_re().finditer(text):
+            # One character past the run keeps \b at its end identical to a full-text search
+            if pattern_matcher.search(text, run.start(), run.end() + 1):
+                return True
 
     return False
 
 
+def _pattern_run_re() -> Pattern[str]:
+    """Return the compiled finder for runs of _PATTERN_MIN_LENGTH+ pattern characters."""
+    global _PATTERN_RUN_RE
+
+    if _PATTERN_RUN_RE is None:
+        import re
+
+        _PATTERN_RUN_RE = re.compile(f"[{_PATTERN_CHARS}]{{{_PATTERN_MIN_LENGTH},}}")
+    return _PATTERN_RUN_RE
+
+
+def _literal_prefilter() -> Tuple[float, frozenset]:
+    """Return (shortest registered secret length, set of first characters) for the current registry."""
+    global _LITERAL_PREFILTER
+
+    version, min_length, first_chars = _LITERAL_PREFILTER
+    if version != _REGISTRY_VERSION:
+        version = _REGISTRY_VERSION
+        min_length = min(map(len, _REGISTERED_SECRETS), default=float("inf"))
+        first_chars = frozenset(secret[0] for secret in _REGISTERED_SECRETS)
+        _LITERAL_PREFILTER = (version, min_length, first_chars)
+
+    return min_length, first_chars
+
+
 def redact(text: Any) -> Any:
     """Redact all known secrets and pattern-matched secrets from text.
 
@@ -110,55 +365,239 @@ def redact(text: Any) -> Any:
     if not text:
         return text
 
+    metrics.incr("redaction.calls")
+    metrics.incr("redaction.chars", len(text))
+
     redacted_text = text
 
-    # Redact registered secrets (exact string replacement)
-    for secret in _REGISTERED_SECRETS:
-        if secret:
-            # Escape special regex characters in secret value
-            escaped_secret = re.escape(secret)
-            redacted_text = re.sub(escaped_secret, REDACTED_PLACEHOLDER, redacted_text)
+    # Redact registered secrets (one pass over all literals, longest first)
+    literal_matcher = _literal_matcher()
+    if literal_matcher is not None:
+        redacted_text = literal_matcher.sub(REDACTED_PLACEHOLDER, redacted_text)
 
-    # Redact pattern-matched secrets
-    for pattern in PATTERNS.values():
-        redacted_text = pattern.sub(REDACTED_PLACEHOLDER, redacted_text)
+    # Redact pattern-matched secrets (one pass over all patterns)
+    redacted_text = _pattern_matcher().sub(REDACTED_PLACEHOLDER, redacted_text)
 
     return redacted_text
 
 
-class SecretRedactingFormatter(logging.Formatter):
-    """Logging formatter that automatically redacts secrets.
+# Joins string leaves for one scan; not a pattern character, so no match can span two leaves
+_LEAF_SEPARATOR = "\0"
 
-    This formatter wraps the standard logging.Formatter and redacts
-    all known secrets from log messages before they are emitted.
+# Leaf types that are never containers (skipped without further checks)
+_SCALAR_TYPES = (int, float, complex, bytes, bytearray, type(None))
+
+# Strings already proven clean, valid while (registry version, pattern matcher) is unchanged
+_CLEAN_STRINGS: Tuple[Tuple[int, Optional[Pattern[str]]], Dict[str, None]] = ((-1, None), {})
+_CLEAN_STRINGS_MAX = 4096
+_CLEAN_STRING_MAX_LENGTH = 1024
 
-    Usage:
-        handler = logging.StreamHandler()
-        handler.setFormatter(SecretRedactingFormatter())
-        logger.addHandler(handler)
-    """
 
-    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, **kwargs):
-        """Initialize the redacting formatter.
+def redact_structure(obj: Any) -> Any:
+    """Redact the string leaves of a nested structure, preserving its types.
 
-        Args:
-            fmt: Log format string (same as logging.Formatter)
-            datefmt: Date format string (same as logging.Formatter)
-            **kwargs: Additional arguments for logging.Formatter
-        """
-        super().__init__(fmt=fmt, datefmt=datefmt, **kwargs)
+    Walks dicts, lists, tuples (including namedtuples), sets and dataclass
+    instances. Only strings are redacted (with the same result as redact());
+    dict keys, numbers and other objects are left as they are, and nothing
+    is converted with str().
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format the log record and redact any secrets.
+    Unlike redact(repr(obj)) this returns the original structure:
+    - Clean containers are returned as-is (the same object), so a payload
+      without secrets is not copied at all
+    - Containers holding a secret are shallow-copied with only the
+      affected values replaced; the input is never mutated
 
-        Args:
-            record: The log record to format
+    All candidate strings are scanned in one regex pass over their
+    concatenation, and strings proven clean are remembered until the
+    registry version changes, so recurring values are not rescanned.
+    Only the paths leading to a secret are walked a second time.
 
-        Returns:
-            Formatted and redacted log message
-        """
-        # Format the record using parent formatter
-        formatted = super().format(record)
+    Args:
+        obj: Structure to redact (any object)
 
-        # Redact any secrets from the formatted message
-        return redact(formatted)
+    Returns:
+        obj itself if nothing needed redacting, otherwise a redacted copy
+    """
+    if isinstance(obj, str):
+        return redact(obj)
+
+    # Every string leaf in visit order, and the leaf range of each container
+    leaves: List[str] = []
+    ranges: Dict[int, Tuple[int, int]] = {}
+    _collect_strings(obj, leaves, ranges)
+    if not leaves:
+        return obj
+
+    metrics.incr("redaction.calls")
+    dirty = _dirty_strings(list(dict.fromkeys(leaves)))
+    if not dirty:
+        return obj
+
+    replacements = {text: redact(text) for text in dirty}
+    dirty_leaves = [index for index, text in enumerate(leaves) if text in dirty]
+    return _rebuild(obj, replacements, ranges, dirty_leaves, {}, set())
+
+
+def _children(obj: Any) -> Optional[Iterable[Any]]:
+    """Return the values of a supported container, or None for anything else."""
+    if isinstance(obj, dict):
+        return obj.values()
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return obj
+    # Same test as dataclasses.is_dataclass(), without importing dataclasses for every call
+    if hasattr(type(obj), "__dataclass_fields__") and not isinstance(obj, type):
+        import dataclasses
+
+        return [getattr(obj, field.name) for field in dataclasses.fields(obj)]
+    return None
+
+
+def _collect_strings(obj: Any, leaves: List[str], ranges: Dict[int, Tuple[int, int]]) -> None:
+    """Append obj's string leaves to leaves, recording each container's range once."""
+    children = _children(obj)
+    if children is None or id(obj) in ranges:
+        return
+
+    start = len(leaves)
+    ranges[id(obj)] = (start, start)  # Placeholder: stops reference cycles
+
+    for child in children:
+        if isinstance(child, str):
+            leaves.append(child)
+        elif not isinstance(child, _SCALAR_TYPES):
+            _collect_strings(child, leaves, ranges)
+
+    ranges[id(obj)] = (start, len(leaves))
+
+
+def _dirty_strings(strings: List[str]) -> Set[str]:
+    """Return the strings redact() would change, scanning all unknown ones in one pass."""
+    global _CLEAN_STRINGS
+
+    literal_matcher = _literal_matcher()
+    pattern_matcher = _pattern_matcher()
+
+    token = (_REGISTRY_VERSION, pattern_matcher)
+    if _CLEAN_STRINGS[0] != token:
+        _CLEAN_STRINGS = (token, {})
+    clean = _CLEAN_STRINGS[1]
+
+    # Strings shorter than every secret and every pattern cannot match
+    min_length = _PATTERN_MIN_LENGTH
+    if _REGISTERED_SECRETS:
+        min_length = min(min_length, min(map(len, _REGISTERED_SECRETS)))
+
+    unknown = [text for text in strings if len(text) >= min_length and text not in clean]
+    if not unknown:
+        return set()
+
+    joined = _LEAF_SEPARATOR.join(unknown)
+    metrics.incr("redaction.chars", len(joined))
+    starts = []
+    offset = 0
+    for text in unknown:
+        starts.append(offset)
+        offset += len(text) + 1
+
+    dirty_indexes = set()
+    for matcher in (literal_matcher, pattern_matcher):
+        if matcher is not None:
+            for match in matcher.finditer(joined):
+                dirty_indexes.add(bisect.bisect_right(starts, match.start()) - 1)
+
+    # Keep the first strings seen (typically recurring keys and enum-like values)
+    for index, text in enumerate(unknown):
+        if len(clean) >= _CLEAN_STRINGS_MAX:
+            break
+        if index not in dirty_indexes and len(text) <= _CLEAN_STRING_MAX_LENGTH:
+            clean[text] = None
+
+    return {unknown[index] for index in dirty_indexes}
+
+
+def _rebuild(
+    obj: Any,
+    replacements: Dict[str, str],
+    ranges: Dict[int, Tuple[int, int]],
+    dirty_leaves: List[int],
+    memo: Dict[int, Any],
+    active: Set[int]
+) -> Any:
+    """Copy only the containers of obj whose leaf range holds a dirty leaf."""
+    if isinstance(obj, str):
+        return replacements.get(obj, obj)
+
+    key = id(obj)
+    leaf_range = ranges.get(key)
+    if leaf_range is None:
+        return obj
+    if key in memo:
+        return memo[key]
+    if key in active:
+        # Reference cycle: leave the back-reference pointing at the original
+        return obj
+
+    # Clean subtree: nothing below needs replacing
+    start, end = leaf_range
+    first_dirty = bisect.bisect_left(dirty_leaves, start)
+    if first_dirty == len(dirty_leaves) or dirty_leaves[first_dirty] >= end:
+        return obj
+
+    active.add(key)
+    try:
+        result = _rebuild_container(obj, lambda value: _rebuild(
+            value, replacements, ranges, dirty_leaves, memo, active
+        ))
+    finally:
+        active.discard(key)
+
+    memo[key] = result
+    return result
+
+
+def _rebuild_container(obj: Any, rebuild: Any) -> Any:
+    """Shallow-copy obj with rebuild() applied to its values (obj itself if none change)."""
+    import copy
+    import dataclasses
+
+    if isinstance(obj, dict):
+        changed = {}
+        for name, value in obj.items():
+            new = rebuild(value)
+            if new is not value:
+                changed[name] = new
+        if not changed:
+            return obj
+        result = copy.copy(obj)
+        result.update(changed)
+        return result
+
+    if isinstance(obj, (list, tuple)):
+        items = [rebuild(item) for item in obj]
+        if all(new is old for new, old in zip(items, obj)):
+            return obj
+        if isinstance(obj, list):
+            result = copy.copy(obj)
+            result[:] = items
+            return result
+        return type(obj)(*items) if hasattr(obj, "_fields") else type(obj)(items)
+
+    if isinstance(obj, (set, frozenset)):
+        pairs = [(item, rebuild(item)) for item in obj]
+        if all(new is old for old, new in pairs):
+            return obj
+        return type(obj)(new for _, new in pairs)
+
+    changed = {}
+    for field in dataclasses.fields(obj):
+        value = getattr(obj, field.name)
+        new = rebuild(value)
+        if new is not value:
+            changed[field.name] = new
+    if not changed:
+        return obj
+    result = copy.copy(obj)
+    for name, value in changed.items():
+        # Bypasses frozen=True, like dataclasses itself does
+        object.__setattr__(result, name, value)
+    return result
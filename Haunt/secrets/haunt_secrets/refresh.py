@@ -0,0 +1,282 @@
+"""Background secret refresh for long-running processes.
+
+load_secrets() resolves secrets once; after a rotation the process keeps
+the old values until it restarts. SecretRefresher re-resolves the .env
+file(s) on a schedule in a daemon thread and publishes each complete
+result as an immutable SecretSnapshot:
+
+1. Every reference is fetched (batched, bypassing the cache read)
+2. New values are registered for redaction
+3. The snapshot reference is swapped in one assignment, then os.environ
+   is updated if export is enabled
+4. Values rotated out stay registered for grace_period seconds, then are
+   unregistered (unless still in use)
+
+A failed refresh keeps the previous snapshot and retries sooner.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .loader import _build_secrets, _merge_layers, _require_token, _resolve_references
+from .redaction import unregister_secret
+
+if TYPE_CHECKING:
+    from .cache import SecretCache
+
+# Seconds between refreshes when neither interval nor a cache TTL is given
+DEFAULT_REFRESH_INTERVAL = 300.0
+
+# Seconds rotated-out values stay redacted
+DEFAULT_GRACE_PERIOD = 300.0
+
+# Refresh this fraction of the way through the cache TTL
+_TTL_REFRESH_FRACTION = 0.8
+
+# Longest wait before retrying a failed refresh
+_MAX_RETRY_INTERVAL = 30.0
+
+
+class SecretSnapshot(Mapping[str, str]):
+    """
+    Immutable, complete set of variables from one refresh.
+
+    Hold on to a snapshot for the duration of a request: it never changes,
+    so every value read from it comes from the same rotation.
+
+    Attributes:
+        generation: 1 for the first load, incremented by every refresh
+        loaded_at: time.time() when the values were resolved
+        secret_names: Variables whose values came from a secret backend
+    """
+
+    def __init__(self, values: Dict[str, str], secret_names: Iterable[str], generation: int, loaded_at: float):
+        self._values = MappingProxyType(dict(values))
+        self.secret_names = frozenset(secret_names)
+        self.generation = generation
+        self.loaded_at = loaded_at
+
+    def __getitem__(self, key: str) -> str:
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        # Never include values
+        return f"{type(self).__name__}(generation={self.generation}, keys={list(self._values)!r})"
+
+    def secret_values(self) -> List[str]:
+        """Return the secret values in this snapshot (for redaction bookkeeping)."""
+        return [self._values[name] for name in self.secret_names]
+
+
+class SecretRefresher:
+    """
+    Keep secrets from .env file(s) current in a background thread.
+
+    Usage:
+        refresher = SecretRefresher('.env', interval=600)
+        refresher.start()                 # first load is synchronous
+        secrets = refresher.snapshot      # consistent view for one request
+        db_password = secrets['DB_PASSWORD']
+        ...
+        refresher.stop()
+
+    os.environ is updated key by key after the snapshot swap (the OS offers
+    no multi-key atomic update); code that needs several values from the
+    same rotation should read them from one snapshot.
+
+    Thread-safe: refresh() may be called from any thread; refreshes are serialized.
+    """
+
+    def __init__(
+        self,
+        paths: Union[str, Path, Iterable[Union[str, Path]]],
+        interval: Optional[float] = None,
+        grace_period: float = DEFAULT_GRACE_PERIOD,
+        batch: bool = True,
+        cache: Optional["SecretCache"] = None,
+        export: bool = True,
+        missing_ok: bool = False,
+        on_error: Optional[Callable[[Exception], None]] = None
+    ):
+        """
+        Initialize the refresher. Nothing is fetched until start() or refresh().
+
+        Args:
+            paths: One .env file, or layered files lowest precedence first
+            interval: Seconds between refreshes (default: 80% of cache.ttl
+                when a cache is given, otherwise DEFAULT_REFRESH_INTERVAL)
+            grace_period: Seconds rotated-out values stay registered for redaction
+            batch: Resolve all references in one backend call per refresh
+            cache: Optional SecretCache; refreshed values are written to it
+                (it is never read, so a refresh always sees rotations)
+            export: Also write each snapshot into os.environ
+            missing_ok: Skip layered files that do not exist
+            on_error: Called with the exception when a background refresh fails
+
+        Raises:
+            ValueError: If interval is not positive or grace_period is negative
+        """
+        if isinstance(paths, (str, Path)):
+            paths = [paths]
+        if interval is None:
+            interval = cache.ttl * _TTL_REFRESH_FRACTION if cache is not None else DEFAULT_REFRESH_INTERVAL
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if grace_period < 0:
+            raise ValueError(f"grace_period must not be negative, got {grace_period}")
+
+        self.paths = list(paths)
+        self.interval = interval
+        self.grace_period = grace_period
+        self.batch = batch
+        self.cache = cache
+        self.export = export
+        self.missing_ok = missing_ok
+        self.on_error = on_error
+        self.last_error: Optional[Exception] = None
+
+        self._snapshot: Optional[SecretSnapshot] = None
+        self._retired: List[Tuple[float, List[str]]] = []  # (expires_at, values)
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> SecretSnapshot:
+        """
+        The current snapshot (loads synchronously on first access).
+
+        Raises:
+            Same as refresh() when nothing has been loaded yet
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        return snapshot
+
+    def refresh(self) -> SecretSnapshot:
+        """
+        Re-resolve every secret now and publish a new snapshot.
+
+        Returns:
+            The new snapshot
+
+        Raises:
+            MissingTokenError, AuthenticationError, SecretNotFoundError, ...:
+                If resolution fails (the previous snapshot stays current)
+            FileNotFoundError: If a .env file is missing and missing_ok is False
+        """
+        with self._refresh_lock:
+            values, references = _merge_layers(self.paths, missing_ok=self.missing_ok)
+            _require_token(references.values())
+
+            resolved = _resolve_references(list(references.values()), batch=self.batch)
+            if self.cache is not None:
+                for reference, value in resolved.items():
+                    self.cache.set(reference, value)
+
+            # Registers every new secret value before anything can observe it
+            result = _build_secrets(values, references, resolved=resolved)
+
+            previous = self._snapshot
+            snapshot = SecretSnapshot(
+                result,
+                references,
+                generation=previous.generation + 1 if previous is not None else 1,
+                loaded_at=time.time()
+            )
+            self._snapshot = snapshot
+
+            if self.export:
+                changed = {
+                    key: value for key, value in result.items()
+                    if previous is None or previous.get(key) != value
+                }
+                os.environ.update(changed)
+
+            if previous is not None:
+                retired = set(previous.secret_values()) - set(snapshot.secret_values())
+                if retired:
+                    self._retired.append((time.monotonic() + self.grace_period, list(retired)))
+
+            self._expire_retired()
+            return snapshot
+
+    def start(self) -> "SecretRefresher":
+        """
+        Load synchronously (if not loaded yet), then refresh in a daemon thread.
+
+        Raises:
+            Same as refresh() if the first load fails
+            RuntimeError: If already started
+        """
+        if self._thread is not None:
+            raise RuntimeError("SecretRefresher already started")
+
+        if self._snapshot is None:
+            self.refresh()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="haunt-secrets-refresh", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread. Retired values stay registered for redaction."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "SecretRefresher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        next_refresh = time.monotonic() + self.interval
+        while True:
+            wait = next_refresh - time.monotonic()
+            if self._retired:
+                wait = min(wait, self._retired[0][0] - time.monotonic())
+            if self._stop.wait(max(wait, 0.0)):
+                return
+
+            if time.monotonic() < next_refresh:
+                # Woken for a grace-period expiry only
+                with self._refresh_lock:
+                    self._expire_retired()
+                continue
+
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the previous snapshot; retry sooner than a full interval
+                self.last_error = e
+                next_refresh = time.monotonic() + min(self.interval, _MAX_RETRY_INTERVAL)
+                if self.on_error is not None:
+                    self.on_error(e)
+            else:
+                self.last_error = None
+                next_refresh = time.monotonic() + self.interval
+
+    def _expire_retired(self) -> None:
+        """Unregister retired values whose grace period is over and that are no longer in use."""
+        now = time.monotonic()
+        current = set(self._snapshot.secret_values()) if self._snapshot is not None else set()
+        while self._retired and self._retired[0][0] <= now:
+            _, values = self._retired.pop(0)
+            for value in values:
+                if value not in current:
+                    unregister_secret(value)
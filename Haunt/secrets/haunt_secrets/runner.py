@@ -0,0 +1,142 @@
+"""Run child processes with secrets in their environment and redacted output.
+
+Secrets are injected only into the child's environment (os.environ is never
+modified), and the child's stdout/stderr are streamed live through the
+incremental redactor instead of being collected until exit.
+"""
+
+import codecs
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Union
+
+from .loader import get_secrets
+from .redaction import RedactingWriter, register_secret
+
+if TYPE_CHECKING:
+    from .cache import SecretCache
+
+# Maximum bytes taken from a pipe per read; reads return as soon as any data is available
+DEFAULT_READ_SIZE = 64 * 1024
+
+
+def run(
+    cmd: Union[str, Sequence[str]],
+    env_file: Optional[Union[str, Path]] = None,
+    *,
+    secrets: Optional[Mapping[str, str]] = None,
+    env: Optional[Mapping[str, str]] = None,
+    cwd: Optional[Union[str, Path]] = None,
+    stdout: Optional[IO[str]] = None,
+    stderr: Optional[IO[str]] = None,
+    shell: bool = False,
+    timeout: Optional[float] = None,
+    check: bool = False,
+    batch: bool = False,
+    cache: Optional["SecretCache"] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Run cmd with secrets in its environment, forwarding redacted output live.
+
+    Output is read from the child's pipes as soon as it is written and passed
+    through a StreamRedactor, which only holds back a possible secret prefix
+    or an unfinished token, so long-running commands stream with low latency
+    and bounded memory.
+
+    Args:
+        cmd: Command to run (sequence of arguments, or string with shell=True)
+        env_file: .env file to resolve with get_secrets() before running
+        secrets: Already-resolved variables to inject (merged over env_file
+            values); their values are registered for redaction
+        env: Base environment for the child (default: os.environ)
+        cwd: Working directory for the child
+        stdout: Text stream receiving redacted stdout (default: sys.stdout)
+        stderr: Text stream receiving redacted stderr (default: sys.stderr)
+        shell: Run cmd through the shell
+        timeout: Seconds to wait before killing the child
+        check: Raise CalledProcessError on non-zero exit
+        batch: Passed to get_secrets() when env_file is given
+        cache: Passed to get_secrets() when env_file is given
+
+    Returns:
+        CompletedProcess with args and returncode (output is streamed, not captured)
+
+    Raises:
+        RuntimeError: If resolving env_file fails (see get_secrets)
+        subprocess.TimeoutExpired: If the child runs longer than timeout
+        subprocess.CalledProcessError: If check is True and the child fails
+
+    Example:
+        >>> from haunt_secrets import run
+        >>> run(['pytest', '-q'], '.env', check=True)
+    """
+    injected: Dict[str, str] = {}
+    if env_file is not None:
+        injected.update(get_secrets(env_file, batch=batch, cache=cache))
+    if secrets:
+        for name, value in secrets.items():
+            # env_file secrets are registered by get_secrets(); plaintext values are not
+            register_secret(name, value)
+        injected.update(secrets)
+
+    child_env = dict(os.environ if env is None else env)
+    child_env.update(injected)
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=child_env,
+        cwd=cwd,
+        shell=shell,
+    )
+
+    pumps = [
+        _start_pump(proc.stdout, stdout if stdout is not None else sys.stdout),
+        _start_pump(proc.stderr, stderr if stderr is not None else sys.stderr),
+    ]
+
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for pump in pumps:
+            pump.join()
+
+    if check and returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+    return subprocess.CompletedProcess(cmd, returncode)
+
+
+def _start_pump(pipe: IO[bytes], destination: IO[str]) -> threading.Thread:
+    """Start a daemon thread copying pipe to destination through the redactor."""
+    thread = threading.Thread(target=_pump, args=(pipe, destination), daemon=True)
+    thread.start()
+    return thread
+
+
+def _pump(pipe: IO[bytes], destination: IO[str]) -> None:
+    """Forward pipe to destination until EOF, flushing after every read."""
+    encoding = getattr(destination, "encoding", None) or "utf-8"
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    writer = RedactingWriter(destination)
+    fd = pipe.fileno()
+
+    try:
+        while True:
+            data = os.read(fd, DEFAULT_READ_SIZE)
+            if not data:
+                break
+            writer.write(decoder.decode(data))
+            writer.flush()
+        writer.write(decoder.decode(b"", final=True))
+    finally:
+        writer.detach()
+        pipe.close()
@@ -0,0 +1,183 @@
+"""Single-pass .env tokenizer shared by the parser and loader.
+
+One scan of the file yields every variable assignment, the secret tag
+attached to each tagged variable, and line numbers. File results are
+memoized by (path, mtime_ns, size) so repeated loads in a long-lived
+process neither re-read nor re-scan an unchanged file.
+"""
+
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+from . import metrics
+
+# Tag format constants
+SECRET_TAG_PREFIX = "# @secret:op:"
+REQUIRED_TAG_PARTS = 3  # vault/item/field
+DEFAULT_BACKEND = "op"
+
+# "# @secret:<backend>:vault/item/field" - the backend name selects where the secret lives
+# (tags naming an unknown backend are dropped with a warning by the parser)
+_SECRET_TAG_RE = re.compile(r"# @secret:([a-z][a-z0-9_-]*):")
+
+# Files modified this recently are re-read even on a key match: mtime
+# granularity is coarser than a nanosecond on most filesystems, so an
+# in-place rewrite of the same size could otherwise look unchanged.
+_RACY_WINDOW_NS = 1_000_000_000
+
+# Most distinct files kept in the memo
+_MAX_CACHED_FILES = 64
+
+# resolved path -> ((mtime_ns, size), read_at_ns, tokens)
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], int, "EnvTokens"]] = {}
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+class EnvTokens(NamedTuple):
+    """
+    Everything the parser and loader need from one .env file.
+
+    Attributes:
+        assignments: Every VAR=value in file order (value stripped, last wins)
+        secrets: Tagged variables mapped to {"vault", "item", "field", "backend"}
+        line_numbers: 1-indexed line of each variable's (last) assignment
+        warnings: Messages for malformed tags, in file order
+
+    Treat instances as read-only: file results are shared between callers.
+    """
+
+    assignments: Dict[str, str]
+    secrets: Dict[str, Dict[str, str]]
+    line_numbers: Dict[str, int]
+    warnings: Tuple[str, ...]
+
+
+def tokenize_env_content(content: str) -> EnvTokens:
+    """
+    Scan .env content once, collecting assignments, secret tags and line numbers.
+
+    A tag applies to the next assignment line; blank lines and ordinary
+    comments in between are skipped, and a malformed tag cancels any
+    pending tag.
+
+    Args:
+        content: String content of .env file
+
+    Returns:
+        EnvTokens for the content
+    """
+    assignments: Dict[str, str] = {}
+    secrets: Dict[str, Dict[str, str]] = {}
+    line_numbers: Dict[str, int] = {}
+    warnings = []
+
+    # Track the last seen tag
+    last_tag: Optional[Dict[str, str]] = None
+
+    for line_number, line in enumerate(content.splitlines(), start=1):
+        line = line.strip()
+
+        tag_match = _SECRET_TAG_RE.match(line)
+        if tag_match:
+            last_tag = _parse_secret_tag(line, tag_match)
+            if last_tag is None:
+                parts = line[tag_match.end():].strip().split("/")
+                warnings.append(
+                    f"WARNING: Malformed secret tag (expected {REQUIRED_TAG_PARTS} parts, "
+                    f"got {len(parts)}): {line}"
+                )
+        elif "=" in line and not line.startswith("#"):
+            var_name, value = line.split("=", 1)
+            var_name = var_name.strip()
+            assignments[var_name] = value.strip()
+            line_numbers[var_name] = line_number
+
+            if last_tag is not None:
+                secrets[var_name] = last_tag
+                last_tag = None
+
+    return EnvTokens(assignments, secrets, line_numbers, tuple(warnings))
+
+
+def tokenize_env_file(path: Union[str, Path]) -> EnvTokens:
+    """
+    Tokenize a .env file, reusing the previous result if the file is unchanged.
+
+    The memo is keyed by resolved path and validated against (mtime_ns, size);
+    files modified within the last second are always re-read.
+
+    Args:
+        path: Path to .env file (string or Path object)
+
+    Returns:
+        EnvTokens for the file (shared - do not mutate)
+
+    Raises:
+        FileNotFoundError: If file does not exist
+    """
+    path_obj = Path(path)
+    key = os.path.abspath(path_obj)
+
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}")
+
+    signature = (st.st_mtime_ns, st.st_size)
+
+    with _FILE_CACHE_LOCK:
+        cached = _FILE_CACHE.get(key)
+    if cached is not None:
+        cached_signature, read_at_ns, tokens = cached
+        if cached_signature == signature and read_at_ns - signature[0] > _RACY_WINDOW_NS:
+            metrics.incr("parse.memo_hits")
+            return tokens
+
+    read_at_ns = time.time_ns()
+    with metrics.timed("parse"):
+        tokens = tokenize_env_content(path_obj.read_text())
+    metrics.incr("parse.files")
+
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE.pop(key, None)
+        if len(_FILE_CACHE) >= _MAX_CACHED_FILES:
+            del _FILE_CACHE[next(iter(_FILE_CACHE))]
+        _FILE_CACHE[key] = (signature, read_at_ns, tokens)
+
+    return tokens
+
+
+def clear_tokenizer_cache() -> None:
+    """Forget every memoized file result."""
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE.clear()
+
+
+def _parse_secret_tag(line: str, tag_match: "re.Match") -> Optional[Dict[str, str]]:
+    """
+    Parse secret tag and return metadata dict or None if malformed.
+
+    Args:
+        line: Line containing secret tag (e.g., "# @secret:op:vault/item/field")
+        tag_match: _SECRET_TAG_RE match for the tag prefix
+
+    Returns:
+        Dict with vault/item/field/backend keys, or None if malformed
+    """
+    tag_content = line[tag_match.end():].strip()
+    parts = tag_content.split("/")
+
+    if len(parts) != REQUIRED_TAG_PARTS:
+        return None
+
+    vault, item, field = parts
+    return {
+        "vault": vault,
+        "item": item,
+        "field": field,
+        "backend": tag_match.group(1)
+    }
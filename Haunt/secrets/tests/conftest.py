@@ -0,0 +1,66 @@
+"""Shared fixtures for haunt_secrets tests."""
+
+import os
+
+import pytest
+
+
+FAKE_OP_SCRIPT = '''#!{python}
+"""Fake op CLI: serves secrets from a JSON file and logs every invocation."""
+import json
+import os
+import re
+import sys
+import time
+
+with open(os.environ["FAKE_OP_SECRETS"]) as f:
+    secrets = json.load(f)
+with open(os.environ["FAKE_OP_LOG"], "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+
+def resolve(ref):
+    if ref not in secrets:
+        sys.stderr.write(f"[ERROR] could not read secret '{{ref}}': item not found\\n")
+        sys.exit(1)
+    return secrets[ref]
+
+time.sleep(float(os.environ.get("FAKE_OP_DELAY", "0")))
+
+if sys.argv[1] == "read":
+    sys.stdout.write(resolve(sys.argv[2]) + "\\n")
+elif sys.argv[1] == "inject":
+    template = sys.stdin.read()
+    refs = re.findall(r"\\{{\\{{ (op://[^ ]+) \\}}\\}}", template)
+    values = {{ref: resolve(ref) for ref in refs}}
+    sys.stdout.write(re.sub(r"\\{{\\{{ (op://[^ ]+) \\}}\\}}", lambda m: values[m.group(1)], template))
+'''
+
+
+@pytest.fixture
+def fake_op(tmp_path, monkeypatch):
+    """Install a fake `op` executable on PATH backed by a JSON secrets file."""
+    import json
+    import sys
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    op_path = bin_dir / "op"
+    op_path.write_text(FAKE_OP_SCRIPT.format(python=sys.executable))
+    op_path.chmod(0o755)
+
+    secrets_file = tmp_path / "op-secrets.json"
+    log_file = tmp_path / "op-calls.log"
+    log_file.write_text("")
+
+    def configure(secrets):
+        secrets_file.write_text(json.dumps(secrets))
+
+    configure({})
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_OP_SECRETS", str(secrets_file))
+    monkeypatch.setenv("FAKE_OP_LOG", str(log_file))
+    monkeypatch.setenv("OP_SERVICE_ACCOUNT_TOKEN", "test_token")
+
+    configure.calls = lambda: log_file.read_text().splitlines()
+    configure.delay = lambda seconds: monkeypatch.setenv("FAKE_OP_DELAY", str(seconds))
+    return configure
@@ -0,0 +1,173 @@
+"""Tests for the asyncio secrets API."""
+
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from haunt_secrets import (
+    AuthenticationError,
+    MissingTokenError,
+    SecretNotFoundError,
+    SecretTimeoutError,
+    aget_secrets,
+    aload_secrets,
+)
+
+
+SECRETS = {
+    "op://prod/database/password": "db_secret_123",
+    "op://prod/api/key": "api_secret_456",
+    "op://prod/stripe/key": "stripe_secret_789",
+}
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "PLAIN_VAR=plain_value\n"
+        "# @secret:op:prod/database/password\nDB_PASSWORD=x\n"
+        "# @secret:op:prod/api/key\nAPI_KEY=x\n"
+        "# @secret:op:prod/stripe/key\nSTRIPE_KEY=x\n"
+        "# @secret:op:prod/api/key\nAPI_KEY_ALIAS=x\n"
+    )
+    return str(env_file)
+
+
+class TestAgetSecrets:
+    """Tests for aget_secrets()."""
+
+    def test_resolves_secrets_and_plaintext(self, env_file, fake_op):
+        """Should return the same dict as get_secrets(), fetching each reference once."""
+        fake_op(SECRETS)
+
+        result = asyncio.run(aget_secrets(env_file))
+
+        assert result == {
+            "PLAIN_VAR": "plain_value",
+            "DB_PASSWORD": "db_secret_123",
+            "API_KEY": "api_secret_456",
+            "STRIPE_KEY": "stripe_secret_789",
+            "API_KEY_ALIAS": "api_secret_456",
+        }
+        assert len(fake_op.calls()) == 3
+
+    def test_batch_uses_single_inject(self, env_file, fake_op):
+        """batch=True should spawn one op inject process."""
+        fake_op(SECRETS)
+
+        result = asyncio.run(aget_secrets(env_file, batch=True))
+
+        assert result["STRIPE_KEY"] == "stripe_secret_789"
+        assert fake_op.calls() == ["inject"]
+
+    def test_semaphore_caps_concurrency(self, env_file, fake_op):
+        """At most max_concurrency op processes should run at once."""
+        fake_op(SECRETS)
+        fake_op.delay(0.4)
+
+        started = time.monotonic()
+        asyncio.run(aget_secrets(env_file, max_concurrency=1))
+        serial = time.monotonic() - started
+
+        started = time.monotonic()
+        asyncio.run(aget_secrets(env_file, max_concurrency=3))
+        parallel = time.monotonic() - started
+
+        assert serial >= 1.2
+        assert parallel < 1.0
+
+    def test_timeout_raises(self, env_file, fake_op):
+        """A fetch exceeding its timeout should raise SecretTimeoutError promptly."""
+        fake_op(SECRETS)
+        fake_op.delay(5)
+
+        started = time.monotonic()
+        with pytest.raises(SecretTimeoutError):
+            asyncio.run(aget_secrets(env_file, timeout=0.3))
+
+        assert time.monotonic() - started < 3
+
+    def test_cancellation_propagates(self, env_file, fake_op):
+        """Cancelling the caller should stop in-flight fetches."""
+        fake_op(SECRETS)
+        fake_op.delay(5)
+
+        async def cancel_soon():
+            task = asyncio.ensure_future(aget_secrets(env_file))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            await task
+
+        started = time.monotonic()
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(cancel_soon())
+
+        assert time.monotonic() - started < 3
+
+    def test_does_not_block_event_loop(self, env_file, fake_op):
+        """Other coroutines should keep running while secrets load."""
+        fake_op(SECRETS)
+        fake_op.delay(0.3)
+
+        async def main():
+            ticks = []
+
+            async def ticker():
+                while True:
+                    ticks.append(time.monotonic())
+                    await asyncio.sleep(0.05)
+
+            tick_task = asyncio.ensure_future(ticker())
+            await aget_secrets(env_file)
+            tick_task.cancel()
+            return ticks
+
+        assert len(asyncio.run(main())) >= 4
+
+    def test_missing_secret_raises_secret_not_found(self, env_file, fake_op):
+        """Unknown references should raise SecretNotFoundError naming the reference."""
+        fake_op({"op://prod/database/password": "db_secret_123"})
+
+        with pytest.raises(SecretNotFoundError, match="prod/api/key|prod/stripe/key"):
+            asyncio.run(aget_secrets(env_file))
+
+    def test_missing_token_raises(self, env_file, monkeypatch):
+        """Should fail fast without the service account token."""
+        monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN", raising=False)
+
+        with pytest.raises(MissingTokenError):
+            asyncio.run(aget_secrets(env_file))
+
+    def test_error_types_are_runtime_errors(self):
+        """New exception types should remain catchable as RuntimeError."""
+        assert issubclass(AuthenticationError, RuntimeError)
+        assert issubclass(SecretTimeoutError, RuntimeError)
+
+
+class TestAloadSecrets:
+    """Tests for aload_secrets()."""
+
+    def test_exports_to_environ(self, env_file, fake_op):
+        """Should export every variable to os.environ."""
+        fake_op(SECRETS)
+
+        with patch.dict(os.environ):
+            asyncio.run(aload_secrets(env_file))
+
+            assert os.environ["DB_PASSWORD"] == "db_secret_123"
+            assert os.environ["PLAIN_VAR"] == "plain_value"
+
+    def test_failed_reload_keeps_previous_values(self, env_file, fake_op):
+        """os.environ should be untouched if any fetch fails."""
+        fake_op({"op://prod/database/password": "new_value"})
+
+        with patch.dict(os.environ, {"DB_PASSWORD": "old_value"}):
+            with pytest.raises(SecretNotFoundError):
+                asyncio.run(aload_secrets(env_file))
+
+            assert os.environ["DB_PASSWORD"] == "old_value"
+            assert "PLAIN_VAR" not in os.environ
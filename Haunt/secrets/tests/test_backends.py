@@ -0,0 +1,274 @@
+"""Tests for pluggable secret backends."""
+
+import asyncio
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from haunt_secrets import (
+    AuthenticationError,
+    BackendUnavailableError,
+    DictBackend,
+    FileBackend,
+    HttpBackend,
+    MissingTokenError,
+    SecretNotFoundError,
+    aget_secrets,
+    get_secrets,
+    parse_env_file,
+    register_backend,
+    unregister_backend,
+)
+from haunt_secrets.backends import get_backend
+from haunt_secrets.redaction import contains_secret, reset_secrets
+
+
+TOKEN = "connect-test-token"
+
+VAULTS = {
+    "prod": {
+        "database": {"password": "db_secret_123", "username": "admin"},
+        "api": {"key": "api_secret_456"},
+    },
+}
+
+
+class FakeConnectHandler(BaseHTTPRequestHandler):
+    """Minimal 1Password Connect stand-in: vault/item lookup by filter and item fetch."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+
+        if self.headers.get("Authorization") != f"Bearer {TOKEN}":
+            return self._send(401, {"message": "invalid token"})
+
+        url = urlsplit(self.path)
+        parts = url.path.strip("/").split("/")
+        name = parse_qs(url.query).get("filter", [""])[0].split('"')[1:2]
+
+        if parts == ["v1", "vaults"]:
+            return self._send(200, [{"id": f"v-{n}", "name": n} for n in name if n in VAULTS])
+
+        vault = VAULTS.get(parts[2][len("v-"):]) if len(parts) > 2 else None
+        if vault is None:
+            return self._send(404, {"message": "vault not found"})
+
+        if parts[3:] == ["items"]:
+            return self._send(200, [{"id": f"i-{n}", "title": n} for n in name if n in vault])
+
+        item = vault.get(parts[4][len("i-"):]) if len(parts) == 5 else None
+        if item is None:
+            return self._send(404, {"message": "item not found"})
+
+        fields = [{"id": f"f{i}", "label": label, "value": value} for i, (label, value) in enumerate(item.items())]
+        return self._send(200, {"id": parts[4], "fields": fields})
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def connect_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeConnectHandler)
+    server.daemon_threads = True
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def connect_backend(connect_server):
+    backend = HttpBackend(f"http://127.0.0.1:{connect_server.server_port}", TOKEN)
+    register_backend("connect", backend)
+    yield backend
+    unregister_backend("connect")
+    backend.close()
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "APP_NAME=demo\n"
+        "# @secret:connect:prod/database/password\nDB_PASSWORD=x\n"
+        "# @secret:connect:prod/database/username\nDB_USER=x\n"
+        "# @secret:connect:prod/api/key\nAPI_KEY=x\n"
+    )
+    return str(env_file)
+
+
+class TestHttpBackend:
+    """Tests for HttpBackend against a local Connect-style server."""
+
+    def test_fetch_many_downloads_each_item_once(self, connect_server, connect_backend):
+        """Fields of the same item share one item request."""
+        values = connect_backend.fetch_many([
+            ("prod", "database", "password"),
+            ("prod", "database", "username"),
+            ("prod", "api", "key"),
+        ])
+
+        assert values == {
+            ("prod", "database", "password"): "db_secret_123",
+            ("prod", "database", "username"): "admin",
+            ("prod", "api", "key"): "api_secret_456",
+        }
+        item_requests = [p for p in connect_server.requests if p.startswith("/v1/vaults/v-prod/items/")]
+        assert len(item_requests) == 2
+
+    def test_reuses_keep_alive_connections(self, connect_server, connect_backend):
+        """Repeated fetches should not open a connection per request."""
+        for _ in range(5):
+            assert connect_backend.fetch("prod", "api", "key") == "api_secret_456"
+
+        assert len(connect_server.requests) >= 5
+        assert connect_backend.connections_opened <= connect_backend.max_connections
+
+    def test_memoizes_vault_and_item_ids(self, connect_server, connect_backend):
+        """Only the first fetch of an item looks up its ids."""
+        connect_backend.fetch("prod", "api", "key")
+        connect_server.requests.clear()
+
+        connect_backend.fetch("prod", "api", "key")
+
+        assert connect_server.requests == ["/v1/vaults/v-prod/items/i-api"]
+
+    def test_field_matches_case_insensitively(self, connect_backend):
+        assert connect_backend.fetch("prod", "database", "PASSWORD") == "db_secret_123"
+
+    def test_missing_field_raises_not_found(self, connect_backend):
+        with pytest.raises(SecretNotFoundError, match="prod/database/missing"):
+            connect_backend.fetch("prod", "database", "missing")
+
+    def test_missing_item_raises_not_found(self, connect_backend):
+        with pytest.raises(SecretNotFoundError, match="prod/nope"):
+            connect_backend.fetch("prod", "nope", "key")
+
+    def test_bad_token_raises_authentication_error(self, connect_server):
+        backend = HttpBackend(f"http://127.0.0.1:{connect_server.server_port}", "wrong")
+
+        with pytest.raises(AuthenticationError):
+            backend.fetch("prod", "api", "key")
+
+    def test_unreachable_server_raises_backend_unavailable(self, connect_server):
+        port = connect_server.server_port
+        connect_server.shutdown()
+        connect_server.server_close()
+
+        backend = HttpBackend(f"http://127.0.0.1:{port}", TOKEN)
+        with pytest.raises(BackendUnavailableError):
+            backend.fetch("prod", "api", "key")
+
+    def test_requires_url_and_token(self):
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(BackendUnavailableError, match="OP_CONNECT_HOST"):
+                HttpBackend()
+            with pytest.raises(MissingTokenError, match="OP_CONNECT_TOKEN"):
+                HttpBackend("http://127.0.0.1:1")
+
+
+class TestBackendSelection:
+    """Tests for tag- and configuration-based backend selection."""
+
+    def test_connect_tag_loads_without_op_token(self, env_file, connect_backend):
+        """Secrets served by other backends don't need OP_SERVICE_ACCOUNT_TOKEN."""
+        reset_secrets()
+        with patch.dict(os.environ, {}, clear=True):
+            result = get_secrets(env_file)
+
+        assert result == {
+            "APP_NAME": "demo",
+            "DB_PASSWORD": "db_secret_123",
+            "DB_USER": "admin",
+            "API_KEY": "api_secret_456",
+        }
+        assert contains_secret("token api_secret_456")
+
+    def test_aget_secrets_uses_backend(self, env_file, connect_backend):
+        with patch.dict(os.environ, {}, clear=True):
+            result = asyncio.run(aget_secrets(env_file))
+
+        assert result["DB_PASSWORD"] == "db_secret_123"
+
+    def test_lazy_fetches_on_access(self, env_file, connect_server, connect_backend):
+        with patch.dict(os.environ, {}, clear=True):
+            secrets = get_secrets(env_file, lazy=True)
+
+        assert connect_server.requests == []
+        assert secrets["API_KEY"] == "api_secret_456"
+
+    def test_env_var_redirects_op_tags(self, tmp_path):
+        """HAUNT_SECRETS_BACKEND points op tags at another backend."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("# @secret:op:prod/api/key\nAPI_KEY=x\n")
+        register_backend("test-dict", DictBackend({"prod/api/key": "from_dict"}))
+        try:
+            with patch.dict(os.environ, {"HAUNT_SECRETS_BACKEND": "test-dict"}, clear=True):
+                assert get_secrets(env_file) == {"API_KEY": "from_dict"}
+        finally:
+            unregister_backend("test-dict")
+
+    def test_op_tags_still_require_token(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("# @secret:op:prod/api/key\nAPI_KEY=x\n")
+
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(MissingTokenError):
+                get_secrets(env_file)
+
+    def test_unknown_backend_tag_ignored_with_warning(self, tmp_path, capsys):
+        env_file = tmp_path / ".env"
+        env_file.write_text("# @secret:vaultx:prod/api/key\nAPI_KEY=x\n")
+
+        assert "API_KEY" not in parse_env_file(env_file)
+        assert "unknown backend 'vaultx'" in capsys.readouterr().err
+
+    def test_registered_backend_tag_recognized(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("# @secret:vaultx:prod/api/key\nAPI_KEY=x\n")
+
+        register_backend("vaultx", DictBackend({"prod/api/key": "from_vaultx"}))
+        try:
+            assert parse_env_file(env_file)["API_KEY"]["backend"] == "vaultx"
+        finally:
+            unregister_backend("vaultx")
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="vaultx"):
+            get_backend("vaultx")
+
+    def test_file_backend_from_env(self, tmp_path):
+        secrets_file = tmp_path / "secrets.json"
+        secrets_file.write_text(json.dumps({"prod/api/key": "from_file"}))
+        env_file = tmp_path / ".env"
+        env_file.write_text("# @secret:file:prod/api/key\nAPI_KEY=x\n")
+
+        unregister_backend("file")
+        try:
+            with patch.dict(os.environ, {"HAUNT_SECRETS_FILE": str(secrets_file)}, clear=True):
+                assert isinstance(get_backend("file"), FileBackend)
+                assert get_secrets(env_file) == {"API_KEY": "from_file"}
+        finally:
+            unregister_backend("file")
+
+    def test_dict_backend_missing_key(self):
+        with pytest.raises(SecretNotFoundError, match="prod/api/key"):
+            DictBackend({}).fetch("prod", "api", "key")
@@ -251,6 +251,39 @@ EOF
     cleanup_test_env
 }
 
+# Test 6: --profile prints per-reference timings, never values
+test_profile_flag() {
+    echo -e "\n${YELLOW}Test 6: --profile prints timing breakdown without values${NC}"
+
+    setup_test_env
+
+    cat > "$TEST_DIR/.env" <<EOF
+# @secret:op:test/api-key/token
+SECRET_API_KEY=placeholder
+# @secret:op:test/database/password
+DB_PASSWORD=placeholder
+EOF
+
+    output=$(
+        set +e
+        source "$HAUNT_SECRETS_SCRIPT" --profile "$TEST_DIR/.env" 2>&1
+    )
+
+    if echo "$output" | grep -q "op://test/api-key/token" && echo "$output" | grep -q "op read=2"; then
+        pass_test "Profile lists references and op process count"
+    else
+        fail_test "Profile breakdown missing" "Got: $output"
+    fi
+
+    if echo "$output" | grep -q -e "secret_token_12345" -e "db_pass_67890"; then
+        fail_test "Secret value appears in profile output" "Found a secret value in output"
+    else
+        pass_test "Profile output contains no secret values"
+    fi
+
+    cleanup_test_env
+}
+
 # Run all tests
 main() {
     echo "================================="
@@ -267,6 +300,7 @@ main() {
     test_op_failure
     test_missing_file
     test_no_secrets_in_output
+    test_profile_flag
 
     echo ""
     echo "================================="
@@ -0,0 +1,160 @@
+"""Tests for the encrypted on-disk secret cache."""
+
+import os
+import stat
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from haunt_secrets import get_secrets
+from haunt_secrets.cache import SecretCache, default_cache_dir
+from haunt_secrets.redaction import redact, reset_secrets
+
+
+REFERENCE = "op://prod/database/password"
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Private directory for cache entries."""
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def cache(cache_dir):
+    """Cache with a fixed token and a generous TTL."""
+    return SecretCache(ttl=60, directory=cache_dir, token="ops_test_token")
+
+
+class TestSecretCache:
+    """Tests for SecretCache get/set/invalidate."""
+
+    def test_round_trip(self, cache):
+        """Should return the stored value within its TTL."""
+        cache.set(REFERENCE, "db_secret_123")
+        assert cache.get(REFERENCE) == "db_secret_123"
+
+    def test_miss_for_unknown_reference(self, cache):
+        """Should return None for references never stored."""
+        assert cache.get(REFERENCE) is None
+
+    def test_counts_hits_and_misses(self, cache):
+        """Should track hit/miss counters."""
+        cache.get(REFERENCE)
+        cache.set(REFERENCE, "db_secret_123")
+        cache.get(REFERENCE)
+        cache.get(REFERENCE)
+
+        assert cache.stats() == {"hits": 2, "misses": 1}
+
+    def test_entry_expires_after_ttl(self, cache):
+        """Should treat entries past their TTL as misses."""
+        cache.set(REFERENCE, "db_secret_123", ttl=10)
+
+        with patch("haunt_secrets.cache.time.time", return_value=time.time() + 11):
+            assert cache.get(REFERENCE) is None
+
+    def test_value_not_stored_in_plaintext(self, cache, cache_dir):
+        """Neither the value nor the reference should appear on disk."""
+        cache.set(REFERENCE, "db_secret_123")
+
+        for entry in cache_dir.iterdir():
+            data = entry.read_bytes()
+            assert b"db_secret_123" not in data
+            assert b"database" not in data
+            assert "database" not in entry.name
+
+    def test_permissions_are_private(self, cache, cache_dir):
+        """Directory should be 0700 and entries 0600."""
+        cache.set(REFERENCE, "db_secret_123")
+
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+        for entry in cache_dir.iterdir():
+            assert stat.S_IMODE(entry.stat().st_mode) == 0o600
+
+    def test_other_token_cannot_read(self, cache, cache_dir):
+        """Entries encrypted under one token should be unreadable with another."""
+        cache.set(REFERENCE, "db_secret_123")
+
+        other = SecretCache(directory=cache_dir, token="ops_other_token")
+        assert other.get(REFERENCE) is None
+
+    def test_tampered_entry_is_rejected(self, cache, cache_dir):
+        """Modified ciphertext should fail authentication and be discarded."""
+        cache.set(REFERENCE, "db_secret_123")
+        entry = next(cache_dir.iterdir())
+        data = bytearray(entry.read_bytes())
+        data[30] ^= 0x01
+        entry.write_bytes(bytes(data))
+
+        assert cache.get(REFERENCE) is None
+        assert not entry.exists()
+
+    def test_invalidate_single_reference(self, cache):
+        """Should remove only the named entry."""
+        cache.set(REFERENCE, "db_secret_123")
+        cache.set("op://prod/api/key", "api_secret_456")
+
+        assert cache.invalidate(REFERENCE) == 1
+        assert cache.get(REFERENCE) is None
+        assert cache.get("op://prod/api/key") == "api_secret_456"
+
+    def test_invalidate_all(self, cache):
+        """Should remove every entry when no reference is given."""
+        cache.set(REFERENCE, "db_secret_123")
+        cache.set("op://prod/api/key", "api_secret_456")
+
+        assert cache.invalidate() == 2
+        assert cache.get(REFERENCE) is None
+
+    def test_requires_token(self, cache_dir):
+        """Should refuse to run without key material."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(RuntimeError, match="OP_SERVICE_ACCOUNT_TOKEN"):
+                SecretCache(directory=cache_dir)
+
+    def test_default_dir_honours_override(self, tmp_path):
+        """HAUNT_SECRETS_CACHE_DIR should take precedence."""
+        with patch.dict(os.environ, {"HAUNT_SECRETS_CACHE_DIR": str(tmp_path / "c")}):
+            assert default_cache_dir() == tmp_path / "c"
+
+
+class TestLoaderWithCache:
+    """Tests for get_secrets(cache=...)."""
+
+    @pytest.fixture
+    def env_file(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "PLAIN_VAR=plain_value\n"
+            "# @secret:op:prod/database/password\n"
+            "DB_PASSWORD=placeholder\n"
+        )
+        return str(env_file)
+
+    def test_second_load_does_not_spawn_op(self, env_file, cache_dir):
+        """Loads within the TTL should be served entirely from the cache."""
+        with patch.dict(os.environ, {"OP_SERVICE_ACCOUNT_TOKEN": "ops_test_token"}):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(returncode=0, stdout="db_secret_123", stderr="")
+
+                first = get_secrets(env_file, cache=SecretCache(directory=cache_dir))
+                second_cache = SecretCache(directory=cache_dir)
+                second = get_secrets(env_file, cache=second_cache)
+
+            assert mock_run.call_count == 1
+            assert first == second == {"PLAIN_VAR": "plain_value", "DB_PASSWORD": "db_secret_123"}
+            assert second_cache.stats() == {"hits": 1, "misses": 0}
+
+    def test_cached_values_registered_for_redaction(self, env_file, cache_dir):
+        """Values served from the cache should still be redacted."""
+        with patch.dict(os.environ, {"OP_SERVICE_ACCOUNT_TOKEN": "ops_test_token"}):
+            SecretCache(directory=cache_dir).set(REFERENCE, "db secret 123")
+            reset_secrets()
+
+            with patch("subprocess.run") as mock_run:
+                get_secrets(env_file, cache=SecretCache(directory=cache_dir))
+
+            mock_run.assert_not_called()
+            assert redact("pw=db secret 123") == "pw=***REDACTED***"
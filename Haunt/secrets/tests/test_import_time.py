@@ -0,0 +1,108 @@
+"""Import-time budget: hooks import haunt_secrets on every tool call."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+# Milliseconds an import may add over a bare interpreter (bytecode already cached)
+IMPORT_BUDGET_MS = 5.0
+
+# Modules that must stay out of the import path until first use
+DEFERRED_MODULES = ["re", "typing", "logging", "subprocess", "threading", "json", "dataclasses", "asyncio"]
+
+PROBE = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = sorted(set(sys.modules) - before)
+import json
+print(json.dumps({{"ms": elapsed * 1000, "loaded": loaded}}))
+"""
+
+
+@pytest.fixture
+def probe(tmp_path):
+    """Run an import statement in a fresh interpreter with bytecode cached (like a deployed hook)."""
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmp_path / "pycache"))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    def run(statement, repeat=7):
+        code = PROBE.format(statement=statement)
+        results = []
+        for _ in range(repeat + 1):  # the first run only writes bytecode
+            out = subprocess.run(
+                [sys.executable, "-c", code], cwd=PACKAGE_ROOT, env=env,
+                capture_output=True, text=True, check=True
+            ).stdout
+            results.append(json.loads(out))
+        return min(result["ms"] for result in results[1:]), results[-1]["loaded"]
+
+    return run
+
+
+class TestImportTime:
+    """Tests for cheap imports of the modules hooks use."""
+
+    @pytest.mark.parametrize("statement", [
+        "import haunt_secrets",
+        "from haunt_secrets.redaction import redact, contains_secret, register_secret",
+    ])
+    def test_within_budget(self, probe, statement):
+        """Should add less than IMPORT_BUDGET_MS over a bare interpreter."""
+        elapsed_ms, _ = probe(statement)
+        assert elapsed_ms < IMPORT_BUDGET_MS, f"{statement!r} took {elapsed_ms:.2f} ms"
+
+    def test_heavy_modules_deferred(self, probe):
+        """Should not import regex, typing, logging or subprocess until first use."""
+        _, loaded = probe("import haunt_secrets, haunt_secrets.redaction")
+        assert [name for name in DEFERRED_MODULES if name in loaded] == []
+
+    def test_first_use_loads_what_it_needs(self, probe):
+        """Should still redact (compiling patterns on first call) and resolve lazy names."""
+        _, loaded = probe(
+            "import haunt_secrets\n"
+            "from haunt_secrets.redaction import redact, StreamRedactor\n"
+            "assert redact('key=abcdefghijklmnopqrstuvwxyz123') == 'key=***REDACTED***'\n"
+            "assert callable(haunt_secrets.get_secrets)"
+        )
+        assert "re" in loaded
+        assert "haunt_secrets.redacted_streams" in loaded
+        assert "haunt_secrets.loader" in loaded
+
+
+class TestLazyExports:
+    """Tests for names resolved on first access."""
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ should be importable."""
+        import haunt_secrets
+
+        for name in haunt_secrets.__all__:
+            assert getattr(haunt_secrets, name) is not None
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Should raise AttributeError for names that are not exported."""
+        import haunt_secrets
+        from haunt_secrets import redaction
+
+        with pytest.raises(AttributeError):
+            haunt_secrets.not_a_name
+        with pytest.raises(AttributeError):
+            redaction.not_a_name
+
+    def test_redaction_reexports_submodule_names(self):
+        """Logging and streaming helpers should stay importable from redaction."""
+        from haunt_secrets import redacted_logging, redacted_streams
+        from haunt_secrets.redaction import RedactingWriter, setup_redacted_logging
+
+        assert RedactingWriter is redacted_streams.RedactingWriter
+        assert setup_redacted_logging is redacted_logging.setup_redacted_logging
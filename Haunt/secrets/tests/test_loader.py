@@ -262,3 +262,242 @@ SOME_VAR=value
             result = get_secrets(str(env_file))
             assert "SOME_VAR" in result
             assert result["SOME_VAR"] == "value"
+
+
+class TestBatchResolution:
+    """Tests for get_secrets(batch=True) using a fake op executable."""
+
+    def test_resolves_all_secrets_with_one_op_call(self, sample_env_file, fake_op):
+        """Should spawn a single `op inject` for every tagged variable."""
+        fake_op({
+            "op://prod/database/password": "db_secret_123",
+            "op://prod/api/key": "api_secret_456",
+        })
+
+        result = get_secrets(sample_env_file, batch=True)
+
+        assert result["DB_PASSWORD"] == "db_secret_123"
+        assert result["API_KEY"] == "api_secret_456"
+        assert result["PLAIN_VAR"] == "plain_value"
+        assert fake_op.calls() == ["inject"]
+
+    def test_shared_reference_fetched_once(self, tmp_path, fake_op):
+        """Variables tagged with the same reference should share one value."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# @secret:op:prod/api/key\nAPI_KEY=x\n"
+            "# @secret:op:prod/api/key\nAPI_KEY_ALIAS=x\n"
+        )
+        fake_op({"op://prod/api/key": "api_secret_456"})
+
+        result = get_secrets(str(env_file), batch=True)
+
+        assert result == {"API_KEY": "api_secret_456", "API_KEY_ALIAS": "api_secret_456"}
+        assert fake_op.calls() == ["inject"]
+
+    def test_multiline_secret_mapped_back(self, tmp_path, fake_op):
+        """Multiline values should not bleed into neighbouring variables."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# @secret:op:prod/tls/key\nTLS_KEY=x\n"
+            "# @secret:op:prod/api/key\nAPI_KEY=x\n"
+        )
+        fake_op({
+            "op://prod/tls/key": "-----BEGIN KEY-----\nabc\n-----END KEY-----",
+            "op://prod/api/key": "api_secret_456",
+        })
+
+        result = get_secrets(str(env_file), batch=True)
+
+        assert result["TLS_KEY"] == "-----BEGIN KEY-----\nabc\n-----END KEY-----"
+        assert result["API_KEY"] == "api_secret_456"
+
+    def test_failure_reports_failing_reference(self, sample_env_file, fake_op):
+        """A failed batch should still name the vault/item/field that failed."""
+        fake_op({"op://prod/database/password": "db_secret_123"})
+
+        with pytest.raises(RuntimeError, match="prod/api/key"):
+            get_secrets(sample_env_file, batch=True)
+
+    def test_batch_values_registered_for_redaction(self, sample_env_file, fake_op):
+        """Batch-resolved secrets should be redacted like individually fetched ones."""
+        from haunt_secrets.redaction import redact, reset_secrets
+
+        reset_secrets()
+        fake_op({
+            "op://prod/database/password": "db secret 123",
+            "op://prod/api/key": "api secret 456",
+        })
+
+        load_secrets(sample_env_file, batch=True)
+
+        assert redact("pw=db secret 123") == "pw=***REDACTED***"
+        for key in ("DB_PASSWORD", "API_KEY", "PLAIN_VAR", "DEBUG"):
+            os.environ.pop(key, None)
+
+
+class TestLazySecrets:
+    """Tests for get_secrets(lazy=True)."""
+
+    SECRETS = {
+        "op://prod/database/password": "db_secret_123",
+        "op://prod/api/key": "api_secret_456",
+    }
+
+    def test_no_fetch_until_access(self, sample_env_file, fake_op):
+        """Creating the mapping and reading plaintext should not spawn op."""
+        fake_op(self.SECRETS)
+
+        result = get_secrets(sample_env_file, lazy=True)
+
+        assert list(result) == ["PLAIN_VAR", "DB_PASSWORD", "API_KEY", "DEBUG"]
+        assert result["PLAIN_VAR"] == "plain_value"
+        assert "API_KEY" in result
+        assert fake_op.calls() == []
+
+    def test_fetches_on_first_access_and_memoizes(self, sample_env_file, fake_op):
+        """Each secret should be fetched once, on first read."""
+        fake_op(self.SECRETS)
+        result = get_secrets(sample_env_file, lazy=True)
+
+        assert result["DB_PASSWORD"] == "db_secret_123"
+        assert result["DB_PASSWORD"] == "db_secret_123"
+        assert fake_op.calls() == ["read op://prod/database/password"]
+        assert not result.is_resolved("API_KEY")
+
+    def test_prefetch_uses_single_inject(self, sample_env_file, fake_op):
+        """prefetch() should resolve several secrets in one op call."""
+        fake_op(self.SECRETS)
+        result = get_secrets(sample_env_file, lazy=True)
+
+        result.prefetch(["DB_PASSWORD", "API_KEY", "PLAIN_VAR"])
+
+        assert fake_op.calls() == ["inject"]
+        assert dict(result) == {
+            "PLAIN_VAR": "plain_value",
+            "DB_PASSWORD": "db_secret_123",
+            "API_KEY": "api_secret_456",
+            "DEBUG": "true",
+        }
+        assert fake_op.calls() == ["inject"]
+
+    def test_prefetch_unknown_key_raises(self, sample_env_file, fake_op):
+        """prefetch() should reject names not in the .env file."""
+        result = get_secrets(sample_env_file, lazy=True)
+
+        with pytest.raises(KeyError):
+            result.prefetch(["MISSING"])
+
+    def test_fetched_secrets_registered_for_redaction(self, sample_env_file, fake_op):
+        """Lazily fetched secrets should be redacted once read."""
+        from haunt_secrets.redaction import redact, reset_secrets
+
+        reset_secrets()
+        fake_op({"op://prod/database/password": "db secret 123", "op://prod/api/key": "k"})
+        result = get_secrets(sample_env_file, lazy=True)
+
+        result["DB_PASSWORD"]
+
+        assert redact("pw=db secret 123") == "pw=***REDACTED***"
+
+    def test_repr_hides_values(self, sample_env_file, fake_op):
+        """repr() should list names only."""
+        fake_op(self.SECRETS)
+        result = get_secrets(sample_env_file, lazy=True)
+        result.prefetch()
+
+        assert "db_secret_123" not in repr(result)
+        assert "DB_PASSWORD" in repr(result)
+
+    def test_missing_token_fails_fast(self, sample_env_file):
+        """The token check should still happen before returning the mapping."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(RuntimeError, match="OP_SERVICE_ACCOUNT_TOKEN"):
+                get_secrets(sample_env_file, lazy=True)
+
+
+class TestLayeredSecrets:
+    """Tests for get_layered_secrets() across stacked .env files."""
+
+    @pytest.fixture
+    def layers(self, tmp_path):
+        (tmp_path / ".env").write_text(
+            "APP_NAME=base\n"
+            "# @secret:op:prod/database/password\nDB_PASSWORD=x\n"
+            "# @secret:op:prod/api/key\nAPI_KEY=x\n"
+            "# @secret:op:prod/legacy/token\nLEGACY_TOKEN=x\n"
+        )
+        (tmp_path / ".env.local").write_text(
+            "APP_NAME=local\n"
+            "LEGACY_TOKEN=local-dev-token\n"
+        )
+        (tmp_path / ".env.staging").write_text(
+            "# @secret:op:prod/api/key\nAPI_KEY_COPY=x\n"
+            "# @secret:op:staging/database/password\nDB_PASSWORD=x\n"
+        )
+        return tmp_path
+
+    def test_later_layers_override_earlier(self, layers, fake_op):
+        """Values should follow .env < .env.local < .env.<stage> precedence."""
+        from haunt_secrets import env_layers, get_layered_secrets
+
+        fake_op({
+            "op://staging/database/password": "staging_db",
+            "op://prod/api/key": "api_secret_456",
+        })
+
+        result = get_layered_secrets(env_layers(layers, "staging"))
+
+        assert result == {
+            "APP_NAME": "local",
+            "DB_PASSWORD": "staging_db",
+            "API_KEY": "api_secret_456",
+            "LEGACY_TOKEN": "local-dev-token",
+            "API_KEY_COPY": "api_secret_456",
+        }
+
+    def test_fetches_each_needed_reference_once(self, layers, fake_op):
+        """Shared references are fetched once; overridden secrets never."""
+        from haunt_secrets import env_layers, get_layered_secrets
+
+        fake_op({
+            "op://staging/database/password": "staging_db",
+            "op://prod/api/key": "api_secret_456",
+        })
+
+        get_layered_secrets(env_layers(layers, "staging"))
+
+        assert sorted(fake_op.calls()) == [
+            "read op://prod/api/key",
+            "read op://staging/database/password",
+        ]
+
+    def test_batch_uses_single_inject(self, layers, fake_op):
+        """batch=True should resolve all layers with one op call."""
+        from haunt_secrets import env_layers, get_layered_secrets
+
+        fake_op({
+            "op://staging/database/password": "staging_db",
+            "op://prod/api/key": "api_secret_456",
+        })
+
+        get_layered_secrets(env_layers(layers, "staging"), batch=True)
+
+        assert fake_op.calls() == ["inject"]
+
+    def test_env_layers_skips_missing_files(self, layers):
+        """env_layers() should list only files that exist, lowest precedence first."""
+        from haunt_secrets import env_layers
+
+        assert [p.name for p in env_layers(layers, "prod")] == [".env", ".env.local"]
+
+    def test_missing_file_raises_unless_missing_ok(self, layers, fake_op):
+        """Explicit paths must exist unless missing_ok is set."""
+        from haunt_secrets import get_layered_secrets
+
+        with pytest.raises(FileNotFoundError):
+            get_layered_secrets([layers / ".env.local", layers / ".env.nope"])
+
+        result = get_layered_secrets([layers / ".env.local", layers / ".env.nope"], missing_ok=True)
+        assert result == {"APP_NAME": "local", "LEGACY_TOKEN": "local-dev-token"}
+        assert fake_op.calls() == []
@@ -0,0 +1,158 @@
+"""Tests for background secret refresh."""
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from haunt_secrets import SecretBackend, SecretRefresher, register_backend, unregister_backend
+from haunt_secrets.redaction import contains_secret, reset_secrets
+
+
+class RotatingBackend(SecretBackend):
+    """In-memory backend whose values can be rotated mid-test."""
+
+    prefers_bulk = True
+
+    def __init__(self, values):
+        self.values = dict(values)
+        self.fetch_many_calls = 0
+        self.fail = False
+
+    def fetch(self, vault, item, field):
+        if self.fail:
+            raise RuntimeError("backend down")
+        return self.values[f"{vault}/{item}/{field}"]
+
+    def fetch_many(self, references):
+        self.fetch_many_calls += 1
+        return super().fetch_many(references)
+
+
+@pytest.fixture
+def backend():
+    backend = RotatingBackend({"prod/database/password": "old_db_secret", "prod/api/key": "old_api_secret"})
+    register_backend("rotating", backend)
+    reset_secrets()
+    yield backend
+    unregister_backend("rotating")
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "APP_NAME=demo\n"
+        "# @secret:rotating:prod/database/password\nDB_PASSWORD=x\n"
+        "# @secret:rotating:prod/api/key\nAPI_KEY=x\n"
+    )
+    return str(env_file)
+
+
+class TestSecretRefresher:
+    """Tests for SecretRefresher."""
+
+    def test_first_snapshot_loads_synchronously(self, env_file, backend):
+        refresher = SecretRefresher(env_file, export=False)
+
+        snapshot = refresher.snapshot
+
+        assert dict(snapshot) == {"APP_NAME": "demo", "DB_PASSWORD": "old_db_secret", "API_KEY": "old_api_secret"}
+        assert snapshot.generation == 1
+        assert snapshot.secret_names == {"DB_PASSWORD", "API_KEY"}
+        assert backend.fetch_many_calls == 1
+
+    def test_refresh_swaps_whole_snapshot(self, env_file, backend):
+        """An old snapshot never changes; the new one has every rotated value."""
+        refresher = SecretRefresher(env_file, export=False)
+        old = refresher.snapshot
+
+        backend.values = {"prod/database/password": "new_db_secret", "prod/api/key": "new_api_secret"}
+        new = refresher.refresh()
+
+        assert old["DB_PASSWORD"] == "old_db_secret" and old["API_KEY"] == "old_api_secret"
+        assert new["DB_PASSWORD"] == "new_db_secret" and new["API_KEY"] == "new_api_secret"
+        assert refresher.snapshot is new
+        assert new.generation == 2
+
+    def test_snapshot_is_read_only(self, env_file, backend):
+        snapshot = SecretRefresher(env_file, export=False).snapshot
+
+        with pytest.raises(TypeError):
+            snapshot["DB_PASSWORD"] = "changed"
+        assert "old_db_secret" not in repr(snapshot)
+
+    def test_exports_to_os_environ(self, env_file, backend):
+        with patch.dict(os.environ):
+            refresher = SecretRefresher(env_file)
+            refresher.refresh()
+            assert os.environ["DB_PASSWORD"] == "old_db_secret"
+
+            backend.values["prod/database/password"] = "new_db_secret"
+            refresher.refresh()
+            assert os.environ["DB_PASSWORD"] == "new_db_secret"
+
+    def test_new_values_registered_old_values_kept_for_grace_period(self, env_file, backend):
+        refresher = SecretRefresher(env_file, export=False, grace_period=0.2)
+        refresher.refresh()
+
+        backend.values["prod/database/password"] = "new_db_secret"
+        refresher.refresh()
+
+        assert contains_secret("new_db_secret")
+        assert contains_secret("old_db_secret")
+
+        time.sleep(0.25)
+        refresher.refresh()
+
+        assert not contains_secret("old_db_secret")
+        assert contains_secret("new_db_secret")
+        assert contains_secret("old_api_secret")  # unchanged values stay registered
+
+    def test_failed_refresh_keeps_previous_snapshot(self, env_file, backend):
+        refresher = SecretRefresher(env_file, export=False)
+        snapshot = refresher.snapshot
+
+        backend.fail = True
+        with pytest.raises(RuntimeError, match="backend down"):
+            refresher.refresh()
+
+        assert refresher.snapshot is snapshot
+
+    def test_background_thread_refreshes(self, env_file, backend):
+        with SecretRefresher(env_file, interval=0.05, export=False) as refresher:
+            backend.values["prod/api/key"] = "new_api_secret"
+            deadline = time.monotonic() + 2
+            while refresher.snapshot["API_KEY"] != "new_api_secret" and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert refresher.snapshot["API_KEY"] == "new_api_secret"
+
+        assert not any(t.name == "haunt-secrets-refresh" for t in threading.enumerate())
+
+    def test_background_errors_reported(self, env_file, backend):
+        errors = []
+        refresher = SecretRefresher(env_file, interval=0.05, export=False, on_error=errors.append)
+        refresher.start()
+        backend.fail = True
+        try:
+            deadline = time.monotonic() + 2
+            while not errors and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            refresher.stop()
+
+        assert errors and refresher.last_error is errors[-1]
+        assert refresher.snapshot["API_KEY"] == "old_api_secret"
+
+    def test_interval_defaults_to_cache_ttl(self, env_file):
+        class Cache:
+            ttl = 100
+
+        assert SecretRefresher(env_file, cache=Cache()).interval == pytest.approx(80)
+
+    def test_rejects_bad_interval(self, env_file):
+        with pytest.raises(ValueError):
+            SecretRefresher(env_file, interval=0)
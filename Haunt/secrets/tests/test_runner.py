@@ -0,0 +1,132 @@
+"""Tests for the redacting subprocess runner."""
+
+import os
+import subprocess
+import sys
+import time
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from haunt_secrets import run
+from haunt_secrets.redaction import reset_secrets
+
+
+class TimedStream(StringIO):
+    """StringIO that records when the first write arrived."""
+
+    first_write = None
+
+    def write(self, text):
+        if self.first_write is None and text:
+            self.first_write = time.monotonic()
+        return super().write(text)
+
+
+def python_cmd(code):
+    return [sys.executable, "-c", code]
+
+
+class TestRun:
+    """Tests for run()."""
+
+    def setup_method(self):
+        """Reset registered secrets before each test."""
+        reset_secrets()
+
+    def test_injects_secrets_only_into_child(self):
+        """Secrets should reach the child but never os.environ."""
+        out = StringIO()
+
+        result = run(
+            python_cmd("import os; print(len(os.environ['DB_PASSWORD']))"),
+            secrets={"DB_PASSWORD": "db_secret_123"},
+            stdout=out,
+        )
+
+        assert result.returncode == 0
+        assert out.getvalue() == "13\n"
+        assert "DB_PASSWORD" not in os.environ
+
+    def test_redacts_stdout_and_stderr(self):
+        """Injected secrets printed by the child should be masked on both streams."""
+        out, err = StringIO(), StringIO()
+
+        run(
+            python_cmd(
+                "import os, sys\n"
+                "print('key=' + os.environ['API_KEY'])\n"
+                "print('err ' + os.environ['API_KEY'], file=sys.stderr)\n"
+            ),
+            secrets={"API_KEY": "abc123xyz789"},
+            stdout=out,
+            stderr=err,
+        )
+
+        assert out.getvalue() == "key=***REDACTED***\n"
+        assert err.getvalue() == "err ***REDACTED***\n"
+
+    def test_redacts_injected_secret_echoed_by_shell(self):
+        """A secrets= value is registered by run() itself, without register_secret()."""
+        out = StringIO()
+
+        run(["sh", "-c", "echo $TOKEN"], secrets={"TOKEN": "hunter2-db-pass"}, stdout=out)
+
+        assert out.getvalue() == "***REDACTED***\n"
+
+    def test_secret_split_across_writes(self):
+        """A secret written in pieces with pauses should still be masked."""
+        out = StringIO()
+
+        run(
+            python_cmd(
+                "import os, sys, time\n"
+                "key = os.environ['API_KEY']\n"
+                "sys.stdout.write('token=' + key[:6]); sys.stdout.flush(); time.sleep(0.2)\n"
+                "sys.stdout.write(key[6:] + '\\n')\n"
+            ),
+            secrets={"API_KEY": "abc123xyz789"},
+            stdout=out,
+        )
+
+        assert out.getvalue() == "token=***REDACTED***\n"
+
+    def test_streams_output_before_exit(self):
+        """Output should be forwarded while the child is still running."""
+        out = TimedStream()
+
+        run(
+            python_cmd("import time; print('started', flush=True); time.sleep(1)"),
+            stdout=out,
+        )
+        finished = time.monotonic()
+
+        assert out.getvalue() == "started\n"
+        assert finished - out.first_write > 0.5
+
+    def test_resolves_env_file(self, tmp_path):
+        """env_file should be resolved with get_secrets() and injected."""
+        out = StringIO()
+
+        with patch("haunt_secrets.runner.get_secrets", return_value={"TOKEN": "t0ken"}) as mock_get:
+            run(python_cmd("import os; print(os.environ['TOKEN'] == 't0ken')"), tmp_path / ".env", stdout=out)
+
+        mock_get.assert_called_once_with(tmp_path / ".env", batch=False, cache=None)
+        assert out.getvalue() == "True\n"
+
+    def test_check_raises_on_failure(self):
+        """check=True should raise CalledProcessError on non-zero exit."""
+        with pytest.raises(subprocess.CalledProcessError):
+            run(python_cmd("raise SystemExit(3)"), stdout=StringIO(), check=True)
+
+    def test_returns_exit_code(self):
+        """Non-zero exit codes should be reported without raising by default."""
+        result = run(python_cmd("raise SystemExit(3)"), stdout=StringIO())
+
+        assert result.returncode == 3
+
+    def test_timeout_kills_child(self):
+        """The child should be killed and TimeoutExpired raised on timeout."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            run(python_cmd("import time; time.sleep(10)"), stdout=StringIO(), timeout=0.2)
@@ -0,0 +1,140 @@
+"""Tests for stats() instrumentation."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from haunt_secrets import DictBackend, get_secrets, register_backend, reset_stats, stats, stats_json, unregister_backend
+from haunt_secrets.redaction import contains_secret, redact, redact_structure, register_secret, reset_secrets
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_stats()
+    reset_secrets()
+    yield
+    reset_stats()
+    reset_secrets()
+
+
+class PerReferenceBackend(DictBackend):
+    """DictBackend fetched one reference at a time unless batch=True."""
+
+    prefers_bulk = False
+
+
+@pytest.fixture
+def dict_backend():
+    register_backend("dict", PerReferenceBackend({
+        "prod/database/password": "db_secret_123",
+        "prod/api/key": "api_secret_456",
+        "staging/api/key": "staging_secret_789",
+    }))
+    yield
+    unregister_backend("dict")
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text(
+        "# @secret:dict:prod/database/password\n"
+        "DB_PASSWORD=placeholder\n"
+        "# @secret:dict:prod/api/key\n"
+        "API_KEY=placeholder\n"
+        "# @secret:dict:staging/api/key\n"
+        "STAGING_KEY=placeholder\n"
+        "PLAIN=value\n"
+    )
+    # Outside the racy-mtime window, so the second parse is a memo hit
+    os.utime(path, ns=(0, 0))
+    return path
+
+
+class TestStats:
+    """Tests for the counters and timers behind stats()."""
+
+    def test_empty_after_reset(self):
+        """Should report zero for every section after reset_stats()."""
+        result = stats()
+        assert result["parse"]["files_read"] == 0
+        assert result["fetch"]["references"] == {}
+        assert result["subprocess"] == {}
+        assert result["cache"] == {"hits": 0, "misses": 0}
+        assert result["redaction"] == {"calls": 0, "chars_scanned": 0}
+
+    def test_records_per_reference_and_vault_latency(self, env_file, dict_backend):
+        """Should time each reference and roll the timings up per vault."""
+        get_secrets(env_file, batch=False)
+        fetch = stats()["fetch"]
+
+        assert set(fetch["references"]) == {
+            "dict://prod/database/password",
+            "dict://prod/api/key",
+            "dict://staging/api/key",
+        }
+        assert fetch["vaults"]["dict://prod"]["count"] == 2
+        assert fetch["vaults"]["dict://staging"]["count"] == 1
+
+    def test_sorted_slowest_first(self, env_file, dict_backend):
+        """Should list references by total time, slowest first."""
+        get_secrets(env_file, batch=False)
+        totals = [t["total_ms"] for t in stats()["fetch"]["references"].values()]
+        assert totals == sorted(totals, reverse=True)
+
+    def test_batch_fetch_recorded_per_backend(self, env_file, dict_backend):
+        """Should record one batch timing per backend call."""
+        get_secrets(env_file, batch=True)
+        assert stats()["fetch"]["batches"]["dict"]["count"] == 1
+
+    def test_parse_files_and_memo_hits(self, env_file, dict_backend):
+        """Should count a file read once, then memo hits for unchanged files."""
+        get_secrets(env_file)
+        get_secrets(env_file)
+        parse = stats()["parse"]
+        assert parse["files_read"] == 1
+        assert parse["memo_hits"] >= 1
+
+    def test_counts_op_subprocesses(self, fake_op, tmp_path):
+        """Should count op processes by subcommand."""
+        fake_op({"op://prod/api/key": "api_secret_456"})
+        path = tmp_path / ".env"
+        path.write_text("# @secret:op:prod/api/key\nAPI_KEY=placeholder\n")
+
+        get_secrets(path, batch=False)
+        assert stats()["subprocess"] == {"op read": 1}
+
+    def test_counts_redaction_calls_and_chars(self):
+        """Should count every scan and the characters it covered."""
+        register_secret("TOKEN", "hunter2_secret")
+        redact("abc hunter2_secret")
+        contains_secret("hello")
+        redact_structure({"a": "a longer value two"})
+
+        redaction = stats()["redaction"]
+        assert redaction["calls"] == 3
+        assert redaction["chars_scanned"] == len("abc hunter2_secret") + len("hello") + len("a longer value two")
+
+    def test_never_contains_secret_values(self, env_file, dict_backend):
+        """Should record references and names only."""
+        get_secrets(env_file)
+        serialized = stats_json()
+        for value in ("db_secret_123", "api_secret_456", "staging_secret_789"):
+            assert value not in serialized
+
+    def test_stats_json_round_trips(self, env_file, dict_backend):
+        """Should serialize stats() as JSON."""
+        get_secrets(env_file)
+        assert json.loads(stats_json()) == stats()
+
+    def test_written_at_exit_when_env_var_set(self, tmp_path):
+        """Should write stats JSON to HAUNT_SECRETS_STATS when the process exits."""
+        out = tmp_path / "stats.json"
+        code = "from haunt_secrets.redaction import redact; redact('some text')"
+        env = dict(os.environ, HAUNT_SECRETS_STATS=str(out))
+        subprocess.run([sys.executable, "-c", code], env=env, check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+
+        assert json.loads(out.read_text())["redaction"]["calls"] == 1
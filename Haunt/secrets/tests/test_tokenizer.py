@@ -0,0 +1,129 @@
+"""Tests for the single-pass .env tokenizer."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from haunt_secrets.tokenizer import (
+    clear_tokenizer_cache,
+    tokenize_env_content,
+    tokenize_env_file,
+)
+
+
+CONTENT = """# Plain variable
+PLAIN_VAR=plain_value
+
+# @secret:op:prod/database/password
+DB_PASSWORD=placeholder
+# @secret:op:prod/broken
+BROKEN=placeholder
+DEBUG = true
+"""
+
+
+def _age(path, seconds=10):
+    """Backdate a file's mtime so it is outside the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_tokenizer_cache()
+    yield
+    clear_tokenizer_cache()
+
+
+class TestTokenizeEnvContent:
+    """Tests for tokenize_env_content()."""
+
+    def test_collects_assignments_secrets_and_lines(self):
+        """One scan should yield every assignment, tag and line number."""
+        tokens = tokenize_env_content(CONTENT)
+
+        assert tokens.assignments == {
+            "PLAIN_VAR": "plain_value",
+            "DB_PASSWORD": "placeholder",
+            "BROKEN": "placeholder",
+            "DEBUG": "true",
+        }
+        assert tokens.secrets == {
+            "DB_PASSWORD": {"vault": "prod", "item": "database", "field": "password", "backend": "op"}
+        }
+        assert tokens.line_numbers == {"PLAIN_VAR": 2, "DB_PASSWORD": 5, "BROKEN": 7, "DEBUG": 8}
+
+    def test_records_malformed_tag_warning(self):
+        """Malformed tags should be reported, not applied."""
+        tokens = tokenize_env_content(CONTENT)
+
+        assert len(tokens.warnings) == 1
+        assert "prod/broken" in tokens.warnings[0]
+
+
+class TestTokenizeEnvFile:
+    """Tests for tokenize_env_file() memoization."""
+
+    def test_unchanged_file_is_not_reread(self, tmp_path):
+        """A second call on an unchanged file should reuse the first result."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(CONTENT)
+        _age(env_file)
+
+        first = tokenize_env_file(env_file)
+        with patch("haunt_secrets.tokenizer.tokenize_env_content") as mock_tokenize:
+            second = tokenize_env_file(str(env_file))
+
+        mock_tokenize.assert_not_called()
+        assert second is first
+
+    def test_modified_file_is_reread(self, tmp_path):
+        """A change in mtime or size should invalidate the memo."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("A=1\n")
+        _age(env_file, 20)
+        tokenize_env_file(env_file)
+
+        env_file.write_text("A=2\n")
+        _age(env_file, 10)
+
+        assert tokenize_env_file(env_file).assignments == {"A": "2"}
+
+    def test_recently_modified_file_is_always_reread(self, tmp_path):
+        """Files inside the racy window should not be trusted from the memo."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("A=1\n")
+        tokenize_env_file(env_file)
+
+        # Same size, and possibly the same coarse mtime
+        env_file.write_text("A=2\n")
+
+        assert tokenize_env_file(env_file).assignments == {"A": "2"}
+
+    def test_missing_file_raises(self, tmp_path):
+        """Should raise FileNotFoundError for missing files."""
+        with pytest.raises(FileNotFoundError):
+            tokenize_env_file(tmp_path / "missing.env")
+
+    def test_loader_reads_file_once(self, tmp_path, monkeypatch):
+        """get_secrets() should read the .env file a single time."""
+        from pathlib import Path
+        from haunt_secrets import get_secrets
+
+        env_file = tmp_path / ".env"
+        env_file.write_text("PLAIN_VAR=plain_value\nDEBUG=true\n")
+        monkeypatch.setenv("OP_SERVICE_ACCOUNT_TOKEN", "test_token")
+
+        reads = []
+        original = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+        assert get_secrets(env_file) == {"PLAIN_VAR": "plain_value", "DEBUG": "true"}
+        assert len(reads) == 1
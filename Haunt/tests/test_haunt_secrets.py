@@ -1139,3 +1139,596 @@ SECRET_VAR=placeholder
         assert result_failure.success is False
         assert result_failure.validated == ["VAR1"]
         assert len(result_failure.missing) == 1
+
+
+# ========== BATCH FETCH TESTS ==========
+
+FAKE_OP_SCRIPT = '''#!{python}
+"""Fake op CLI: serves secrets from a JSON file and logs every invocation."""
+import json
+import os
+import re
+import sys
+
+with open(os.environ["FAKE_OP_SECRETS"]) as f:
+    secrets = json.load(f)
+with open(os.environ["FAKE_OP_LOG"], "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+
+def resolve(ref):
+    if ref not in secrets:
+        sys.stderr.write(f"[ERROR] could not read secret '{{ref}}': item not found\\n")
+        sys.exit(1)
+    return secrets[ref]
+
+if sys.argv[1] == "read":
+    sys.stdout.write(resolve(sys.argv[2]) + "\\n")
+elif sys.argv[1] == "inject":
+    template = sys.stdin.read()
+    refs = re.findall(r"\\{{\\{{ (op://[^ ]+) \\}}\\}}", template)
+    values = {{ref: resolve(ref) for ref in refs}}
+    sys.stdout.write(re.sub(r"\\{{\\{{ (op://[^ ]+) \\}}\\}}", lambda m: values[m.group(1)], template))
+'''
+
+
+@pytest.fixture
+def fake_op(tmp_path, monkeypatch):
+    """Install a fake `op` executable on PATH backed by a JSON secrets file"""
+    import json
+    import sys
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    op_path = bin_dir / "op"
+    op_path.write_text(FAKE_OP_SCRIPT.format(python=sys.executable))
+    op_path.chmod(0o755)
+
+    secrets_file = tmp_path / "op-secrets.json"
+    log_file = tmp_path / "op-calls.log"
+    log_file.write_text("")
+
+    def configure(secrets):
+        secrets_file.write_text(json.dumps(secrets))
+
+    configure({})
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_OP_SECRETS", str(secrets_file))
+    monkeypatch.setenv("FAKE_OP_LOG", str(log_file))
+    monkeypatch.setenv("OP_SERVICE_ACCOUNT_TOKEN", "test-token")
+
+    configure.calls = lambda: log_file.read_text().splitlines()
+    return configure
+
+
+@pytest.fixture
+def batch_env_file(tmp_path):
+    """A .env file with three tagged secrets (two sharing a reference) and one plaintext var"""
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# @secret:op:vault1/item1/field1\n"
+        "SECRET1=placeholder\n"
+        "# @secret:op:vault2/item2/field2\n"
+        "SECRET2=placeholder\n"
+        "# @secret:op:vault1/item1/field1\n"
+        "SECRET1_ALIAS=placeholder\n"
+        "PLAINTEXT_VAR=plaintext-value\n"
+    )
+    return str(env_file)
+
+
+class TestFetchSecretsBatch:
+    """Test suite for batch resolution via a single `op inject` call"""
+
+    def test_fetch_secrets_batch_single_op_call(self, fake_op):
+        """Should resolve all tags with exactly one op process"""
+        from haunt_secrets import fetch_secrets_batch
+
+        fake_op({
+            "op://vault1/item1/field1": "value-1",
+            "op://vault2/item2/field2": "value-2",
+        })
+
+        result = fetch_secrets_batch({
+            "SECRET1": ("vault1", "item1", "field1"),
+            "SECRET2": ("vault2", "item2", "field2"),
+        })
+
+        assert result == {"SECRET1": "value-1", "SECRET2": "value-2"}
+        assert fake_op.calls() == ["inject"]
+
+    def test_fetch_secrets_batch_handles_multiline_secret(self, fake_op):
+        """Multiline values should map back to the right variable"""
+        from haunt_secrets import fetch_secrets_batch
+
+        fake_op({
+            "op://vault1/item1/key": "-----BEGIN KEY-----\nabc\n-----END KEY-----",
+            "op://vault2/item2/field2": "value-2",
+        })
+
+        result = fetch_secrets_batch({
+            "TLS_KEY": ("vault1", "item1", "key"),
+            "SECRET2": ("vault2", "item2", "field2"),
+        })
+
+        assert result["TLS_KEY"] == "-----BEGIN KEY-----\nabc\n-----END KEY-----"
+        assert result["SECRET2"] == "value-2"
+
+    def test_fetch_secrets_batch_reports_failing_reference(self, fake_op):
+        """Should raise SecretNotFoundError naming the vault/item/field that failed"""
+        from haunt_secrets import fetch_secrets_batch, SecretNotFoundError
+
+        fake_op({"op://vault1/item1/field1": "value-1"})
+
+        with pytest.raises(SecretNotFoundError) as exc_info:
+            fetch_secrets_batch({
+                "SECRET1": ("vault1", "item1", "field1"),
+                "SECRET2": ("vault2", "item2", "field2"),
+            })
+
+        assert "vault='vault2'" in str(exc_info.value)
+        assert "item='item2'" in str(exc_info.value)
+
+    def test_fetch_secrets_batch_missing_token(self, fake_op, monkeypatch):
+        """Should raise MissingTokenError before spawning op"""
+        from haunt_secrets import fetch_secrets_batch, MissingTokenError
+
+        monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN")
+
+        with pytest.raises(MissingTokenError):
+            fetch_secrets_batch({"SECRET1": ("vault1", "item1", "field1")})
+        assert fake_op.calls() == []
+
+    def test_get_secrets_batch_dedups_shared_reference(self, fake_op, batch_env_file):
+        """get_secrets(batch=True) should fan one fetched value out to every tagged variable"""
+        from haunt_secrets import get_secrets
+
+        fake_op({
+            "op://vault1/item1/field1": "value-1",
+            "op://vault2/item2/field2": "value-2",
+        })
+
+        result = get_secrets(batch_env_file, batch=True)
+
+        assert result == {
+            "SECRET1": "value-1",
+            "SECRET2": "value-2",
+            "SECRET1_ALIAS": "value-1",
+            "PLAINTEXT_VAR": "plaintext-value",
+        }
+        assert fake_op.calls() == ["inject"]
+
+    def test_load_secrets_batch_populates_os_environ(self, fake_op, batch_env_file):
+        """load_secrets(batch=True) should export batch-resolved secrets"""
+        from haunt_secrets import load_secrets
+
+        fake_op({
+            "op://vault1/item1/field1": "value-1",
+            "op://vault2/item2/field2": "value-2",
+        })
+
+        try:
+            load_secrets(batch_env_file, batch=True)
+            assert os.environ["SECRET1"] == "value-1"
+            assert os.environ["SECRET1_ALIAS"] == "value-1"
+            assert os.environ["PLAINTEXT_VAR"] == "plaintext-value"
+        finally:
+            for var_name in ("SECRET1", "SECRET2", "SECRET1_ALIAS", "PLAINTEXT_VAR"):
+                os.environ.pop(var_name, None)
+
+
+# ========== PARALLEL FETCH TESTS ==========
+
+class TestFetchSecretsParallel:
+    """Test suite for thread-pool fetching with aggregated errors"""
+
+    @staticmethod
+    def _mock_op_read(monkeypatch, failures=None, delay=0.0):
+        """Mock subprocess.run for `op read`, tracking peak concurrency"""
+        import subprocess
+        import threading
+        import time
+        from unittest.mock import Mock
+
+        failures = failures or {}
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0, "calls": 0}
+
+        def mock_run(cmd, *args, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["calls"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                time.sleep(delay)
+                op_ref = cmd[2]
+                result = Mock()
+                if op_ref in failures:
+                    result.returncode = 1
+                    result.stdout = ""
+                    result.stderr = failures[op_ref]
+                else:
+                    result.returncode = 0
+                    result.stdout = f"value-of-{op_ref.rsplit('/', 1)[-1]}\n"
+                    result.stderr = ""
+                return result
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        monkeypatch.setenv("OP_SERVICE_ACCOUNT_TOKEN", "test-token")
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        return state
+
+    def test_parallel_fetch_preserves_order(self, monkeypatch):
+        """Results should follow secret_tags order regardless of completion order"""
+        from haunt_secrets import fetch_secrets_parallel
+
+        self._mock_op_read(monkeypatch)
+        tags = {f"VAR{i}": ("vault", "item", f"field{i}") for i in range(10)}
+
+        result = fetch_secrets_parallel(tags, max_workers=4)
+
+        assert list(result) == [f"VAR{i}" for i in range(10)]
+        assert result["VAR3"] == "value-of-field3"
+
+    def test_parallel_fetch_bounded_concurrency(self, monkeypatch):
+        """No more than max_workers op processes should run at once"""
+        from haunt_secrets import fetch_secrets_parallel
+
+        state = self._mock_op_read(monkeypatch, delay=0.02)
+        tags = {f"VAR{i}": ("vault", "item", f"field{i}") for i in range(12)}
+
+        fetch_secrets_parallel(tags, max_workers=3)
+
+        assert state["calls"] == 12
+        assert 1 < state["peak"] <= 3
+
+    def test_parallel_fetch_aggregates_errors(self, monkeypatch):
+        """Every failure should be collected into one SecretFetchError"""
+        from haunt_secrets import (
+            fetch_secrets_parallel, SecretFetchError,
+            SecretNotFoundError, AuthenticationError
+        )
+
+        state = self._mock_op_read(monkeypatch, failures={
+            "op://vault/item/field1": "[ERROR] item not found",
+            "op://vault/item/field3": "[ERROR] authentication required",
+        })
+        tags = {f"VAR{i}": ("vault", "item", f"field{i}") for i in range(5)}
+
+        with pytest.raises(SecretFetchError) as exc_info:
+            fetch_secrets_parallel(tags, max_workers=4)
+
+        errors = exc_info.value.errors
+        assert [(name, ref) for name, ref, _ in errors] == [
+            ("VAR1", "op://vault/item/field1"),
+            ("VAR3", "op://vault/item/field3"),
+        ]
+        assert isinstance(errors[0][2], SecretNotFoundError)
+        assert isinstance(errors[1][2], AuthenticationError)
+        # Remaining secrets were still fetched
+        assert state["calls"] == 5
+
+    def test_parallel_fetch_rejects_invalid_max_workers(self):
+        """max_workers below 1 should raise ValueError"""
+        from haunt_secrets import fetch_secrets_parallel
+
+        with pytest.raises(ValueError):
+            fetch_secrets_parallel({"VAR": ("vault", "item", "field")}, max_workers=0)
+
+    def test_get_secrets_with_max_workers(self, monkeypatch, batch_env_file):
+        """get_secrets(max_workers=N) should fetch shared references once"""
+        from haunt_secrets import get_secrets
+
+        state = self._mock_op_read(monkeypatch)
+
+        result = get_secrets(batch_env_file, max_workers=4)
+
+        assert list(result) == ["SECRET1", "SECRET2", "SECRET1_ALIAS", "PLAINTEXT_VAR"]
+        assert result["SECRET1_ALIAS"] == "value-of-field1"
+        assert state["calls"] == 2
+
+    def test_validate_secrets_with_max_workers(self, monkeypatch, batch_env_file):
+        """validate_secrets(max_workers=N) should report failures in .env order"""
+        from haunt_secrets import validate_secrets
+
+        self._mock_op_read(monkeypatch, failures={
+            "op://vault1/item1/field1": "[ERROR] item not found",
+        })
+
+        result = validate_secrets(batch_env_file, max_workers=4)
+
+        assert result.success is False
+        assert result.validated == ["SECRET2"]
+        assert [name for name, _, _ in result.missing] == ["SECRET1", "SECRET1_ALIAS"]
+
+
+class TestTokenizeEnvFile:
+    """Test suite for the memoized single-pass .env tokenizer"""
+
+    @staticmethod
+    def _write_aged(path, content, age=10):
+        """Write content and backdate mtime outside the racy window"""
+        import time
+
+        path.write_text(content)
+        past = time.time() - age
+        os.utime(path, (past, past))
+
+    def test_tokenize_collects_tags_and_plaintext(self, batch_env_file):
+        """One pass should produce tags, assignments and line numbers"""
+        from haunt_secrets import tokenize_env_file
+
+        tokens = tokenize_env_file(batch_env_file)
+
+        assert tokens.secret_tags["SECRET1"] == ("vault1", "item1", "field1")
+        assert list(tokens.variables) == ["SECRET1", "SECRET2", "SECRET1_ALIAS", "PLAINTEXT_VAR"]
+        assert tokens.line_numbers["SECRET1"] == 2
+
+    def test_tokenize_memoizes_unchanged_file(self, tmp_path, monkeypatch):
+        """An unchanged file should not be opened again"""
+        import builtins
+        from haunt_secrets import tokenize_env_file
+
+        env_file = tmp_path / ".env"
+        self._write_aged(env_file, "# @secret:op:v/i/f\nSECRET=x\nPLAIN=1\n")
+        first = tokenize_env_file(str(env_file))
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("file was re-read")
+
+        monkeypatch.setattr(builtins, "open", fail_open)
+
+        assert tokenize_env_file(str(env_file)) is first
+
+    def test_tokenize_rereads_modified_file(self, tmp_path):
+        """A changed mtime/size should invalidate the memo"""
+        from haunt_secrets import tokenize_env_file
+
+        env_file = tmp_path / ".env"
+        self._write_aged(env_file, "PLAIN=1\n", age=20)
+        tokenize_env_file(str(env_file))
+
+        self._write_aged(env_file, "PLAIN=22\n", age=10)
+
+        assert tokenize_env_file(str(env_file)).variables == {"PLAIN": "22"}
+
+    def test_get_secrets_opens_file_once(self, tmp_path, monkeypatch):
+        """get_secrets() should read the .env file a single time"""
+        import builtins
+        from haunt_secrets import get_secrets
+
+        env_file = tmp_path / ".env"
+        env_file.write_text("PLAIN=1\nOTHER=2\n")
+        opened = []
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(file)
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+
+        assert get_secrets(str(env_file)) == {"PLAIN": "1", "OTHER": "2"}
+        assert len([f for f in opened if str(f).endswith(".env")]) == 1
+
+
+class TestValidateSecretsMetadataOnly:
+    """Test suite for validate_secrets(metadata_only=True)"""
+
+    @staticmethod
+    def _mock_op_item_get(monkeypatch, items, delay=0.0):
+        """Mock `op item get` returning item JSON; records every command"""
+        import json
+        import subprocess
+        import threading
+        import time
+        from unittest.mock import Mock
+
+        lock = threading.Lock()
+        state = {"commands": [], "active": 0, "peak": 0}
+
+        def mock_run(cmd, *args, **kwargs):
+            with lock:
+                state["commands"].append(cmd)
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                time.sleep(delay)
+                result = Mock()
+                vault, item = cmd[cmd.index("--vault") + 1], cmd[3]
+                fields = items.get((vault, item))
+                if fields is None:
+                    result.returncode = 1
+                    result.stdout = ""
+                    result.stderr = f"[ERROR] \"{item}\" isn't an item. not found"
+                else:
+                    result.returncode = 0
+                    result.stdout = json.dumps({
+                        "id": "abc",
+                        "fields": [{"id": f, "label": f, "value": "hidden-value"} for f in fields],
+                    })
+                    result.stderr = ""
+                return result
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        monkeypatch.setenv("OP_SERVICE_ACCOUNT_TOKEN", "test-token")
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        return state
+
+    def test_queries_each_item_once(self, monkeypatch, tmp_path):
+        """Fields sharing an item should be checked with one lookup"""
+        from haunt_secrets import validate_secrets
+
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# @secret:op:vault1/item1/username\nDB_USER=x\n"
+            "# @secret:op:vault1/item1/password\nDB_PASSWORD=x\n"
+            "# @secret:op:vault2/item2/token\nAPI_TOKEN=x\n"
+        )
+        state = self._mock_op_item_get(monkeypatch, {
+            ("vault1", "item1"): ["username", "password"],
+            ("vault2", "item2"): ["token"],
+        })
+
+        result = validate_secrets(str(env_file), metadata_only=True)
+
+        assert result.success is True
+        assert result.validated == ["DB_USER", "DB_PASSWORD", "API_TOKEN"]
+        assert len(state["commands"]) == 2
+        assert all(cmd[:3] == ["op", "item", "get"] for cmd in state["commands"])
+        assert all("--reveal" not in cmd for cmd in state["commands"])
+
+    def test_reports_missing_field_and_item(self, monkeypatch, batch_env_file):
+        """Missing fields and missing items should both be reported per variable"""
+        from haunt_secrets import validate_secrets
+
+        self._mock_op_item_get(monkeypatch, {("vault1", "item1"): ["other"]})
+
+        result = validate_secrets(batch_env_file, metadata_only=True)
+
+        assert result.success is False
+        missing = {name: msg for name, _, msg in result.missing}
+        assert set(missing) == {"SECRET1", "SECRET2", "SECRET1_ALIAS"}
+        assert "Field 'field1' not found" in missing["SECRET1"]
+        assert "item2" in missing["SECRET2"]
+
+    def test_reports_latency_per_variable(self, monkeypatch, batch_env_file):
+        """Every variable should get a latency measurement"""
+        from haunt_secrets import validate_secrets
+
+        self._mock_op_item_get(monkeypatch, {
+            ("vault1", "item1"): ["field1"],
+            ("vault2", "item2"): ["field2"],
+        }, delay=0.05)
+
+        result = validate_secrets(batch_env_file, metadata_only=True)
+
+        assert set(result.latencies) == {"SECRET1", "SECRET2", "SECRET1_ALIAS"}
+        assert all(latency >= 0.05 for latency in result.latencies.values())
+
+    def test_items_checked_concurrently(self, monkeypatch, batch_env_file):
+        """Item lookups should run in parallel by default"""
+        from haunt_secrets import validate_secrets
+
+        state = self._mock_op_item_get(monkeypatch, {
+            ("vault1", "item1"): ["field1"],
+            ("vault2", "item2"): ["field2"],
+        }, delay=0.1)
+
+        validate_secrets(batch_env_file, metadata_only=True)
+
+        assert state["peak"] == 2
+
+    def test_values_not_retained(self, monkeypatch, batch_env_file):
+        """Nothing from the item JSON except field names should surface"""
+        from haunt_secrets import fetch_item_field_names
+
+        self._mock_op_item_get(monkeypatch, {("vault1", "item1"): ["field1"]})
+
+        assert fetch_item_field_names("vault1", "item1") == {"field1"}
+
+    def test_values_left_out_of_parsed_item(self):
+        """Field values are left out of the parsed item JSON"""
+        import json
+        from haunt_secrets import _without_values
+
+        response = json.dumps({
+            "id": "abc",
+            "fields": [{"id": "password", "label": "password", "value": "hidden-value"}],
+            "sections": [{"id": "s1", "fields": [{"value": "nested-hidden"}]}],
+        })
+
+        parsed = json.loads(response, object_pairs_hook=_without_values)
+
+        assert "hidden" not in repr(parsed)
+        assert parsed["fields"] == [{"id": "password", "label": "password"}]
+
+
+# ========== PROFILING TESTS ==========
+
+class TestStatsAndProfile:
+    """Test suite for stats() instrumentation and the --profile entry point"""
+
+    @pytest.fixture(autouse=True)
+    def clean_stats(self):
+        from haunt_secrets import reset_stats
+        reset_stats()
+        yield
+        reset_stats()
+
+    def test_records_per_reference_and_vault_latency(self, fake_op, batch_env_file):
+        """Each op read should be timed under its reference and its vault"""
+        from haunt_secrets import get_secrets, stats
+
+        fake_op({
+            "op://vault1/item1/field1": "value-1",
+            "op://vault2/item2/field2": "value-2",
+        })
+
+        get_secrets(batch_env_file)
+        result = stats()
+
+        assert set(result["fetch"]["references"]) == {"op://vault1/item1/field1", "op://vault2/item2/field2"}
+        assert result["fetch"]["vaults"]["op://vault1"]["count"] == 2
+        assert result["subprocess"] == {"op read": 3}
+        assert result["parse"]["files_read"] == 1
+
+    def test_counts_batch_spawns(self, fake_op, batch_env_file):
+        """Batch mode should record one op inject call"""
+        from haunt_secrets import get_secrets, stats
+
+        fake_op({
+            "op://vault1/item1/field1": "value-1",
+            "op://vault2/item2/field2": "value-2",
+        })
+
+        get_secrets(batch_env_file, batch=True)
+        result = stats()
+
+        assert result["subprocess"] == {"op inject": 1}
+        assert result["fetch"]["batches"]["op inject"]["count"] == 1
+
+    def test_profile_prints_breakdown_without_values(self, fake_op, batch_env_file, capsys):
+        """--profile should print vaults and references to stderr, never values"""
+        from haunt_secrets import main
+
+        fake_op({
+            "op://vault1/item1/field1": "value-1",
+            "op://vault2/item2/field2": "value-2",
+        })
+
+        assert main(["--profile", batch_env_file]) == 0
+        captured = capsys.readouterr()
+
+        assert "op://vault1" in captured.err
+        assert "op://vault2/item2/field2" in captured.err
+        assert "op processes: op read=3" in captured.err
+        assert "value-1" not in captured.err + captured.out
+        assert "value-2" not in captured.err + captured.out
+
+    def test_json_output(self, fake_op, batch_env_file, capsys):
+        """--json should print stats() as JSON on stdout"""
+        import json
+        from haunt_secrets import main
+
+        fake_op({
+            "op://vault1/item1/field1": "value-1",
+            "op://vault2/item2/field2": "value-2",
+        })
+
+        assert main(["--json", "--batch", batch_env_file]) == 0
+        data = json.loads(capsys.readouterr().out)
+
+        assert data["subprocess"] == {"op inject": 1}
+
+    def test_exit_codes_match_bash_wrapper(self, monkeypatch, tmp_path, batch_env_file, capsys):
+        """Missing file should exit 3, missing token 1"""
+        from haunt_secrets import main
+
+        assert main([str(tmp_path / "missing.env")]) == 3
+
+        monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN", raising=False)
+        assert main([batch_env_file]) == 1